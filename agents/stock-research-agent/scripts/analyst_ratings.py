@@ -17,11 +17,8 @@ import sys
 from datetime import datetime
 from typing import Optional
 
-try:
-    import yfinance as yf
-except ImportError:
-    print("Error: yfinance not installed. Run: pip install yfinance")
-    sys.exit(1)
+from response_cache import add_cache_arguments, apply_cache_arguments
+from ticker_snapshot import get_snapshot
 
 try:
     import pandas as pd
@@ -40,8 +37,8 @@ def get_analyst_recommendations(ticker: str) -> dict:
     Returns:
         Dictionary with analyst data
     """
-    stock = yf.Ticker(ticker)
-    info = stock.info
+    snap = get_snapshot(ticker)
+    info = snap.info
 
     result = {
         "ticker": ticker,
@@ -68,7 +65,7 @@ def get_analyst_recommendations(ticker: str) -> dict:
 
     # Get recent analyst ratings
     try:
-        recommendations = stock.recommendations
+        recommendations = snap.recommendations
         if recommendations is not None and not recommendations.empty:
             # Get last 10 ratings
             recent = recommendations.tail(10)
@@ -88,7 +85,7 @@ def get_analyst_recommendations(ticker: str) -> dict:
 
     # Get rating trend
     try:
-        trend = stock.recommendations_summary
+        trend = snap.recommendations_summary
         if trend is not None and not trend.empty:
             # Convert to dict
             for col in trend.columns:
@@ -112,8 +109,8 @@ def get_earnings_estimates(ticker: str) -> dict:
     Returns:
         Dictionary with earnings data
     """
-    stock = yf.Ticker(ticker)
-    info = stock.info
+    snap = get_snapshot(ticker)
+    info = snap.info
 
     result = {
         "current_eps": info.get("trailingEps"),
@@ -127,7 +124,7 @@ def get_earnings_estimates(ticker: str) -> dict:
 
     # Get earnings estimates
     try:
-        earnings = stock.earnings_dates
+        earnings = snap.earnings_dates
         if earnings is not None and not earnings.empty:
             for idx, row in earnings.head(4).iterrows():
                 est = {
@@ -289,7 +286,10 @@ def main():
     parser.add_argument("--output", choices=["json", "markdown"], default="markdown",
                         help="Output format")
 
+    add_cache_arguments(parser)
+
     args = parser.parse_args()
+    apply_cache_arguments(args)
 
     ticker = args.ticker.upper()
 
@@ -22,12 +22,8 @@ from pathlib import Path
 from fetch_stock_data import fetch_stock_data, to_markdown as data_to_markdown
 from dcf_model import fetch_inputs_from_ticker, calculate_dcf, format_result as dcf_to_markdown
 from compare_stocks import generate_comparison
-
-try:
-    import yfinance as yf
-except ImportError:
-    print("Error: yfinance not installed. Run: pip install yfinance")
-    sys.exit(1)
+from response_cache import add_cache_arguments, apply_cache_arguments
+from ticker_snapshot import get_snapshot
 
 
 def run_full_analysis(ticker: str, compare_ticker: str = None, output_dir: str = None) -> str:
@@ -53,9 +49,8 @@ def run_full_analysis(ticker: str, compare_ticker: str = None, output_dir: str =
     # Phase 2: DCF Valuation
     print(f"[2/4] Running DCF model...", file=sys.stderr)
     try:
-        # Get current price
-        stock = yf.Ticker(ticker)
-        current_price = stock.info.get('currentPrice') or stock.info.get('regularMarketPrice')
+        # Get current price (shared snapshot, no extra round trip)
+        current_price = get_snapshot(ticker).current_price
 
         # Run DCF
         inputs = fetch_inputs_from_ticker(ticker)
@@ -196,7 +191,10 @@ def main():
     parser.add_argument("--compare", help="Second ticker to compare against")
     parser.add_argument("--output-dir", help="Directory to save report")
 
+    add_cache_arguments(parser)
+
     args = parser.parse_args()
+    apply_cache_arguments(args)
 
     report = run_full_analysis(args.ticker, args.compare, args.output_dir)
     print(report)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+News Categorization Benchmark
+Times the compiled news categorizer against the original keyword loops,
+and batch sentiment scoring.
+
+The fixture is a deterministic set of synthetic headlines built from the
+category keywords (with inflections) and filler words, or a file with one
+headline per line.
+
+Usage:
+    python benchmark_news.py [--count 100000] [--repeat 3] [--fixture FILE]
+
+Examples:
+    python benchmark_news.py
+    python benchmark_news.py --count 20000 --output json
+    python benchmark_news.py --fixture headlines.txt
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+from datetime import datetime
+from typing import List
+
+from news_sentiment import score_titles
+from yahoo_news import NEWS_KEYWORDS, WORD_SEPARATORS, NewsCategorizer, categorize_news
+
+FILLER = ["acushnet", "golf", "apple", "microsoft", "ceo", "says", "after", "report", "deal",
+          "china", "tariffs", "season", "outlook", "weak", "strong", "demand", "steps", "ahead",
+          "week", "investors", "q3", "fiscal", "breaking", "update", "sales", "plan", "europe",
+          "news", "holdings", "mission"]
+INFLECTED = ["beats", "missed", "upgrades", "downgraded", "launches", "announced", "rallies",
+             "surging", "drops", "holds", "selling", "released", "stocks", "markets",
+             "quarterly", "profitability", "rallied", "dropped", "announcement"]
+
+
+def make_headlines(count: int, seed: int = 42) -> List[str]:
+    """Deterministic synthetic headlines (roughly one in five matches nothing)."""
+    rng = random.Random(seed)
+    keywords = [kw for kws in NEWS_KEYWORDS.values() for kw in kws] + INFLECTED
+    headlines = []
+    for _ in range(count):
+        words = rng.choices(FILLER, k=rng.randint(5, 12))
+        for _ in range(rng.choice([0, 1, 1, 2, 3])):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(keywords))
+        headlines.append(" ".join(words).capitalize())
+    return headlines
+
+
+def legacy_categorize(news: list) -> dict:
+    """The original implementation: substring checks per title, first category wins."""
+    categories = {"earnings": [], "analyst": [], "product": [], "market": [], "other": []}
+
+    for item in news:
+        title_lower = item.get("title", "").lower()
+        categorized = False
+
+        for category, kws in NEWS_KEYWORDS.items():
+            if any(kw in title_lower for kw in kws):
+                categories[category].append(item)
+                categorized = True
+                break
+
+        if not categorized:
+            categories["other"].append(item)
+
+    return categories
+
+
+def legacy_labels(titles: List[str]) -> List[List[str]]:
+    """The original substring checks, without stopping at the first category."""
+    results = []
+    for title in titles:
+        title_lower = title.lower()
+        results.append([category for category, kws in NEWS_KEYWORDS.items()
+                        if any(kw in title_lower for kw in kws)])
+    return results
+
+
+def legacy_whole_word_labels(titles: List[str]) -> List[List[str]]:
+    """The original substring checks, counting only matches of a whole word."""
+    patterns = {category: re.compile("|".join(rf"(?<!\w){re.escape(kw)}(?!\w)" for kw in kws))
+                for category, kws in NEWS_KEYWORDS.items()}
+    results = []
+    for title in titles:
+        text = title.lower().translate(WORD_SEPARATORS)
+        results.append([category for category, pattern in patterns.items() if pattern.search(text)])
+    return results
+
+
+def compare_primary(headlines: List[str], labels: List[List[str]]) -> dict:
+    """
+    Share of headlines by how their primary category compares with legacy.
+
+    same: identical primary category
+    inside_word: differs only because legacy fired inside a word ("eps" in
+        "steps", "new" in "news")
+    inflection: differs because a KEYWORD_FORMS form matched where legacy
+        matched nothing or a lower category ("surging")
+    unexplained: anything else (should be 0)
+    """
+    counts = {"same": 0, "inside_word": 0, "inflection": 0, "unexplained": 0}
+    legacy = legacy_labels(headlines)
+    anchored = legacy_whole_word_labels(headlines)
+    for old, old_anchored, new in zip(legacy, anchored, labels):
+        primary = new[0] if new else "other"
+        if primary == (old[0] if old else "other"):
+            counts["same"] += 1
+        elif primary == (old_anchored[0] if old_anchored else "other"):
+            counts["inside_word"] += 1
+        elif new and new[0] not in old_anchored:
+            counts["inflection"] += 1
+        else:
+            counts["unexplained"] += 1
+    total = len(headlines) or 1
+    return {key: value / total for key, value in counts.items()}
+
+
+def _best_time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(headlines: List[str], repeat: int = 3) -> dict:
+    """Time both implementations and compare their primary categories."""
+    news = [{"title": title} for title in headlines]
+
+    start = time.perf_counter()
+    categorizer = NewsCategorizer()
+    compile_time = time.perf_counter() - start
+
+    timings = {
+        "legacy": _best_time(lambda: legacy_categorize(news), repeat),
+        "compiled": _best_time(lambda: categorize_news(news), repeat),
+        "legacy_multilabel": _best_time(lambda: legacy_labels(headlines), repeat),
+        "compiled_multilabel": _best_time(lambda: categorizer.labels_batch(headlines), repeat),
+        "sentiment": _best_time(lambda: score_titles(headlines), repeat),
+    }
+
+    labels = categorizer.labels_batch(headlines)
+    primary = compare_primary(headlines, labels)
+
+    return {
+        "headlines": len(headlines),
+        "repeat": repeat,
+        "compile_seconds": compile_time,
+        "seconds": timings,
+        "speedup": timings["legacy"] / timings["compiled"] if timings["compiled"] else None,
+        "multilabel_speedup": (timings["legacy_multilabel"] / timings["compiled_multilabel"]
+                               if timings["compiled_multilabel"] else None),
+        "primary_agreement": primary["same"],
+        "primary_comparison": primary,
+        "multi_label_share": sum(len(l) > 1 for l in labels) / len(labels) if labels else 0.0,
+    }
+
+
+def format_benchmark_markdown(result: dict) -> str:
+    """Format benchmark results as markdown."""
+    lines = []
+    lines.append("# News Categorization Benchmark")
+    lines.append(f"\n**Generated:** {datetime.now().isoformat()}")
+    lines.append(f"\n**Headlines:** {result['headlines']:,} (best of {result['repeat']})")
+    lines.append("")
+    lines.append("| Implementation | Seconds | µs/headline | Headlines/s |")
+    lines.append("|----------------|---------|-------------|-------------|")
+    for name, seconds in result["seconds"].items():
+        per = seconds / result["headlines"] * 1e6 if result["headlines"] else 0
+        rate = result["headlines"] / seconds if seconds else 0
+        lines.append(f"| {name} | {seconds:.3f} | {per:.2f} | {rate:,.0f} |")
+    lines.append("")
+    lines.append(f"**Speedup (categorize_news):** {result['speedup']:.1f}x")
+    lines.append(f"**Speedup (multi-label):** {result['multilabel_speedup']:.1f}x")
+    primary = result["primary_comparison"]
+    lines.append(f"**Same primary category as legacy:** {primary['same']:.1%}")
+    lines.append(f"**Same, apart from legacy matches inside words** (\"eps\" in \"steps\", \"new\" in \"news\"): "
+                 f"{primary['same'] + primary['inside_word']:.1%}")
+    lines.append(f"**Inflections legacy misses** (\"surging\", \"rallies\"): {primary['inflection']:.1%}")
+    lines.append(f"**Unexplained differences:** {primary['unexplained']:.1%}")
+    lines.append(f"**Headlines with more than one label:** {result['multi_label_share']:.1%}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark news categorization")
+    parser.add_argument("--count", type=int, default=100000,
+                        help="Synthetic headlines to generate (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per implementation, best is reported (default: 3)")
+    parser.add_argument("--fixture", help="File with one headline per line instead of synthetic ones")
+    parser.add_argument("--output", choices=["json", "markdown"], default="markdown",
+                        help="Output format")
+
+    args = parser.parse_args()
+
+    if args.fixture:
+        with open(args.fixture) as f:
+            headlines = [line.strip() for line in f if line.strip()]
+    else:
+        headlines = make_headlines(args.count)
+
+    result = run_benchmark(headlines, args.repeat)
+
+    if args.output == "json":
+        print(json.dumps(result, indent=2))
+    else:
+        print(format_benchmark_markdown(result))
+
+
+if __name__ == "__main__":
+    main()
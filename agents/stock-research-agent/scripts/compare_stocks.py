@@ -3,30 +3,55 @@
 Stock Comparison Tool
 Compares two or more stocks side by side.
 
+All metrics are loaded into one (metrics, tickers) matrix and scored in
+array operations: a direction-adjusted percentile rank and z-score per
+metric, wins, and a composite score (mean percentile) with per-section
+subscores. Up to 6 tickers are shown side by side; a larger set (a whole
+sector) is ranked by composite score in pages, followed by the side-by-side
+detail for the best of the page.
+
+With --local-prices, the 52-week range and beta come from the local price
+history (risk_metrics.py) instead of Yahoo's info fields, and 1-year return,
+volatility and drawdown rows are added.
+
 Usage:
-    python compare_stocks.py TICKER1 TICKER2 [TICKER3 ...]
+    python compare_stocks.py TICKER1 TICKER2 [TICKER3 ...] [--max-workers N] [--local-prices]
+                             [--page N] [--page-size 25] [--output json|markdown]
 
 Examples:
     python compare_stocks.py GOLF MODG
     python compare_stocks.py AAPL MSFT GOOGL
+    python compare_stocks.py GOLF MODG --local-prices
+    python compare_stocks.py $(cat sector.txt) --page 2
 """
 
 import argparse
+import json
 import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 
 try:
-    import yfinance as yf
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    print("Error: yfinance not installed. Run: pip install yfinance")
-    sys.exit(1)
+    NUMPY_AVAILABLE = False
+
+from response_cache import add_cache_arguments, apply_cache_arguments
+from ticker_snapshot import DEFAULT_MAX_WORKERS, get_snapshot, map_tickers
+from xbrl_facts import comparison_metrics, load_fundamentals
 
 
 def fetch_comparison_data(ticker: str) -> dict:
-    """Fetch key comparison metrics for a ticker."""
-    stock = yf.Ticker(ticker)
-    info = stock.info
+    """
+    Fetch key comparison metrics for a ticker.
+
+    Fundamentals come from the local XBRL store when the company has been
+    ingested (xbrl_facts.py); market data and anything missing from Yahoo.
+    """
+    info = get_snapshot(ticker).info
 
-    return {
+    data = {
         "ticker": ticker,
         "name": info.get("shortName", info.get("longName", ticker)),
         "price": info.get("currentPrice") or info.get("regularMarketPrice", "N/A"),
@@ -57,6 +82,54 @@ def fetch_comparison_data(ticker: str) -> dict:
         "shares_outstanding": info.get("sharesOutstanding")
     }
 
+    table = load_fundamentals(ticker)
+    if table is not None:
+        data.update({k: v for k, v in comparison_metrics(table).items() if v is not None})
+
+    return data
+
+
+def fetch_comparison_data_batch(tickers: list, max_workers: int = DEFAULT_MAX_WORKERS,
+                                local_prices: bool = False) -> tuple:
+    """
+    Fetch comparison metrics for many tickers concurrently.
+
+    With local_prices, the 52-week range and beta are replaced (and 1-year
+    return, volatility and drawdown added) from the local price history,
+    computed for all tickers in one pass. Tickers that have not been synced,
+    and values the local history can't provide (beta without the benchmark
+    synced, too short a history), keep Yahoo's values.
+
+    Returns:
+        (data, errors): data in input order for tickers that succeeded, and
+        (ticker, exception) pairs for those that failed
+    """
+    data = []
+    errors = []
+    for ticker, result, error in map_tickers(fetch_comparison_data,
+                                             [t.upper() for t in tickers], max_workers):
+        if error is None:
+            data.append(result)
+        else:
+            errors.append((ticker, error))
+    if local_prices and data:
+        apply_local_prices(data)
+    return data, errors
+
+
+def apply_local_prices(data: list):
+    """Overlay price-history metrics (risk_metrics.py) on comparison rows."""
+    from risk_metrics import LOCAL_RISK_KEYS, compute_risk_metrics
+
+    risk = compute_risk_metrics([d["ticker"] for d in data])
+    for d in data:
+        metrics = risk.get(d["ticker"])
+        if metrics is None:
+            print(f"Warning: {d['ticker']}: no local price history, using Yahoo price ranges",
+                  file=sys.stderr)
+            continue
+        d.update({key: metrics[key] for key in LOCAL_RISK_KEYS if metrics[key] is not None})
+
 
 def format_value(val, format_type="number"):
     """Format a value for display."""
@@ -86,149 +159,352 @@ def format_value(val, format_type="number"):
         return str(val)
 
 
-def find_winner(values: list, higher_is_better: bool = True) -> int:
-    """Find the index of the winning value."""
-    valid_values = []
-    for i, v in enumerate(values):
-        try:
-            if v is not None and v != "N/A":
-                valid_values.append((i, float(v)))
-        except:
-            pass
-
-    if not valid_values:
-        return -1
-
-    if higher_is_better:
-        winner = max(valid_values, key=lambda x: x[1])
-    else:
-        winner = min(valid_values, key=lambda x: x[1])
-
-    return winner[0]
+# Metrics compared, grouped under section headers (label, None, None, None).
+# higher_is_better None means shown but not scored.
+COMPARISON_METRICS = [
+    ("**PRICE**", None, None, None),
+    ("Current Price", "price", "price", True),
+    ("52-Week High", "52_week_high", "price", None),
+    ("52-Week Low", "52_week_low", "price", None),
+    ("**VALUATION**", None, None, None),
+    ("Market Cap", "market_cap", "number", True),
+    ("Enterprise Value", "enterprise_value", "number", None),
+    ("P/E (TTM)", "pe_trailing", "ratio", False),
+    ("P/E (Forward)", "pe_forward", "ratio", False),
+    ("EV/EBITDA", "ev_ebitda", "ratio", False),
+    ("EV/Revenue", "ev_revenue", "ratio", False),
+    ("P/B", "pb", "ratio", False),
+    ("**FINANCIALS**", None, None, None),
+    ("Revenue", "revenue", "number", True),
+    ("Revenue Growth", "revenue_growth", "percent", True),
+    ("Gross Margin", "gross_margin", "percent", True),
+    ("Operating Margin", "operating_margin", "percent", True),
+    ("Profit Margin", "profit_margin", "percent", True),
+    ("EBITDA", "ebitda", "number", True),
+    ("Net Income", "net_income", "number", True),
+    ("Free Cash Flow", "fcf", "number", True),
+    ("**RETURNS**", None, None, None),
+    ("ROE", "roe", "percent", True),
+    ("ROA", "roa", "percent", True),
+    ("**BALANCE SHEET**", None, None, None),
+    ("Debt/Equity", "debt_equity", "ratio", False),
+    ("Current Ratio", "current_ratio", "ratio", True),
+    ("**DIVIDENDS**", None, None, None),
+    ("Dividend Yield", "dividend_yield", "percent", True),
+    ("Payout Ratio", "payout_ratio", "percent", False),
+    ("**RISK**", None, None, None),
+    ("Beta", "beta", "default", None),
+]
+
+# Rows added under RISK with --local-prices
+LOCAL_PRICE_METRICS = [
+    ("Return (1Y)", "return_1y", "percent", True),
+    ("Volatility (1Y)", "volatility_1y", "percent", False),
+    ("Max Drawdown (1Y)", "max_drawdown_1y", "percent", True),
+]
+
+MAX_DETAIL_COLUMNS = 6  # tickers shown side by side; larger sets are ranked and paginated
+DEFAULT_PAGE_SIZE = 25
+
+
+@dataclass
+class ComparisonMatrix:
+    """
+    All comparison metrics for a set of tickers as one numeric matrix.
+
+    Scores are per metric and direction-adjusted (1.0 / positive is always
+    better): percentile is the share of other tickers beaten (ties count
+    half), zscore the distance from the mean in standard deviations.
+    Missing values are NaN and are skipped by every score; a metric with
+    fewer than two values is not scored.
+    """
+    tickers: List[str]
+    names: List[str]
+    metrics: List[tuple]           # (label, key, fmt, higher_is_better, section)
+    values: "np.ndarray"           # (metrics, tickers)
+    percentiles: "np.ndarray"      # (metrics, tickers), NaN for unscored metrics
+    zscores: "np.ndarray"          # (metrics, tickers), NaN for unscored metrics
+    composite: "np.ndarray"        # mean percentile over scored metrics, 0-100
+    wins: "np.ndarray"             # metrics on which each ticker is best
+    coverage: "np.ndarray"         # scored metrics with data, per ticker
+    section_scores: Dict[str, "np.ndarray"]  # section -> mean percentile, 0-100
+
+    def ranking(self) -> "np.ndarray":
+        """Ticker indices by composite score, best first (no data last)."""
+        return np.argsort(np.where(np.isnan(self.composite), np.inf, -self.composite), kind="stable")
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value) if value is not None else np.nan
+    except (TypeError, ValueError):
+        return np.nan  # "N/A"
 
 
-def generate_comparison(tickers: list) -> str:
-    """Generate a comparison report."""
-    # Fetch data for all tickers
-    data = []
-    for ticker in tickers:
-        try:
-            d = fetch_comparison_data(ticker.upper())
-            data.append(d)
-        except Exception as e:
-            print(f"Warning: Could not fetch data for {ticker}: {e}", file=sys.stderr)
+def build_comparison_matrix(data: list, metrics: list = None) -> ComparisonMatrix:
+    """
+    Load comparison rows into one matrix and score every metric at once.
 
-    if len(data) < 2:
-        return "Error: Need at least 2 valid tickers to compare"
+    Args:
+        data: fetch_comparison_data rows
+        metrics: Metric table (default COMPARISON_METRICS)
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
 
+    rows = []
+    section = None
+    for label, key, fmt, higher_is_better in metrics or COMPARISON_METRICS:
+        if key is None:
+            section = label.strip("*").title()
+        else:
+            rows.append((label, key, fmt, higher_is_better, section))
+
+    values = np.array([[_to_float(d.get(key)) for d in data] for _, key, _, _, _ in rows],
+                      dtype=np.float64).reshape(len(rows), len(data))
+    direction = np.array([{True: 1.0, False: -1.0}.get(r[3], np.nan) for r in rows])
+    scored = ~np.isnan(direction)
+    # Direction-adjusted values: larger is always better; NaN for unscored rows
+    adjusted = values * direction[:, None]
+    valid = np.isfinite(adjusted)
+    count = valid.sum(axis=1)
+
+    # Percentile: (worse + ties / 2) / (others), per metric over its valid tickers
+    percentiles = np.full(values.shape, np.nan)
+    for i in np.flatnonzero(count > 1):
+        row = np.sort(adjusted[i, valid[i]])
+        below = np.searchsorted(row, adjusted[i, valid[i]], side="left")
+        through = np.searchsorted(row, adjusted[i, valid[i]], side="right")
+        percentiles[i, valid[i]] = (below + through - 1) / (2 * (count[i] - 1))
+
+    filled = np.where(valid, adjusted, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = filled.sum(axis=1) / count
+        std = np.sqrt(np.where(valid, (adjusted - mean[:, None]) ** 2, 0.0).sum(axis=1) / count)
+        zscores = np.where(valid, (adjusted - mean[:, None]) / std[:, None], np.nan)
+    zscores[~np.isfinite(zscores) & valid] = 0.0  # every ticker equal
+
+    # Wins: first ticker with the best value, as the side-by-side table marks
+    # it; a metric only one ticker reports is not scored
+    has_data = scored & (count > 1)
+    best = np.argmax(np.where(valid, adjusted, -np.inf)[has_data], axis=1)
+    wins = np.bincount(best, minlength=len(data))
+
+    scored_valid = np.isfinite(percentiles)
+    coverage = scored_valid.sum(axis=0)
+
+    def mean_percentile(mask):
+        total = np.where(scored_valid & mask[:, None], percentiles, 0.0).sum(axis=0)
+        n = (scored_valid & mask[:, None]).sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(n > 0, 100 * total / n, np.nan)
+
+    sections = np.array([r[4] for r in rows], dtype=object)
+    section_scores = {s: mean_percentile(sections == s)
+                      for s in dict.fromkeys(r[4] for r, ok in zip(rows, scored) if ok)}
+
+    return ComparisonMatrix(
+        tickers=[d["ticker"] for d in data],
+        names=[str(d.get("name") or d["ticker"]) for d in data],
+        metrics=rows,
+        values=values,
+        percentiles=percentiles,
+        zscores=zscores,
+        composite=mean_percentile(scored),
+        wins=wins,
+        coverage=coverage,
+        section_scores=section_scores,
+    )
+
+
+def _score(value) -> str:
+    return f"{value:.0f}" if np.isfinite(value) else "N/A"
+
+
+def format_detail_markdown(matrix: ComparisonMatrix, columns: List[int]) -> List[str]:
+    """Side-by-side metric table for the given ticker indices (winners marked)."""
     lines = []
-    lines.append(f"# Stock Comparison: {' vs '.join([d['ticker'] for d in data])}")
-    lines.append("")
-
-    # Header with names
     header = "| Metric |"
     separator = "|--------|"
-    for d in data:
-        header += f" **{d['ticker']}** |"
+    for j in columns:
+        header += f" **{matrix.tickers[j]}** |"
         separator += "--------|"
     lines.append(header)
     lines.append(separator)
 
     # Company names
     row = "| Company |"
-    for d in data:
-        name = d['name'][:20] + "..." if len(str(d['name'])) > 20 else d['name']
-        row += f" {name} |"
+    for j in columns:
+        name = matrix.names[j]
+        row += f" {name[:20] + '...' if len(name) > 20 else name} |"
     lines.append(row)
 
-    # Define metrics to compare
-    metrics = [
-        ("**PRICE**", None, None, None),
-        ("Current Price", "price", "price", True),
-        ("52-Week High", "52_week_high", "price", None),
-        ("52-Week Low", "52_week_low", "price", None),
-        ("**VALUATION**", None, None, None),
-        ("Market Cap", "market_cap", "number", True),
-        ("Enterprise Value", "enterprise_value", "number", None),
-        ("P/E (TTM)", "pe_trailing", "ratio", False),
-        ("P/E (Forward)", "pe_forward", "ratio", False),
-        ("EV/EBITDA", "ev_ebitda", "ratio", False),
-        ("EV/Revenue", "ev_revenue", "ratio", False),
-        ("P/B", "pb", "ratio", False),
-        ("**FINANCIALS**", None, None, None),
-        ("Revenue", "revenue", "number", True),
-        ("Revenue Growth", "revenue_growth", "percent", True),
-        ("Gross Margin", "gross_margin", "percent", True),
-        ("Operating Margin", "operating_margin", "percent", True),
-        ("Profit Margin", "profit_margin", "percent", True),
-        ("EBITDA", "ebitda", "number", True),
-        ("Net Income", "net_income", "number", True),
-        ("Free Cash Flow", "fcf", "number", True),
-        ("**RETURNS**", None, None, None),
-        ("ROE", "roe", "percent", True),
-        ("ROA", "roa", "percent", True),
-        ("**BALANCE SHEET**", None, None, None),
-        ("Debt/Equity", "debt_equity", "ratio", False),
-        ("Current Ratio", "current_ratio", "ratio", True),
-        ("**DIVIDENDS**", None, None, None),
-        ("Dividend Yield", "dividend_yield", "percent", True),
-        ("Payout Ratio", "payout_ratio", "percent", False),
-        ("**RISK**", None, None, None),
-        ("Beta", "beta", "default", None),
-    ]
-
-    for label, key, fmt, higher_is_better in metrics:
-        if key is None:
-            # Section header
-            row = f"| {label} |" + " |" * len(data)
-            lines.append(row)
-            continue
-
-        values = [d.get(key) for d in data]
-        winner_idx = find_winner(values, higher_is_better) if higher_is_better is not None else -1
+    # Best value among the shown tickers
+    shown = np.where(np.isfinite(matrix.percentiles[:, columns]), matrix.percentiles[:, columns], -np.inf)
+    winners = np.where(np.isfinite(matrix.percentiles[:, columns]).any(axis=1), np.argmax(shown, axis=1), -1)
 
+    section = None
+    for i, (label, key, fmt, higher_is_better, metric_section) in enumerate(matrix.metrics):
+        if metric_section != section:
+            section = metric_section
+            lines.append(f"| **{section.upper()}** |" + " |" * len(columns))
         row = f"| {label} |"
-        for i, val in enumerate(values):
-            formatted = format_value(val, fmt)
-            if i == winner_idx and higher_is_better is not None:
+        for c, j in enumerate(columns):
+            formatted = format_value(matrix.values[i, j] if np.isfinite(matrix.values[i, j]) else None, fmt)
+            if c == winners[i] and len(columns) > 1:
                 formatted = f"**{formatted}** ✓"
             row += f" {formatted} |"
         lines.append(row)
+    return lines
+
+
+def format_comparison_markdown(matrix: ComparisonMatrix, page: int = 1,
+                               page_size: int = DEFAULT_PAGE_SIZE) -> str:
+    """
+    Format a comparison.
+
+    Up to MAX_DETAIL_COLUMNS tickers are shown side by side with a score
+    summary. Larger sets get a ranking table (composite and section scores,
+    one row per ticker, paginated) followed by the side-by-side table for
+    the best MAX_DETAIL_COLUMNS tickers on the page.
+    """
+    if page_size < 1:
+        raise ValueError(f"page_size must be at least 1, got {page_size}")
+    n = len(matrix.tickers)
+    lines = []
+    if n <= MAX_DETAIL_COLUMNS:
+        lines.append(f"# Stock Comparison: {' vs '.join(matrix.tickers)}")
+        lines.append("")
+        lines.extend(format_detail_markdown(matrix, list(range(n))))
+        ranked = matrix.ranking()
+        page_rows = ranked
+    else:
+        pages = -(-n // page_size)
+        page = min(max(page, 1), pages)
+        ranked = matrix.ranking()
+        page_rows = ranked[(page - 1) * page_size:page * page_size]
+        lines.append(f"# Stock Comparison: {n} stocks")
+        lines.append("")
+        lines.append(f"Ranked by composite score (mean percentile over {int(matrix.coverage.max())} "
+                     f"scored metrics, 100 = best on all). Page {page} of {pages}.")
 
-    # Summary
     lines.append("")
-    lines.append("## Summary")
+    lines.append("## Summary" if n <= MAX_DETAIL_COLUMNS else "## Ranking")
     lines.append("")
+    sections = list(matrix.section_scores)
+    lines.append("| # | Ticker | Company | Score | Wins | " + " | ".join(sections) + " | Metrics |")
+    lines.append("|---|--------|---------|-------|------|" + "".join("------|" for _ in sections) + "---------|")
+    position = {int(j): rank for rank, j in enumerate(ranked, 1)}
+    for j in page_rows:
+        name = matrix.names[j][:20].replace("|", "\\|")
+        scores = " | ".join(_score(matrix.section_scores[s][j]) for s in sections)
+        lines.append(f"| {position[int(j)]} | {matrix.tickers[j]} | {name} | {_score(matrix.composite[j])} | "
+                     f"{matrix.wins[j]} | {scores} | {matrix.coverage[j]} |")
+
+    if n > MAX_DETAIL_COLUMNS:
+        if len(page_rows) < n:
+            lines.append("")
+            lines.append(f"Showing ranks {position[int(page_rows[0])]}-{position[int(page_rows[-1])]} "
+                         f"of {n} (--page N, --page-size N).")
+        detail = [int(j) for j in page_rows[:MAX_DETAIL_COLUMNS]]
+        lines.append("")
+        lines.append(f"## Detail: {', '.join(matrix.tickers[j] for j in detail)}")
+        lines.append("")
+        lines.extend(format_detail_markdown(matrix, detail))
 
-    # Count wins
-    wins = {d['ticker']: 0 for d in data}
-    for label, key, fmt, higher_is_better in metrics:
-        if key is None or higher_is_better is None:
-            continue
-        values = [d.get(key) for d in data]
-        winner_idx = find_winner(values, higher_is_better)
-        if winner_idx >= 0:
-            wins[data[winner_idx]['ticker']] += 1
+    return "\n".join(lines)
 
-    lines.append("| Ticker | Wins |")
-    lines.append("|--------|------|")
-    for ticker, win_count in sorted(wins.items(), key=lambda x: x[1], reverse=True):
-        lines.append(f"| {ticker} | {win_count} |")
 
-    return "\n".join(lines)
+def comparison_to_dict(matrix: ComparisonMatrix) -> dict:
+    """JSON-friendly comparison: values and scores per ticker, in ranking order."""
+    def clean(v):
+        return round(float(v), 4) if np.isfinite(v) else None
+
+    rows = []
+    for rank, j in enumerate(matrix.ranking(), 1):
+        rows.append({
+            "rank": rank,
+            "ticker": matrix.tickers[j],
+            "name": matrix.names[j],
+            "composite": clean(matrix.composite[j]),
+            "wins": int(matrix.wins[j]),
+            "coverage": int(matrix.coverage[j]),
+            "sections": {s: clean(v[j]) for s, v in matrix.section_scores.items()},
+            "metrics": {key: {"value": clean(matrix.values[i, j]),
+                              "percentile": clean(matrix.percentiles[i, j]),
+                              "zscore": clean(matrix.zscores[i, j])}
+                        for i, (_, key, _, _, _) in enumerate(matrix.metrics)},
+        })
+    return {"tickers": len(matrix.tickers), "rows": rows}
+
+
+def compare(tickers: list, max_workers: int = DEFAULT_MAX_WORKERS,
+            local_prices: bool = False) -> Optional[ComparisonMatrix]:
+    """Fetch and score tickers; None if fewer than 2 could be fetched."""
+    # Fetch data for all tickers concurrently
+    data, errors = fetch_comparison_data_batch(tickers, max_workers, local_prices)
+    for ticker, e in errors:
+        print(f"Warning: Could not fetch data for {ticker}: {e}", file=sys.stderr)
+
+    if len(data) < 2:
+        return None
+    metrics = COMPARISON_METRICS + (LOCAL_PRICE_METRICS if local_prices else [])
+    return build_comparison_matrix(data, metrics)
+
+
+def generate_comparison(tickers: list, max_workers: int = DEFAULT_MAX_WORKERS,
+                        local_prices: bool = False, page: int = 1,
+                        page_size: int = DEFAULT_PAGE_SIZE) -> str:
+    """Generate a comparison report."""
+    matrix = compare(tickers, max_workers, local_prices)
+    if matrix is None:
+        return "Error: Need at least 2 valid tickers to compare"
+    return format_comparison_markdown(matrix, page, page_size)
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for --page/--page-size."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be a whole number, got {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 
 def main():
     parser = argparse.ArgumentParser(description="Compare stocks side by side")
     parser.add_argument("tickers", nargs="+", help="Stock tickers to compare")
+    parser.add_argument("--max-workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f"Maximum concurrent fetches (default: {DEFAULT_MAX_WORKERS})")
+    parser.add_argument("--local-prices", action="store_true",
+                        help="52-week range, beta and risk rows from local price history")
+    parser.add_argument("--page", type=_positive_int, default=1,
+                        help=f"Ranking page for more than {MAX_DETAIL_COLUMNS} tickers (default: 1)")
+    parser.add_argument("--page-size", type=_positive_int, default=DEFAULT_PAGE_SIZE,
+                        help=f"Tickers per ranking page (default: {DEFAULT_PAGE_SIZE})")
+    parser.add_argument("--output", choices=["json", "markdown"], default="markdown",
+                        help="Output format")
+
+    add_cache_arguments(parser)
 
     args = parser.parse_args()
+    apply_cache_arguments(args)
 
     if len(args.tickers) < 2:
         print("Error: Need at least 2 tickers to compare")
         sys.exit(1)
 
-    print(generate_comparison(args.tickers))
+    if args.output == "json":
+        matrix = compare(args.tickers, args.max_workers, args.local_prices)
+        if matrix is None:
+            print("Error: Need at least 2 valid tickers to compare")
+            sys.exit(1)
+        print(json.dumps(comparison_to_dict(matrix), indent=2))
+    else:
+        print(generate_comparison(args.tickers, args.max_workers, args.local_prices,
+                                  args.page, args.page_size))
 
 
 if __name__ == "__main__":
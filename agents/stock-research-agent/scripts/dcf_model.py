@@ -6,24 +6,37 @@ Calculates intrinsic value using Discounted Cash Flow analysis.
 Usage:
     python dcf_model.py --fcf BASE_FCF --growth RATE --terminal RATE --wacc RATE --shares SHARES
     python dcf_model.py --ticker TICKER  # Auto-fetch data from yfinance
+    python dcf_model.py --tickers T1 T2 ...  # Batch-value many tickers
+    python dcf_model.py --ticker TICKER --simulate N [--seed S]  # Monte Carlo
+    python dcf_model.py --ticker TICKER --reverse growth|wacc  # Implied by price
 
 Examples:
     python dcf_model.py --fcf 170 --growth 0.04 --terminal 0.025 --wacc 0.085 --shares 65
     python dcf_model.py --ticker GOLF
     python dcf_model.py --ticker GOLF --wacc 0.09 --terminal 0.02
+    python dcf_model.py --tickers GOLF CALY AMZN
+    python dcf_model.py --ticker GOLF --simulate 100000 --seed 42
+    python dcf_model.py --ticker GOLF --simulate 100000 --wacc-dist uniform:0.08,0.11
+    python dcf_model.py --ticker GOLF --reverse growth
+    python dcf_model.py --tickers GOLF CALY AMZN --reverse wacc
 """
 
 import argparse
 import json
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional
 
 try:
-    import yfinance as yf
-    YFINANCE_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    YFINANCE_AVAILABLE = False
+    NUMPY_AVAILABLE = False
+
+from response_cache import add_cache_arguments, apply_cache_arguments
+from ticker_snapshot import YFINANCE_AVAILABLE, get_snapshot, map_tickers
+from xbrl_facts import load_fundamentals
 
 
 @dataclass
@@ -63,30 +76,33 @@ def calculate_dcf(inputs: DCFInputs) -> DCFResult:
     """
     projected_fcfs = []
     pv_fcfs = []
+    pv_fcf_total = 0.0
+
+    # Discount factors and the PV total are accumulated step by step (rather
+    # than via ** and sum()) so calculate_dcf_batch can match them bit for bit
+    discount_factor = 1.0
 
     # Project FCFs for each year
     current_fcf = inputs.base_fcf
-    for i, growth_rate in enumerate(inputs.growth_rates):
-        year = i + 1
+    for growth_rate in inputs.growth_rates:
         current_fcf = current_fcf * (1 + growth_rate)
         projected_fcfs.append(current_fcf)
 
-        # Discount to present value
-        discount_factor = (1 + inputs.wacc) ** year
+        # Discount to present value: (1 + wacc) ** year
+        discount_factor = discount_factor * (1 + inputs.wacc)
         pv = current_fcf / discount_factor
         pv_fcfs.append(pv)
+        pv_fcf_total = pv_fcf_total + pv
 
     # Terminal Value (Gordon Growth Model)
-    final_year = len(inputs.growth_rates)
     terminal_fcf = projected_fcfs[-1] * (1 + inputs.terminal_growth)
     terminal_value = terminal_fcf / (inputs.wacc - inputs.terminal_growth)
 
-    # Discount terminal value to present
-    terminal_discount_factor = (1 + inputs.wacc) ** final_year
-    pv_terminal = terminal_value / terminal_discount_factor
+    # Discount terminal value to present (final year's discount factor)
+    pv_terminal = terminal_value / discount_factor
 
     # Enterprise Value = PV of FCFs + PV of Terminal Value
-    enterprise_value = sum(pv_fcfs) + pv_terminal
+    enterprise_value = pv_fcf_total + pv_terminal
 
     # Equity Value = Enterprise Value - Net Debt
     equity_value = enterprise_value - inputs.net_debt
@@ -106,77 +122,740 @@ def calculate_dcf(inputs: DCFInputs) -> DCFResult:
     )
 
 
+@dataclass
+class DCFBatchResult:
+    """Vectorized DCF results, one entry per scenario (arrays share a batch shape)"""
+    projected_fcfs: "np.ndarray"  # batch shape + (years,)
+    pv_fcfs: "np.ndarray"  # batch shape + (years,)
+    terminal_value: "np.ndarray"
+    pv_terminal: "np.ndarray"
+    enterprise_value: "np.ndarray"
+    equity_value: "np.ndarray"
+    intrinsic_value_per_share: "np.ndarray"
+
+    def to_result(self, index, inputs: DCFInputs) -> DCFResult:
+        """Materialize one scenario as a scalar DCFResult (for reporting)."""
+        return DCFResult(
+            inputs=inputs,
+            projected_fcfs=self.projected_fcfs[index].tolist(),
+            pv_fcfs=self.pv_fcfs[index].tolist(),
+            terminal_value=float(self.terminal_value[index]),
+            pv_terminal=float(self.pv_terminal[index]),
+            enterprise_value=float(self.enterprise_value[index]),
+            equity_value=float(self.equity_value[index]),
+            intrinsic_value_per_share=float(self.intrinsic_value_per_share[index])
+        )
+
+
+def calculate_dcf_batch(base_fcf, growth_rates, terminal_growth, wacc,
+                        shares_outstanding, net_debt=0.0) -> DCFBatchResult:
+    """
+    Calculate DCF valuations for many scenarios in one broadcast pass.
+
+    Performs exactly the same floating-point operations, in the same order, as
+    calculate_dcf (no ** or sum(), whose numpy/Python implementations round
+    differently), so each scenario matches the scalar result bit for bit.
+    Scenarios with wacc == terminal_growth give inf/nan instead of raising.
+
+    Args:
+        base_fcf: Base FCF per scenario (in millions), scalar or array
+        growth_rates: Growth path, shape (..., years); a 1-D path is shared
+        terminal_growth: Terminal growth rate(s)
+        wacc: Discount rate(s)
+        shares_outstanding: Shares outstanding (in millions)
+        net_debt: Net debt (in millions)
+
+    Returns:
+        DCFBatchResult with arrays broadcast over all inputs
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+
+    growth = np.asarray(growth_rates, dtype=float)
+    if growth.ndim == 0 or growth.shape[-1] == 0:
+        raise ValueError("growth_rates must have at least one projection year")
+    base = np.asarray(base_fcf, dtype=float)
+    tg = np.asarray(terminal_growth, dtype=float)
+    rate = np.asarray(wacc, dtype=float)
+    shares = np.asarray(shares_outstanding, dtype=float)
+    debt = np.asarray(net_debt, dtype=float)
+
+    shape = np.broadcast_shapes(base.shape, growth.shape[:-1], tg.shape,
+                                rate.shape, shares.shape, debt.shape)
+    years = growth.shape[-1]
+    projected_fcfs = np.empty(shape + (years,))
+    pv_fcfs = np.empty(shape + (years,))
+    pv_fcf_total = np.zeros(shape)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Loop over the (few) projection years, vectorized across scenarios
+        current_fcf = np.broadcast_to(base, shape)
+        discount_factor = np.ones(rate.shape)
+        for i in range(years):
+            current_fcf = current_fcf * (1 + growth[..., i])
+            projected_fcfs[..., i] = current_fcf
+            discount_factor = discount_factor * (1 + rate)
+            pv = current_fcf / discount_factor
+            pv_fcfs[..., i] = pv
+            pv_fcf_total = pv_fcf_total + pv
+
+        terminal_fcf = current_fcf * (1 + tg)
+        terminal_value = terminal_fcf / (rate - tg)
+        pv_terminal = terminal_value / discount_factor
+
+        enterprise_value = pv_fcf_total + pv_terminal
+        equity_value = enterprise_value - debt
+        intrinsic_value = equity_value / shares
+
+    return DCFBatchResult(
+        projected_fcfs=projected_fcfs,
+        pv_fcfs=pv_fcfs,
+        terminal_value=np.broadcast_to(terminal_value, shape),
+        pv_terminal=np.broadcast_to(pv_terminal, shape),
+        enterprise_value=np.broadcast_to(enterprise_value, shape),
+        equity_value=np.broadcast_to(equity_value, shape),
+        intrinsic_value_per_share=np.broadcast_to(intrinsic_value, shape)
+    )
+
+
+def calculate_dcf_many(inputs_list: List[DCFInputs]) -> DCFBatchResult:
+    """
+    Value many DCFInputs (e.g. a whole coverage universe) in one batch.
+
+    All inputs must share the same number of projection years.
+    """
+    if not inputs_list:
+        raise ValueError("No inputs to value")
+    years = {len(i.growth_rates) for i in inputs_list}
+    if len(years) != 1:
+        raise ValueError(f"All inputs need the same projection years, got {sorted(years)}")
+
+    return calculate_dcf_batch(
+        base_fcf=[i.base_fcf for i in inputs_list],
+        growth_rates=[i.growth_rates for i in inputs_list],
+        terminal_growth=[i.terminal_growth for i in inputs_list],
+        wacc=[i.wacc for i in inputs_list],
+        shares_outstanding=[i.shares_outstanding for i in inputs_list],
+        net_debt=[i.net_debt for i in inputs_list]
+    )
+
+
+# Sensitivity grid axes and their default half-widths around the base case
+SENSITIVITY_AXES = {
+    "wacc": 0.01,
+    "terminal_growth": 0.005,
+    "growth": 0.02,
+}
+SENSITIVITY_AXIS_LABELS = {
+    "wacc": "WACC",
+    "terminal_growth": "Terminal",
+    "growth": "Growth",
+}
+DEFAULT_GRID_SIZE = 3
+DEFAULT_GRIDS = [("wacc", "terminal_growth"), ("growth", "wacc")]
+
+
+@dataclass
+class SensitivityGrid:
+    """Intrinsic value per share over a 2-D grid of assumptions"""
+    row_axis: str
+    row_values: List[float]
+    col_axis: str
+    col_values: List[float]
+    values: "np.ndarray"  # (rows, cols); nested lists if numpy is unavailable
+
+    def to_dict(self) -> dict:
+        """JSON-serializable numeric matrix with axis labels."""
+        values = self.values.tolist() if hasattr(self.values, "tolist") else self.values
+        return {
+            "rows": {"axis": self.row_axis, "values": list(self.row_values)},
+            "columns": {"axis": self.col_axis, "values": list(self.col_values)},
+            "values": values
+        }
+
+
+def _shift_growth_path(path, first_year_growth):
+    """Move a growth path so it starts at first_year_growth (keeps its shape)."""
+    return path + (first_year_growth - path[0])
+
+
+def _base_value(inputs: DCFInputs, axis: str) -> float:
+    """Base-case value of a sensitivity axis."""
+    if axis == "wacc":
+        return inputs.wacc
+    if axis == "terminal_growth":
+        return inputs.terminal_growth
+    return inputs.growth_rates[0]
+
+
+def axis_range(inputs: DCFInputs, axis: str, size: int = DEFAULT_GRID_SIZE,
+               low: float = None, high: float = None) -> List[float]:
+    """Evenly spaced axis values, centered on the base case unless bounds are given."""
+    if axis not in SENSITIVITY_AXES:
+        raise ValueError(f"Unknown sensitivity axis '{axis}' (use {', '.join(SENSITIVITY_AXES)})")
+    base = _base_value(inputs, axis)
+    if size == 1:
+        return [base]
+    if low is None and high is None:
+        # Symmetric around the base case, which stays exactly on the grid
+        half = SENSITIVITY_AXES[axis]
+        return [base + half * (2 * i / (size - 1) - 1) for i in range(size)]
+    if low is None:
+        low = base - SENSITIVITY_AXES[axis]
+    if high is None:
+        high = base + SENSITIVITY_AXES[axis]
+    return [low + (high - low) * i / (size - 1) for i in range(size)]
+
+
+def sensitivity_grid(inputs: DCFInputs,
+                     row_axis: str = "wacc",
+                     col_axis: str = "terminal_growth",
+                     row_values: List[float] = None,
+                     col_values: List[float] = None,
+                     size: int = DEFAULT_GRID_SIZE) -> SensitivityGrid:
+    """
+    Intrinsic value over a grid of two assumptions, computed in one array pass.
+
+    Axes are "wacc", "terminal_growth" and "growth" (first-year growth, with
+    the rest of the path shifted by the same amount). Grids are cached per
+    input hash, so re-rendering a report doesn't recompute them.
+
+    Returns:
+        SensitivityGrid (values are read-only; copy before modifying)
+    """
+    if row_axis == col_axis:
+        raise ValueError("Sensitivity grid needs two different axes")
+    if row_values is None:
+        row_values = axis_range(inputs, row_axis, size)
+    if col_values is None:
+        col_values = axis_range(inputs, col_axis, size)
+    return _cached_grid(inputs.base_fcf, tuple(inputs.growth_rates), inputs.terminal_growth,
+                        inputs.wacc, inputs.shares_outstanding, inputs.net_debt,
+                        row_axis, tuple(row_values), col_axis, tuple(col_values))
+
+
+@lru_cache(maxsize=256)
+def _cached_grid(base_fcf, growth_rates, terminal_growth, wacc, shares, net_debt,
+                 row_axis, row_values, col_axis, col_values) -> SensitivityGrid:
+    """Compute a sensitivity grid (keyed on hashable inputs for the cache)."""
+    if not NUMPY_AVAILABLE:
+        # Scalar fallback: one calculate_dcf per cell
+        values = []
+        for r in row_values:
+            row = []
+            for c in col_values:
+                params = {"wacc": wacc, "terminal_growth": terminal_growth, "growth": growth_rates[0]}
+                params[row_axis] = r
+                params[col_axis] = c
+                path = [g + (params["growth"] - growth_rates[0]) for g in growth_rates]
+                result = calculate_dcf(DCFInputs("", base_fcf, path, params["terminal_growth"],
+                                                 params["wacc"], shares, net_debt))
+                row.append(result.intrinsic_value_per_share)
+            values.append(row)
+        return SensitivityGrid(row_axis, list(row_values), col_axis, list(col_values), values)
+
+    # Rows vary along axis 0, columns along axis 1; broadcasting does the rest
+    params = {
+        "wacc": np.asarray(wacc, dtype=float),
+        "terminal_growth": np.asarray(terminal_growth, dtype=float),
+        "growth": np.asarray(growth_rates[0], dtype=float),
+    }
+    params[row_axis] = np.asarray(row_values, dtype=float)[:, np.newaxis]
+    params[col_axis] = np.asarray(col_values, dtype=float)[np.newaxis, :]
+
+    path = np.asarray(growth_rates, dtype=float)
+    growth_paths = _shift_growth_path(path, params["growth"][..., np.newaxis])
+
+    batch = calculate_dcf_batch(base_fcf, growth_paths, params["terminal_growth"],
+                                params["wacc"], shares, net_debt)
+    values = np.array(np.broadcast_to(batch.intrinsic_value_per_share,
+                                      (len(row_values), len(col_values))))
+    values.flags.writeable = False
+    return SensitivityGrid(row_axis, list(row_values), col_axis, list(col_values), values)
+
+
 def sensitivity_analysis(inputs: DCFInputs,
                          wacc_range: List[float] = None,
                          terminal_range: List[float] = None) -> dict:
     """
     Run sensitivity analysis on WACC and terminal growth.
 
-    Returns matrix of intrinsic values.
+    Returns matrix of intrinsic values keyed by formatted rates (kept for
+    callers of the original dict format; prefer sensitivity_grid).
     """
-    if wacc_range is None:
-        wacc_range = [inputs.wacc - 0.01, inputs.wacc, inputs.wacc + 0.01]
-    if terminal_range is None:
-        terminal_range = [inputs.terminal_growth - 0.005, inputs.terminal_growth, inputs.terminal_growth + 0.005]
-
+    grid = sensitivity_grid(inputs, "wacc", "terminal_growth", wacc_range, terminal_range)
     matrix = {}
-    for wacc in wacc_range:
+    for i, wacc in enumerate(grid.row_values):
         matrix[f"{wacc:.1%}"] = {}
-        for tg in terminal_range:
-            modified_inputs = DCFInputs(
-                ticker=inputs.ticker,
-                base_fcf=inputs.base_fcf,
-                growth_rates=inputs.growth_rates,
-                terminal_growth=tg,
-                wacc=wacc,
-                shares_outstanding=inputs.shares_outstanding,
-                net_debt=inputs.net_debt
-            )
-            result = calculate_dcf(modified_inputs)
-            matrix[f"{wacc:.1%}"][f"{tg:.1%}"] = round(result.intrinsic_value_per_share, 2)
+        for j, tg in enumerate(grid.col_values):
+            matrix[f"{wacc:.1%}"][f"{tg:.1%}"] = round(float(grid.values[i][j]), 2)
 
     return matrix
 
 
+def build_grids(inputs: DCFInputs, size: int = DEFAULT_GRID_SIZE,
+                ranges: dict = None) -> List[SensitivityGrid]:
+    """
+    The default report grids at a given resolution.
+
+    Args:
+        ranges: Optional {axis: "LOW,HIGH"} overrides for axis bounds
+    """
+    if size < 1:
+        raise ValueError("Grid size must be at least 1")
+    axes = {}
+    for axis in SENSITIVITY_AXES:
+        spec = (ranges or {}).get(axis)
+        low = high = None
+        if spec:
+            try:
+                low, high = (float(v) for v in spec.split(","))
+            except ValueError:
+                raise ValueError(f"Invalid {axis} range '{spec}' (expected LOW,HIGH)")
+        axes[axis] = axis_range(inputs, axis, size, low, high)
+    return [sensitivity_grid(inputs, row, col, axes[row], axes[col]) for row, col in DEFAULT_GRIDS]
+
+
+def _axis_labels(values: List[float]) -> List[str]:
+    """Percent labels with enough decimals to keep neighbouring values distinct."""
+    for decimals in (1, 2, 3):
+        labels = [f"{v:.{decimals}%}" for v in values]
+        if len(set(labels)) == len(labels):
+            return labels
+    return labels
+
+
+def format_sensitivity_grid(grid: SensitivityGrid) -> str:
+    """Render a sensitivity grid as a markdown table."""
+    row_label = SENSITIVITY_AXIS_LABELS[grid.row_axis]
+    col_label = SENSITIVITY_AXIS_LABELS[grid.col_axis]
+    corner = f"{row_label} \\ {col_label}"
+    col_labels = _axis_labels(grid.col_values)
+
+    lines = []
+    lines.append(f"| {corner} | {' | '.join(col_labels)} |")
+    lines.append(f"|{'-' * (len(corner) + 2)}|{'|'.join(['-------'] * len(col_labels))}|")
+    for label, row in zip(_axis_labels(grid.row_values), grid.values):
+        lines.append(f"| {label} | {' | '.join(f'${v:.0f}' for v in row)} |")
+    return "\n".join(lines)
+
+
+# Default spread of each simulated input around its base-case value
+DEFAULT_GROWTH_SD = 0.02
+DEFAULT_WACC_SD = 0.01
+DEFAULT_TERMINAL_SD = 0.005
+
+DISTRIBUTION_PARAMS = {
+    "fixed": 1,       # fixed:value
+    "normal": 2,      # normal:mean,sd
+    "uniform": 2,     # uniform:low,high
+    "triangular": 3,  # triangular:low,mode,high
+}
+
+SIMULATION_PERCENTILES = [5, 10, 25, 50, 75, 90, 95]
+
+
+@dataclass
+class SimulationResult:
+    """Monte Carlo DCF results"""
+    inputs: DCFInputs
+    draws: int
+    valid_draws: int  # draws with wacc > terminal growth
+    seed: Optional[int]
+    distributions: dict
+    mean: float
+    std: float
+    percentiles: dict
+    histogram_counts: List[int]
+    histogram_edges: List[float]
+    prob_above_price: Optional[float] = None
+    current_price: Optional[float] = None
+    values: "np.ndarray" = field(default=None, repr=False)
+
+
+def parse_distribution(spec: str) -> tuple:
+    """
+    Parse a distribution spec like "normal:0.05,0.02" into (kind, params).
+
+    Supported: fixed:v, normal:mean,sd, uniform:low,high, triangular:low,mode,high
+    """
+    kind, _, raw = spec.partition(":")
+    kind = kind.strip().lower()
+    if kind not in DISTRIBUTION_PARAMS:
+        raise ValueError(f"Unknown distribution '{kind}' (use {', '.join(DISTRIBUTION_PARAMS)})")
+    try:
+        params = tuple(float(p) for p in raw.split(",")) if raw else ()
+    except ValueError:
+        raise ValueError(f"Invalid distribution parameters in '{spec}'")
+    if len(params) != DISTRIBUTION_PARAMS[kind]:
+        raise ValueError(f"'{kind}' takes {DISTRIBUTION_PARAMS[kind]} parameter(s), got '{spec}'")
+    return kind, params
+
+
+def _sample(rng, spec: str, n: int) -> "np.ndarray":
+    """Draw n samples from a distribution spec."""
+    kind, params = parse_distribution(spec)
+    if kind == "fixed":
+        return np.full(n, params[0])
+    if kind == "normal":
+        return rng.normal(params[0], params[1], n)
+    if kind == "uniform":
+        return rng.uniform(params[0], params[1], n)
+    return rng.triangular(params[0], params[1], params[2], n)
+
+
+def simulate_dcf(inputs: DCFInputs,
+                 draws: int = 100_000,
+                 growth_dist: str = None,
+                 wacc_dist: str = None,
+                 terminal_dist: str = None,
+                 seed: int = None,
+                 current_price: float = None,
+                 bins: int = 20) -> SimulationResult:
+    """
+    Monte Carlo DCF: sample growth, WACC and terminal growth and value every draw.
+
+    The sampled growth shifts the whole projection path (so a declining path
+    keeps its shape). Draws where WACC <= terminal growth have no finite
+    value and are discarded.
+
+    Args:
+        inputs: Base-case DCFInputs
+        draws: Number of draws
+        growth_dist: Spec for first-year growth (default: normal around base case)
+        wacc_dist: Spec for WACC (default: normal around base case)
+        terminal_dist: Spec for terminal growth (default: normal around base case)
+        seed: Random seed for reproducible draws
+        current_price: If given, report P(intrinsic value > price)
+        bins: Histogram bins
+
+    Returns:
+        SimulationResult with percentiles, histogram and probability
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+    if draws < 1:
+        raise ValueError("draws must be positive")
+
+    distributions = {
+        "growth": growth_dist or f"normal:{inputs.growth_rates[0]},{DEFAULT_GROWTH_SD}",
+        "wacc": wacc_dist or f"normal:{inputs.wacc},{DEFAULT_WACC_SD}",
+        "terminal_growth": terminal_dist or f"normal:{inputs.terminal_growth},{DEFAULT_TERMINAL_SD}",
+    }
+
+    rng = np.random.default_rng(seed)
+    growth = _sample(rng, distributions["growth"], draws)
+    wacc = _sample(rng, distributions["wacc"], draws)
+    terminal = _sample(rng, distributions["terminal_growth"], draws)
+
+    valid = wacc > terminal
+    path = np.asarray(inputs.growth_rates, dtype=float)
+    growth_paths = _shift_growth_path(path, growth[valid][:, np.newaxis])
+
+    batch = calculate_dcf_batch(
+        base_fcf=inputs.base_fcf,
+        growth_rates=growth_paths,
+        terminal_growth=terminal[valid],
+        wacc=wacc[valid],
+        shares_outstanding=inputs.shares_outstanding,
+        net_debt=inputs.net_debt
+    )
+    values = np.asarray(batch.intrinsic_value_per_share)
+    values = values[np.isfinite(values)]
+    if values.size == 0:
+        raise ValueError("No valid draws (WACC never exceeded terminal growth)")
+
+    pct_values = np.percentile(values, SIMULATION_PERCENTILES)
+    # Bin the central 98% so the near-singular WACC ~ terminal tail doesn't
+    # flatten the histogram into one bar
+    low, high = np.percentile(values, [1, 99])
+    counts, edges = np.histogram(values, bins=bins, range=(low, high) if high > low else None)
+
+    return SimulationResult(
+        inputs=inputs,
+        draws=draws,
+        valid_draws=int(values.size),
+        seed=seed,
+        distributions=distributions,
+        mean=float(values.mean()),
+        std=float(values.std()),
+        percentiles={p: float(v) for p, v in zip(SIMULATION_PERCENTILES, pct_values)},
+        histogram_counts=counts.tolist(),
+        histogram_edges=edges.tolist(),
+        prob_above_price=float((values > current_price).mean()) if current_price else None,
+        current_price=current_price,
+        values=values
+    )
+
+
+def format_simulation(sim: SimulationResult) -> str:
+    """Format Monte Carlo results as markdown."""
+    lines = []
+    lines.append(f"## Monte Carlo Simulation: {sim.inputs.ticker}")
+    lines.append("")
+    lines.append(f"**Draws:** {sim.draws:,} ({sim.valid_draws:,} valid)"
+                 + (f" | **Seed:** {sim.seed}" if sim.seed is not None else ""))
+    lines.append("")
+
+    lines.append("| Input | Distribution |")
+    lines.append("|-------|--------------|")
+    for name, spec in sim.distributions.items():
+        lines.append(f"| {name} | {spec} |")
+    lines.append("")
+
+    lines.append("| Statistic | Value/Share |")
+    lines.append("|-----------|-------------|")
+    lines.append(f"| Mean | ${sim.mean:.2f} |")
+    lines.append(f"| Std Dev | ${sim.std:.2f} |")
+    for p, v in sim.percentiles.items():
+        lines.append(f"| P{p} | ${v:.2f} |")
+    if sim.prob_above_price is not None:
+        lines.append(f"| **P(Value > ${sim.current_price:.2f})** | **{sim.prob_above_price:.1%}** |")
+    lines.append("")
+
+    lines.append("### Distribution (P1-P99)")
+    lines.append("```")
+    peak = max(sim.histogram_counts) or 1
+    edges = sim.histogram_edges
+    for i, count in enumerate(sim.histogram_counts):
+        bar = "#" * round(40 * count / peak)
+        lines.append(f"${edges[i]:>9.2f} - ${edges[i + 1]:>9.2f} | {bar} {count}")
+    lines.append("```")
+
+    return "\n".join(lines)
+
+
+def simulation_to_dict(sim: SimulationResult) -> dict:
+    """JSON-serializable view of a SimulationResult."""
+    return {
+        "draws": sim.draws,
+        "valid_draws": sim.valid_draws,
+        "seed": sim.seed,
+        "distributions": sim.distributions,
+        "mean": sim.mean,
+        "std": sim.std,
+        "percentiles": {f"p{p}": v for p, v in sim.percentiles.items()},
+        "prob_above_price": sim.prob_above_price,
+        "histogram": {"counts": sim.histogram_counts, "edges": sim.histogram_edges}
+    }
+
+
+# Search brackets for the reverse-DCF solvers
+IMPLIED_GROWTH_BRACKET = (-0.5, 1.0)
+IMPLIED_WACC_MAX = 1.0
+REVERSE_TOLERANCE = 1e-10
+REVERSE_SOLVE_FOR = ("growth", "wacc")
+
+
+def _with_parameter(inputs: DCFInputs, solve_for: str, value: float) -> DCFInputs:
+    """Copy inputs with a constant growth path or a different WACC."""
+    if solve_for == "growth":
+        return DCFInputs(inputs.ticker, inputs.base_fcf, [value] * len(inputs.growth_rates),
+                         inputs.terminal_growth, inputs.wacc, inputs.shares_outstanding, inputs.net_debt)
+    return DCFInputs(inputs.ticker, inputs.base_fcf, inputs.growth_rates,
+                     inputs.terminal_growth, value, inputs.shares_outstanding, inputs.net_debt)
+
+
+def _reverse_bracket(inputs: DCFInputs, solve_for: str) -> tuple:
+    """Search interval for the solved parameter."""
+    if solve_for == "growth":
+        return IMPLIED_GROWTH_BRACKET
+    # Just above terminal growth (where value -> infinity) up to an absurd WACC
+    return inputs.terminal_growth + 1e-6, IMPLIED_WACC_MAX
+
+
+def _brentq(f, a: float, b: float, tol: float = REVERSE_TOLERANCE, max_iter: int = 100) -> Optional[float]:
+    """Brent's method: root of f in [a, b], or None if f(a) and f(b) share a sign."""
+    fa, fb = f(a), f(b)
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if fa * fb > 0:
+        return None
+
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(max_iter):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol1 = 2 * 2.2e-16 * abs(b) + tol / 2
+        m = (c - b) / 2
+        if abs(m) <= tol1 or fb == 0:
+            return b
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            # Inverse quadratic interpolation (secant when a == c)
+            s = fb / fa
+            if a == c:
+                p, q = 2 * m * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * m * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else (tol1 if m > 0 else -tol1)
+        fb = f(b)
+    return b
+
+
+def solve_implied(inputs: DCFInputs, price: float, solve_for: str = "growth") -> Optional[float]:
+    """
+    Reverse DCF: the constant growth rate (or WACC) at which intrinsic value equals price.
+
+    Growth is solved as a constant rate over all projection years; WACC is
+    solved with the inputs' own growth path.
+
+    Returns:
+        The implied rate, or None if no rate in the search bracket matches price
+    """
+    if solve_for not in REVERSE_SOLVE_FOR:
+        raise ValueError(f"solve_for must be one of {REVERSE_SOLVE_FOR}")
+
+    def f(x):
+        return calculate_dcf(_with_parameter(inputs, solve_for, x)).intrinsic_value_per_share - price
+
+    low, high = _reverse_bracket(inputs, solve_for)
+    return _brentq(f, low, high)
+
+
+def solve_implied_batch(inputs_list: List[DCFInputs], prices, solve_for: str = "growth",
+                        tol: float = REVERSE_TOLERANCE, max_iter: int = 200) -> "np.ndarray":
+    """
+    Reverse DCF for a whole watchlist at once.
+
+    Runs a vectorized bracketed search (bisection steps on calculate_dcf_batch)
+    across all tickers simultaneously.
+
+    Returns:
+        Implied rates, NaN where price is outside the search bracket
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+    if solve_for not in REVERSE_SOLVE_FOR:
+        raise ValueError(f"solve_for must be one of {REVERSE_SOLVE_FOR}")
+    if not inputs_list:
+        return np.empty(0)
+    years = {len(i.growth_rates) for i in inputs_list}
+    if len(years) != 1:
+        raise ValueError(f"All inputs need the same projection years, got {sorted(years)}")
+    n_years = years.pop()
+
+    price = np.asarray(prices, dtype=float)
+    base = np.array([i.base_fcf for i in inputs_list])
+    terminal = np.array([i.terminal_growth for i in inputs_list])
+    wacc = np.array([i.wacc for i in inputs_list])
+    shares = np.array([i.shares_outstanding for i in inputs_list])
+    debt = np.array([i.net_debt for i in inputs_list])
+    paths = np.array([i.growth_rates for i in inputs_list])
+
+    def f(x):
+        if solve_for == "growth":
+            growth = np.repeat(x[:, np.newaxis], n_years, axis=1)
+            batch = calculate_dcf_batch(base, growth, terminal, wacc, shares, debt)
+        else:
+            batch = calculate_dcf_batch(base, paths, terminal, x, shares, debt)
+        return np.asarray(batch.intrinsic_value_per_share) - price
+
+    if solve_for == "growth":
+        low = np.full(len(inputs_list), IMPLIED_GROWTH_BRACKET[0])
+        high = np.full(len(inputs_list), IMPLIED_GROWTH_BRACKET[1])
+    else:
+        low = terminal + 1e-6
+        high = np.full(len(inputs_list), IMPLIED_WACC_MAX)
+
+    f_low = f(low)
+    f_high = f(high)
+    bracketed = np.isfinite(price) & (np.sign(f_low) * np.sign(f_high) <= 0)
+
+    for _ in range(max_iter):
+        if np.all(high - low <= tol):
+            break
+        mid = (low + high) / 2
+        f_mid = f(mid)
+        # Keep the half-interval that still contains the sign change
+        go_left = np.sign(f_mid) == np.sign(f_low)
+        low = np.where(go_left, mid, low)
+        f_low = np.where(go_left, f_mid, f_low)
+        high = np.where(go_left, high, mid)
+
+    return np.where(bracketed, (low + high) / 2, np.nan)
+
+
 def fetch_inputs_from_ticker(ticker: str,
                               wacc: float = 0.09,
                               terminal_growth: float = 0.025,
                               projection_years: int = 5,
                               growth_rate: float = None) -> DCFInputs:
     """
-    Fetch DCF inputs from yfinance for a given ticker.
+    Fetch DCF inputs for a given ticker.
+
+    FCF, shares, net debt and revenue growth come from the local XBRL
+    fundamentals store when the company has been ingested (xbrl_facts.py),
+    and from yfinance otherwise.
     """
-    if not YFINANCE_AVAILABLE:
-        raise ImportError("yfinance not installed. Run: pip install yfinance")
+    fcf = shares = net_debt = revenue_growth = None
 
-    stock = yf.Ticker(ticker)
-    info = stock.info
+    table = load_fundamentals(ticker)
+    if table is not None:
+        fcf = table.free_cash_flow()
+        shares = table.latest("shares_outstanding")
+        debt, cash = table.total_debt(), table.latest("cash")
+        if debt is not None or cash is not None:
+            net_debt = ((debt or 0) - (cash or 0)) / 1e6
+        revenue_growth = table.yoy_growth("revenue")
 
-    # Get FCF
-    fcf = info.get('freeCashflow')
-    if fcf is None:
-        # Try to get from cash flow statement
-        cf = stock.cashflow
-        if cf is not None and not cf.empty and 'Free Cash Flow' in cf.index:
-            fcf = float(cf.loc['Free Cash Flow'].iloc[0])
+    if fcf is None or not shares:
+        if not YFINANCE_AVAILABLE:
+            raise ImportError("yfinance not installed. Run: pip install yfinance")
+
+        snap = get_snapshot(ticker)
+        info = snap.info
+
+        # Get FCF
+        if fcf is None:
+            fcf = info.get('freeCashflow')
+        if fcf is None:
+            # Try to get from cash flow statement
+            cf = snap.cashflow
+            if cf is not None and not cf.empty and 'Free Cash Flow' in cf.index:
+                fcf = float(cf.loc['Free Cash Flow'].iloc[0])
+
+        # Get shares outstanding
+        if not shares:
+            shares = info.get('sharesOutstanding', 0)
+
+        # Get net debt
+        if net_debt is None:
+            total_debt = info.get('totalDebt', 0) or 0
+            total_cash = info.get('totalCash', 0) or 0
+            net_debt = (total_debt - total_cash) / 1e6  # Convert to millions
+
+        if revenue_growth is None:
+            revenue_growth = info.get('revenueGrowth')
 
     if fcf is None:
         raise ValueError(f"Could not find Free Cash Flow for {ticker}")
 
     # Convert to millions
     fcf_millions = fcf / 1e6
-
-    # Get shares outstanding
-    shares = info.get('sharesOutstanding', 0) / 1e6  # Convert to millions
-
-    # Get net debt
-    total_debt = info.get('totalDebt', 0) or 0
-    total_cash = info.get('totalCash', 0) or 0
-    net_debt = (total_debt - total_cash) / 1e6  # Convert to millions
+    shares = (shares or 0) / 1e6
+    net_debt = net_debt or 0.0
 
     # Estimate growth rate if not provided
     if growth_rate is None:
-        revenue_growth = info.get('revenueGrowth')
         if revenue_growth:
             growth_rate = min(revenue_growth, 0.15)  # Cap at 15%
         else:
@@ -201,8 +880,128 @@ def fetch_inputs_from_ticker(ticker: str,
     )
 
 
-def format_result(result: DCFResult, current_price: float = None) -> str:
-    """Format DCF result as markdown."""
+def value_tickers(tickers: List[str],
+                  wacc: float = 0.09,
+                  terminal_growth: float = 0.025,
+                  projection_years: int = 5,
+                  growth_rate: float = None) -> List[dict]:
+    """
+    Batch-value many tickers: fetch inputs concurrently, then one DCF pass.
+
+    Returns:
+        One row per ticker with intrinsic value, current price and upside
+        (or an error for tickers whose inputs could not be fetched)
+    """
+    def fetch(ticker):
+        inputs = fetch_inputs_from_ticker(ticker, wacc=wacc, terminal_growth=terminal_growth,
+                                          projection_years=projection_years, growth_rate=growth_rate)
+        return inputs, get_snapshot(ticker).current_price
+
+    rows = []
+    valued = []
+    for ticker, fetched, error in map_tickers(fetch, [t.upper() for t in tickers]):
+        if error is not None:
+            rows.append({"ticker": ticker, "error": str(error)})
+            continue
+        row = {"ticker": ticker, "current_price": fetched[1]}
+        rows.append(row)
+        valued.append((row, fetched[0]))
+
+    if valued:
+        batch = calculate_dcf_many([inputs for _, inputs in valued])
+        for (row, inputs), iv in zip(valued, batch.intrinsic_value_per_share):
+            row["intrinsic_value_per_share"] = float(iv)
+            price = row["current_price"]
+            row["upside"] = (float(iv) - price) / price if price else None
+
+    return rows
+
+
+def reverse_tickers(tickers: List[str], solve_for: str = "growth",
+                    wacc: float = 0.09,
+                    terminal_growth: float = 0.025,
+                    projection_years: int = 5) -> List[dict]:
+    """
+    Implied growth (or WACC) at current prices for many tickers in one batch.
+
+    Returns:
+        One row per ticker with the implied rate and the base-case assumption
+    """
+    def fetch(ticker):
+        inputs = fetch_inputs_from_ticker(ticker, wacc=wacc, terminal_growth=terminal_growth,
+                                          projection_years=projection_years)
+        return inputs, get_snapshot(ticker).current_price
+
+    rows = []
+    solvable = []
+    for ticker, fetched, error in map_tickers(fetch, [t.upper() for t in tickers]):
+        if error is not None:
+            rows.append({"ticker": ticker, "error": str(error)})
+            continue
+        inputs, price = fetched
+        row = {
+            "ticker": ticker,
+            "current_price": price,
+            "base_case": inputs.growth_rates[0] if solve_for == "growth" else inputs.wacc,
+            f"implied_{solve_for}": None
+        }
+        rows.append(row)
+        if price:
+            solvable.append((row, inputs))
+
+    if solvable:
+        implied = solve_implied_batch([inputs for _, inputs in solvable],
+                                      [row["current_price"] for row, _ in solvable], solve_for)
+        for (row, _), value in zip(solvable, implied):
+            row[f"implied_{solve_for}"] = None if np.isnan(value) else float(value)
+
+    return rows
+
+
+def format_reverse_markdown(rows: List[dict], solve_for: str = "growth") -> str:
+    """Format reverse-DCF rows as a markdown table."""
+    label = "Growth" if solve_for == "growth" else "WACC"
+    lines = []
+    lines.append(f"# Reverse DCF: Implied {label}")
+    lines.append("")
+    if solve_for == "growth":
+        lines.append("*Constant annual FCF growth over the projection period that justifies the current price.*")
+    else:
+        lines.append("*Discount rate at which the base-case cash flows justify the current price.*")
+    lines.append("")
+    lines.append(f"| Ticker | Price | Implied {label} | Base Case |")
+    lines.append(f"|--------|-------|{'-' * (len(label) + 10)}|-----------|")
+    for row in rows:
+        if "error" in row:
+            lines.append(f"| {row['ticker']} | N/A | Error: {row['error'][:40]} | N/A |")
+            continue
+        price = f"${row['current_price']:.2f}" if row.get("current_price") else "N/A"
+        implied = row.get(f"implied_{solve_for}")
+        implied_str = f"{implied:.2%}" if implied is not None else "Out of range"
+        lines.append(f"| {row['ticker']} | {price} | {implied_str} | {row['base_case']:.1%} |")
+    return "\n".join(lines)
+
+
+def format_batch_markdown(rows: List[dict]) -> str:
+    """Format batch valuation rows as a markdown table."""
+    lines = []
+    lines.append("# DCF Valuation: Batch")
+    lines.append("")
+    lines.append("| Ticker | Price | Intrinsic Value | Upside/Downside |")
+    lines.append("|--------|-------|-----------------|-----------------|")
+    for row in rows:
+        if "error" in row:
+            lines.append(f"| {row['ticker']} | N/A | Error: {row['error'][:40]} | N/A |")
+            continue
+        price = f"${row['current_price']:.2f}" if row.get("current_price") else "N/A"
+        upside = f"{row['upside']:.1%}" if row.get("upside") is not None else "N/A"
+        lines.append(f"| {row['ticker']} | {price} | ${row['intrinsic_value_per_share']:.2f} | {upside} |")
+    return "\n".join(lines)
+
+
+def format_result(result: DCFResult, current_price: float = None,
+                  grids: List[SensitivityGrid] = None) -> str:
+    """Format DCF result as markdown (grids default to WACC x terminal and growth x WACC)."""
     lines = []
     lines.append(f"# DCF Valuation: {result.inputs.ticker}")
     lines.append("")
@@ -255,16 +1054,11 @@ def format_result(result: DCFResult, current_price: float = None) -> str:
 
     # Sensitivity
     lines.append("## Sensitivity Analysis")
-    sens = sensitivity_analysis(result.inputs)
-
-    # Header
-    terminal_rates = list(list(sens.values())[0].keys())
-    lines.append(f"| WACC \\ Terminal | {' | '.join(terminal_rates)} |")
-    lines.append(f"|-----------------|{'|'.join(['-------'] * len(terminal_rates))}|")
-
-    for wacc_label, terminal_values in sens.items():
-        values = [f"${v:.0f}" for v in terminal_values.values()]
-        lines.append(f"| {wacc_label} | {' | '.join(values)} |")
+    if grids is None:
+        grids = [sensitivity_grid(result.inputs, row, col) for row, col in DEFAULT_GRIDS]
+    for grid in grids:
+        lines.append("")
+        lines.append(format_sensitivity_grid(grid))
 
     return "\n".join(lines)
 
@@ -279,15 +1073,52 @@ def main():
 
     # Option 2: Ticker-based (auto-fetch)
     parser.add_argument("--ticker", type=str, help="Stock ticker to fetch data from yfinance")
+    parser.add_argument("--tickers", nargs="+", help="Batch-value many tickers (summary table)")
 
     # Common parameters
     parser.add_argument("--terminal", type=float, default=0.025, help="Terminal growth rate (default: 2.5%)")
     parser.add_argument("--wacc", type=float, default=0.09, help="WACC (default: 9%)")
     parser.add_argument("--shares", type=float, help="Shares outstanding (in millions)")
     parser.add_argument("--debt", type=float, default=0, help="Net debt (in millions)")
+    parser.add_argument("--price", type=float, help="Current share price (manual mode)")
+
+    # Sensitivity grids (WACC x terminal growth and growth x WACC)
+    parser.add_argument("--grid-size", type=int, default=DEFAULT_GRID_SIZE,
+                        help=f"Points per sensitivity axis (default: {DEFAULT_GRID_SIZE})")
+    parser.add_argument("--wacc-range", help="Sensitivity WACC range LOW,HIGH (default: base +/- 1%%)")
+    parser.add_argument("--terminal-range", help="Sensitivity terminal growth range LOW,HIGH (default: base +/- 0.5%%)")
+    parser.add_argument("--growth-range", help="Sensitivity first-year growth range LOW,HIGH (default: base +/- 2%%)")
     parser.add_argument("--output", choices=["json", "markdown"], default="markdown")
 
+    # Monte Carlo
+    parser.add_argument("--simulate", type=int, metavar="N", help="Run N Monte Carlo draws")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible draws")
+    parser.add_argument("--growth-dist", help="Growth distribution, e.g. normal:0.05,0.02")
+    parser.add_argument("--wacc-dist", help="WACC distribution, e.g. uniform:0.08,0.11")
+    parser.add_argument("--terminal-dist", help="Terminal growth distribution, e.g. triangular:0.015,0.025,0.03")
+
+    # Reverse DCF
+    parser.add_argument("--reverse", choices=REVERSE_SOLVE_FOR,
+                        help="Solve for the growth or WACC implied by the current price")
+    add_cache_arguments(parser)
+
     args = parser.parse_args()
+    apply_cache_arguments(args)
+
+    if args.tickers:
+        if args.reverse:
+            rows = reverse_tickers(args.tickers, args.reverse, wacc=args.wacc,
+                                   terminal_growth=args.terminal, projection_years=args.years)
+        else:
+            rows = value_tickers(args.tickers, wacc=args.wacc, terminal_growth=args.terminal,
+                                 projection_years=args.years, growth_rate=args.growth)
+        if args.output == "json":
+            print(json.dumps(rows, indent=2))
+        elif args.reverse:
+            print(format_reverse_markdown(rows, args.reverse))
+        else:
+            print(format_batch_markdown(rows))
+        return
 
     # Build inputs
     if args.ticker:
@@ -301,8 +1132,7 @@ def main():
         )
 
         # Get current price for comparison
-        stock = yf.Ticker(args.ticker)
-        current_price = stock.info.get('currentPrice') or stock.info.get('regularMarketPrice')
+        current_price = get_snapshot(args.ticker).current_price
     else:
         # Manual inputs
         if not all([args.fcf, args.growth, args.shares]):
@@ -318,11 +1148,44 @@ def main():
             shares_outstanding=args.shares,
             net_debt=args.debt
         )
-        current_price = None
+        current_price = args.price
+
+    if args.reverse:
+        if not current_price:
+            parser.error("--reverse needs a current price (--ticker, or --price in manual mode)")
+        implied = solve_implied(inputs, current_price, args.reverse)
+        row = {
+            "ticker": inputs.ticker,
+            "current_price": current_price,
+            "base_case": inputs.growth_rates[0] if args.reverse == "growth" else inputs.wacc,
+            f"implied_{args.reverse}": implied
+        }
+        if args.output == "json":
+            print(json.dumps(row, indent=2))
+        else:
+            print(format_reverse_markdown([row], args.reverse))
+        return
 
     # Calculate DCF
     result = calculate_dcf(inputs)
 
+    try:
+        grids = build_grids(inputs, args.grid_size, {
+            "wacc": args.wacc_range,
+            "terminal_growth": args.terminal_range,
+            "growth": args.growth_range,
+        })
+    except ValueError as e:
+        parser.error(str(e))
+
+    sim = None
+    if args.simulate:
+        try:
+            sim = simulate_dcf(inputs, args.simulate, args.growth_dist, args.wacc_dist,
+                               args.terminal_dist, seed=args.seed, current_price=current_price)
+        except ValueError as e:
+            parser.error(str(e))
+
     # Output
     if args.output == "json":
         output = {
@@ -345,11 +1208,16 @@ def main():
                 "intrinsic_value_per_share": result.intrinsic_value_per_share
             },
             "current_price": current_price,
-            "sensitivity": sensitivity_analysis(inputs)
+            "sensitivity": [grid.to_dict() for grid in grids]
         }
+        if sim:
+            output["simulation"] = simulation_to_dict(sim)
         print(json.dumps(output, indent=2))
     else:
-        print(format_result(result, current_price))
+        print(format_result(result, current_price, grids))
+        if sim:
+            print()
+            print(format_simulation(sim))
 
 
 if __name__ == "__main__":
@@ -3,29 +3,38 @@
 Stock Data Fetcher
 Fetches financial data for a given ticker using yfinance.
 
+With --local-prices, the 52-week range and moving averages come from the
+local price history (price_history.py) instead of Yahoo's info fields, and a
+Risk section (returns, volatility, drawdown, beta) is added (risk_metrics.py).
+
 Usage:
-    python fetch_stock_data.py TICKER [--output json|markdown]
+    python fetch_stock_data.py TICKER [--output json|markdown] [--local-prices]
 
 Examples:
     python fetch_stock_data.py GOLF
     python fetch_stock_data.py AAPL --output json
+    python fetch_stock_data.py GOLF --local-prices
 """
 
 import argparse
 import json
-import sys
 from datetime import datetime
 
-try:
-    import yfinance as yf
-except ImportError:
-    print("Error: yfinance not installed. Run: pip install yfinance")
-    sys.exit(1)
+from response_cache import add_cache_arguments, apply_cache_arguments
+from ticker_snapshot import get_snapshot
+
 
+def fetch_stock_data(ticker: str, local_prices: bool = False) -> dict:
+    """
+    Fetch comprehensive stock data for a ticker.
 
-def fetch_stock_data(ticker: str) -> dict:
-    """Fetch comprehensive stock data for a ticker."""
-    stock = yf.Ticker(ticker)
+    Args:
+        ticker: Stock ticker symbol
+        local_prices: Take the 52-week range and moving averages from the
+            local price history and add a "risk" section (falls back to
+            Yahoo's info fields when the ticker has not been synced)
+    """
+    snap = get_snapshot(ticker)
 
     data = {
         "ticker": ticker,
@@ -39,7 +48,7 @@ def fetch_stock_data(ticker: str) -> dict:
     }
 
     try:
-        info = stock.info
+        info = snap.info
 
         # Company Info
         data["info"] = {
@@ -119,7 +128,7 @@ def fetch_stock_data(ticker: str) -> dict:
 
     # Get historical financials
     try:
-        income_stmt = stock.income_stmt
+        income_stmt = snap.income_stmt
         if income_stmt is not None and not income_stmt.empty:
             latest_year = income_stmt.columns[0]
             data["income_statement"] = {
@@ -134,7 +143,7 @@ def fetch_stock_data(ticker: str) -> dict:
         data["errors"].append(f"Error fetching income statement: {str(e)}")
 
     try:
-        balance = stock.balance_sheet
+        balance = snap.balance_sheet
         if balance is not None and not balance.empty:
             latest = balance.columns[0]
             data["balance_sheet"] = {
@@ -149,7 +158,7 @@ def fetch_stock_data(ticker: str) -> dict:
         data["errors"].append(f"Error fetching balance sheet: {str(e)}")
 
     try:
-        cashflow = stock.cashflow
+        cashflow = snap.cashflow
         if cashflow is not None and not cashflow.empty:
             latest = cashflow.columns[0]
             data["cash_flow"] = {
@@ -163,9 +172,36 @@ def fetch_stock_data(ticker: str) -> dict:
     except Exception as e:
         data["errors"].append(f"Error fetching cash flow: {str(e)}")
 
+    if local_prices:
+        _apply_local_prices(data)
+
     return data
 
 
+def _apply_local_prices(data: dict):
+    """Overlay price-history metrics (risk_metrics.py) on a fetch_stock_data result."""
+    from risk_metrics import compute_risk_metrics
+
+    try:
+        risk = compute_risk_metrics([data["ticker"]]).get(data["ticker"])
+    except Exception as e:
+        data["errors"].append(f"Error computing local price metrics: {str(e)}")
+        return
+    if risk is None:
+        data["errors"].append("No local price history (run price_history.py sync); "
+                              "price ranges are from Yahoo")
+        return
+
+    local = {
+        "52_week_high": risk["52_week_high"],
+        "52_week_low": risk["52_week_low"],
+        "50_day_avg": risk["sma_50"],
+        "200_day_avg": risk["sma_200"],
+    }
+    data["price"].update({k: round(v, 2) for k, v in local.items() if v is not None})
+    data["risk"] = risk
+
+
 def _safe_get(df, row_name, col):
     """Safely get a value from a DataFrame."""
     try:
@@ -239,6 +275,26 @@ def to_markdown(data: dict) -> str:
     md.append(f"| 52-Week Low | ${data['price'].get('52_week_low', 'N/A')} |")
     md.append(f"| 50-Day Avg | ${data['price'].get('50_day_avg', 'N/A')} |")
 
+    # Risk (local price history)
+    if data.get('risk'):
+        risk = data['risk']
+
+        def pct(key):
+            # Not format_percent: returns above 100% are real, not already-scaled
+            return f"{risk[key]:.1%}" if risk.get(key) is not None else "N/A"
+
+        beta = f"{risk['beta']:.2f}" if risk.get('beta') is not None else "N/A"
+        md.append(f"\n## Risk (price history to {risk['as_of']})")
+        md.append(f"| Metric | Value |")
+        md.append(f"|--------|-------|")
+        md.append(f"| Return (1M) | {pct('return_1m')} |")
+        md.append(f"| Return (1Y) | {pct('return_1y')} |")
+        md.append(f"| Volatility (3M, ann.) | {pct('volatility_3m')} |")
+        md.append(f"| Volatility (1Y, ann.) | {pct('volatility_1y')} |")
+        md.append(f"| Max Drawdown (1Y) | {pct('max_drawdown_1y')} |")
+        md.append(f"| Beta vs {risk['benchmark']} | {beta} |")
+        md.append(f"| 200-Day Avg | ${data['price'].get('200_day_avg', 'N/A')} |")
+
     # Valuation
     md.append("\n## Valuation")
     md.append(f"| Metric | Value |")
@@ -300,10 +356,15 @@ def main():
     parser.add_argument("ticker", help="Stock ticker symbol")
     parser.add_argument("--output", choices=["json", "markdown"], default="markdown",
                         help="Output format (default: markdown)")
+    parser.add_argument("--local-prices", action="store_true",
+                        help="52-week range, moving averages and risk metrics from local price history")
+
+    add_cache_arguments(parser)
 
     args = parser.parse_args()
+    apply_cache_arguments(args)
 
-    data = fetch_stock_data(args.ticker.upper())
+    data = fetch_stock_data(args.ticker.upper(), args.local_prices)
 
     if args.output == "json":
         print(json.dumps(data, indent=2, default=str))
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Filing Archive
+Local, content-addressed, compressed archive of SEC filing documents.
+
+Filings never change once published, so every document fetched from EDGAR
+is kept: the raw bytes (zstd if the zstandard package is installed, gzip
+otherwise) and the extracted text, each stored once under its SHA-256 and
+verified against it on read. A SQLite manifest maps (accession, document)
+to those objects and tracks last access, so the archive can be held under a
+disk budget by pruning least-recently-used filings.
+
+Usage:
+    python filing_archive.py [--prune] [--clear]
+
+Examples:
+    python filing_archive.py            # show size and document count
+    python filing_archive.py --prune    # enforce the disk budget now
+
+From code:
+    from filing_archive import get_archive
+    text = get_archive().get_text(accession, document)
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+from filing_text import iter_filing_text
+from sec_client import SEC_DATA_DIR
+
+ARCHIVE_DIR = Path(os.environ.get("STOCK_RESEARCH_ARCHIVE_DIR", SEC_DATA_DIR / "archive"))
+MAX_ARCHIVE_BYTES = int(os.environ.get("STOCK_RESEARCH_ARCHIVE_MAX_BYTES", 2 * 1024 ** 3))
+
+CODEC = "zstd" if ZSTD_AVAILABLE else "gzip"
+CODEC_SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+
+
+class ArchiveIntegrityError(Exception):
+    """A stored object no longer matches its hash."""
+
+
+class _ObjectWriter:
+    """Streams bytes into a compressed temp file while hashing them."""
+
+    def __init__(self, directory: Path):
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, self.tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        if CODEC == "zstd":
+            self._stream = zstandard.ZstdCompressor(level=10).stream_writer(self._file)
+        else:
+            self._stream = gzip.GzipFile(fileobj=self._file, mode="wb", compresslevel=6)
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes):
+        self._stream.write(data)
+        self._hash.update(data)
+        self.size += len(data)
+
+    def close(self) -> str:
+        """Finish the stream and return the content hash."""
+        self._stream.close()
+        if not self._file.closed:
+            self._file.close()
+        return self._hash.hexdigest()
+
+    def discard(self):
+        try:
+            self._stream.close()
+        except Exception:
+            pass
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self.tmp):
+            os.unlink(self.tmp)
+
+
+class FilingArchive:
+    """Content-addressed document store with an LRU-pruned SQLite manifest."""
+
+    def __init__(self, root: Path = ARCHIVE_DIR, max_bytes: int = MAX_ARCHIVE_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite connections are not shareable."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.root / "manifest.sqlite"), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    accession TEXT NOT NULL,
+                    document TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    raw_hash TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (accession, document)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS objects (
+                    hash TEXT PRIMARY KEY,
+                    codec TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_bytes INTEGER NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_accessed ON documents (accessed_at)")
+            self._local.conn = conn
+        return conn
+
+    def _object_path(self, digest: str, codec: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}{CODEC_SUFFIXES[codec]}"
+
+    def _write_object(self, conn: sqlite3.Connection, writer: _ObjectWriter) -> str:
+        """Move a finished temp object into place (deduplicating) and register it."""
+        digest = writer.close()
+        path = self._object_path(digest, CODEC)
+        if conn.execute("SELECT 1 FROM objects WHERE hash = ?", (digest,)).fetchone() and path.exists():
+            os.unlink(writer.tmp)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(writer.tmp, path)
+            conn.execute("INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?)",
+                         (digest, CODEC, writer.size, path.stat().st_size))
+        return digest
+
+    def _read_object(self, digest: str) -> bytes:
+        """Decompress an object and verify it against its hash."""
+        row = self._conn().execute("SELECT codec FROM objects WHERE hash = ?", (digest,)).fetchone()
+        if row is None:
+            raise ArchiveIntegrityError(f"object {digest} missing from manifest")
+        codec = row[0]
+        path = self._object_path(digest, codec)
+        try:
+            with open(path, "rb") as f:
+                if codec == "zstd":
+                    if not ZSTD_AVAILABLE:
+                        raise ArchiveIntegrityError("zstandard not installed. Run: pip install zstandard")
+                    data = zstandard.ZstdDecompressor().stream_reader(f).read()
+                else:
+                    data = gzip.GzipFile(fileobj=f).read()
+        except ArchiveIntegrityError:
+            raise
+        except Exception as e:
+            raise ArchiveIntegrityError(f"object {digest} unreadable: {e}")
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ArchiveIntegrityError(f"object {digest} failed hash check")
+        return data
+
+    def _get(self, accession: str, document: str, column: str) -> Optional[bytes]:
+        conn = self._conn()
+        row = conn.execute(
+            f"SELECT {column} FROM documents WHERE accession = ? AND document = ?",
+            (accession, document)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            data = self._read_object(row[0])
+        except ArchiveIntegrityError as e:
+            print(f"Warning: archive entry {accession}/{document} dropped: {e}", file=sys.stderr)
+            self._drop_object(row[0])
+            self.remove(accession, document)
+            return None
+        with self._write_lock:
+            conn.execute("UPDATE documents SET accessed_at = ? WHERE accession = ? AND document = ?",
+                         (time.time(), accession, document))
+            conn.commit()
+        return data
+
+    def get_raw(self, accession: str, document: str) -> Optional[bytes]:
+        """Original document bytes, or None if not archived (or corrupt)."""
+        return self._get(accession, document, "raw_hash")
+
+    def get_text(self, accession: str, document: str) -> Optional[str]:
+        """Extracted document text, or None if not archived (or corrupt)."""
+        data = self._get(accession, document, "text_hash")
+        return data.decode("utf-8") if data is not None else None
+
+    def store(self, accession: str, document: str, url: str, chunks: Iterable[bytes],
+              encoding: str = None) -> str:
+        """
+        Archive a downloaded document and return its extracted text.
+
+        The raw bytes are compressed to disk as they stream in (memory holds
+        one chunk plus the extracted text), then the archive is pruned to its
+        disk budget.
+        """
+        objects = self.root / "objects"
+        raw = _ObjectWriter(objects)
+        text_writer = None
+        try:
+            def tee():
+                for chunk in chunks:
+                    raw.write(chunk)
+                    yield chunk
+
+            text = "".join(iter_filing_text(tee(), encoding))
+            text_writer = _ObjectWriter(objects)
+            text_writer.write(text.encode("utf-8"))
+        except BaseException:
+            raw.discard()
+            if text_writer is not None:
+                text_writer.discard()
+            raise
+
+        conn = self._conn()
+        with self._write_lock:
+            raw_hash = self._write_object(conn, raw)
+            text_hash = self._write_object(conn, text_writer)
+            now = time.time()
+            conn.execute("INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?)",
+                         (accession, document, url, raw_hash, text_hash, now, now))
+            self._prune(conn)
+            conn.commit()
+        return text
+
+    def _drop_object(self, digest: str):
+        """Delete a damaged object so the next store rewrites it."""
+        conn = self._conn()
+        with self._write_lock:
+            for (codec,) in conn.execute("SELECT codec FROM objects WHERE hash = ?", (digest,)).fetchall():
+                try:
+                    self._object_path(digest, codec).unlink()
+                except FileNotFoundError:
+                    pass
+            conn.execute("DELETE FROM objects WHERE hash = ?", (digest,))
+            conn.commit()
+
+    def remove(self, accession: str, document: str):
+        """Drop one document (and any objects nothing else references)."""
+        conn = self._conn()
+        with self._write_lock:
+            conn.execute("DELETE FROM documents WHERE accession = ? AND document = ?",
+                         (accession, document))
+            self._collect(conn)
+            conn.commit()
+
+    def _collect(self, conn: sqlite3.Connection):
+        """Delete objects no document references."""
+        orphans = conn.execute("""
+            SELECT hash, codec FROM objects WHERE hash NOT IN (
+                SELECT raw_hash FROM documents UNION SELECT text_hash FROM documents
+            )
+        """).fetchall()
+        for digest, codec in orphans:
+            try:
+                self._object_path(digest, codec).unlink()
+            except FileNotFoundError:
+                pass
+            conn.execute("DELETE FROM objects WHERE hash = ?", (digest,))
+
+    def _prune(self, conn: sqlite3.Connection, max_bytes: int = None):
+        """Drop least-recently-used documents until the archive fits its budget."""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        total = conn.execute("SELECT COALESCE(SUM(stored_bytes), 0) FROM objects").fetchone()[0]
+        if total <= max_bytes:
+            return
+        # Prune down to 90% so we don't prune on every subsequent store
+        target = max_bytes * 0.9
+        rows = conn.execute("SELECT accession, document FROM documents ORDER BY accessed_at").fetchall()
+        for accession, document in rows:
+            if total <= target:
+                break
+            conn.execute("DELETE FROM documents WHERE accession = ? AND document = ?",
+                         (accession, document))
+            self._collect(conn)
+            total = conn.execute("SELECT COALESCE(SUM(stored_bytes), 0) FROM objects").fetchone()[0]
+
+    def prune(self):
+        """Enforce the disk budget now."""
+        conn = self._conn()
+        with self._write_lock:
+            self._prune(conn)
+            conn.commit()
+
+    def clear(self):
+        """Remove every archived document."""
+        conn = self._conn()
+        with self._write_lock:
+            conn.execute("DELETE FROM documents")
+            self._collect(conn)
+            conn.commit()
+
+    def stats(self) -> dict:
+        conn = self._conn()
+        documents = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        objects, size, stored = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_bytes), 0) FROM objects"
+        ).fetchone()
+        return {"documents": documents, "objects": objects, "bytes": size, "stored_bytes": stored}
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> FilingArchive:
+    """Return the process-wide filing archive."""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = FilingArchive()
+        return _archive
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or prune the local filing archive")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--prune", action="store_true", help="Enforce the disk budget now")
+    group.add_argument("--clear", action="store_true", help="Remove every archived document")
+
+    args = parser.parse_args()
+    archive = get_archive()
+
+    if args.prune:
+        archive.prune()
+    elif args.clear:
+        archive.clear()
+        print("Cleared archive")
+
+    stats = archive.stats()
+    ratio = stats["bytes"] / stats["stored_bytes"] if stats["stored_bytes"] else 0
+    print(f"Archive: {archive.root} ({CODEC})")
+    print("| Documents | Objects | Original | On disk | Ratio | Budget |")
+    print("|-----------|---------|----------|---------|-------|--------|")
+    print(f"| {stats['documents']} | {stats['objects']} | {stats['bytes'] / 1024 ** 2:.1f} MB | "
+          f"{stats['stored_bytes'] / 1024 ** 2:.1f} MB | {ratio:.1f}x | {archive.max_bytes / 1024 ** 3:.1f} GB |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Filing Search
+Local full-text search over downloaded SEC filings (SQLite FTS5).
+
+Filings are ingested once: their text is extracted, split into Item sections
+and stored in an FTS5 index keyed by ticker, form and filing date. Questions
+like "which watchlist companies mention tariffs in risk factors" then run
+against local data in milliseconds.
+
+Usage:
+    python filing_search.py ingest TICKER [TICKER ...] [--type 10-K] [--limit 1]
+    python filing_search.py search QUERY [--tickers T1 T2] [--type 10-K] [--section risk]
+
+Examples:
+    python filing_search.py ingest GOLF AAPL MSFT --type 10-K --limit 2
+    python filing_search.py search tariffs --section risk
+    python filing_search.py search '"supply chain" AND china' --tickers GOLF AAPL
+    python filing_search.py stats
+
+Queries use FTS5 syntax (phrases in quotes, AND/OR/NOT, prefix*); anything
+that isn't valid FTS5 is searched as plain words.
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from filing_sections import NAMED_SECTIONS, SECTION_NAME_RE, section_names
+from response_cache import add_cache_arguments, apply_cache_arguments
+from sec_client import SEC_DATA_DIR
+from ticker_snapshot import DEFAULT_MAX_WORKERS, map_tickers
+
+SEARCH_DB_PATH = SEC_DATA_DIR / "filing_search.sqlite"
+
+FULL_DOCUMENT = "full"  # section key for filings without Item headings
+SNIPPET_TOKENS = 24
+
+
+class FilingSearchIndex:
+    """FTS5 index of filing sections with a table of ingested filings."""
+
+    def __init__(self, path: Path = SEARCH_DB_PATH):
+        self.path = Path(path)
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite connections are not shareable."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS filings (
+                    accession TEXT PRIMARY KEY,
+                    ticker TEXT NOT NULL,
+                    cik TEXT NOT NULL,
+                    form TEXT NOT NULL,
+                    filing_date TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    indexed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS sections USING fts5(
+                    body,
+                    accession UNINDEXED,
+                    ticker UNINDEXED,
+                    form UNINDEXED,
+                    filing_date UNINDEXED,
+                    section UNINDEXED,
+                    name UNINDEXED,
+                    tokenize = 'porter unicode61'
+                )
+            """)
+            self._local.conn = conn
+        return conn
+
+    def has_filing(self, accession: str) -> bool:
+        return self._conn().execute(
+            "SELECT 1 FROM filings WHERE accession = ?", (accession,)
+        ).fetchone() is not None
+
+    def add_filing(self, ticker: str, cik: str, filing: dict, text: str, index: dict):
+        """Store one filing's sections (replacing any earlier copy)."""
+        accession = filing["accession_number"]
+        form = filing.get("form", "")
+        filing_date = filing.get("filing_date", "")
+        names = section_names(index, form)
+        rows = [(text[start:end], accession, ticker, form, filing_date, key, names.get(key, ""))
+                for key, (start, end) in index.items()]
+        if not rows:
+            rows = [(text, accession, ticker, form, filing_date, FULL_DOCUMENT, FULL_DOCUMENT)]
+
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM sections WHERE accession = ?", (accession,))
+            conn.executemany("INSERT INTO sections VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.execute(
+                "INSERT OR REPLACE INTO filings VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (accession, ticker, cik, form, filing_date, filing.get("document_url", ""), time.time())
+            )
+
+    def search(self, query: str, tickers: List[str] = None, form: str = None,
+               section: str = None, limit: int = 10) -> List[dict]:
+        """
+        Ranked (BM25) matches with highlighted snippets.
+
+        Args:
+            query: FTS5 query, or plain words
+            tickers: Restrict to these tickers
+            form: Restrict to a form type (prefix match, so 10-K includes 10-K/A)
+            section: Section name (risk, mda, ...), item ("Item 1A") or key ("II-1A")
+            limit: Maximum results
+        """
+        where = ["sections MATCH ?"]
+        params = []
+        if tickers:
+            where.append(f"ticker IN ({', '.join('?' * len(tickers))})")
+            params.extend(t.upper() for t in tickers)
+        if form:
+            where.append("form LIKE ?")
+            params.append(f"{form.upper()}%")
+        if section:
+            clause, values = _section_filter(section)
+            where.append(clause)
+            params.extend(values)
+
+        sql = f"""
+            SELECT ticker, form, filing_date, section, name, accession,
+                   snippet(sections, 0, '**', '**', '…', {SNIPPET_TOKENS}), bm25(sections)
+            FROM sections
+            WHERE {' AND '.join(where)}
+            ORDER BY bm25(sections)
+            LIMIT ?
+        """
+        try:
+            rows = self._conn().execute(sql, [query] + params + [limit]).fetchall()
+        except sqlite3.OperationalError:
+            # Not valid FTS5 syntax: search the words as quoted terms
+            words = re.findall(r"\w+", query)
+            if not words:
+                return []
+            plain = " ".join(f'"{w}"' for w in words)
+            rows = self._conn().execute(sql, [plain] + params + [limit]).fetchall()
+
+        return [{"ticker": r[0], "form": r[1], "filing_date": r[2], "section": r[3],
+                 "section_name": r[4], "accession_number": r[5], "snippet": r[6],
+                 "score": round(-r[7], 3)} for r in rows]
+
+    def stats(self) -> dict:
+        """Ingested filings per ticker."""
+        rows = self._conn().execute(
+            "SELECT ticker, COUNT(*), MAX(filing_date) FROM filings GROUP BY ticker ORDER BY ticker"
+        ).fetchall()
+        return {ticker: {"filings": count, "latest": latest} for ticker, count, latest in rows}
+
+
+def _section_filter(section: str):
+    """SQL clause and parameters for a section name, item or key."""
+    name = section.strip().lower()
+    if name in NAMED_SECTIONS or name == FULL_DOCUMENT:
+        return "name = ?", [name]
+    match = SECTION_NAME_RE.match(name)
+    if not match:
+        return "section = ?", [section.upper()]
+    part = (match.group(1) or match.group(3) or "").upper()
+    item = (match.group(2) or match.group(4)).upper()
+    if part:
+        return "section = ?", [f"{part}-{item}"]
+    return "(section = ? OR section LIKE ?)", [item, f"%-{item}"]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> FilingSearchIndex:
+    """Return the process-wide filing search index."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = FilingSearchIndex()
+        return _index
+
+
+def ingest_tickers(tickers: List[str], filing_type: str = "10-K", limit: int = 1,
+                   reindex: bool = False, max_workers: int = DEFAULT_MAX_WORKERS) -> dict:
+    """
+    Download, section and index the latest filings for several tickers.
+
+    Tickers are fetched concurrently (SEC traffic stays under the shared rate
+    limit); already-indexed accessions are skipped unless reindex is set.
+
+    Returns:
+        {ticker: number of filings indexed, or an error string}
+    """
+    from sec_edgar import get_cik_from_ticker, get_company_filings, load_filing_sections
+
+    index = get_search_index()
+
+    def fetch(ticker):
+        cik = get_cik_from_ticker(ticker)
+        if not cik:
+            raise ValueError(f"Could not find CIK for {ticker}")
+        docs = []
+        for filing in get_company_filings(cik, filing_type, limit):
+            if not reindex and index.has_filing(filing["accession_number"]):
+                continue
+            text, sections = load_filing_sections(filing["document_url"])
+            docs.append((filing, text, sections))
+        return cik, docs
+
+    results = {}
+    for ticker, result, error in map_tickers(fetch, [t.upper() for t in tickers], max_workers):
+        if error is not None:
+            print(f"Warning: {ticker}: {error}", file=sys.stderr)
+            results[ticker] = str(error)
+            continue
+        cik, docs = result
+        for filing, text, sections in docs:
+            index.add_filing(ticker, cik, filing, text, sections)
+        results[ticker] = len(docs)
+    return results
+
+
+def search_filings(query: str, tickers: List[str] = None, form: str = None,
+                   section: str = None, limit: int = 10) -> List[dict]:
+    """Search the local filing index (see FilingSearchIndex.search)."""
+    return get_search_index().search(query, tickers, form, section, limit)
+
+
+def format_search_markdown(query: str, results: List[dict]) -> str:
+    """Format search results as markdown."""
+    lines = []
+    lines.append(f"# Filing Search: {query}")
+    lines.append(f"\n**Generated:** {datetime.now().isoformat()}")
+    lines.append(f"\n**Source:** Local SEC filing index")
+    lines.append("")
+
+    if not results:
+        lines.append("No matches. Ingest filings first: `python scripts/filing_search.py ingest TICKER`")
+        return "\n".join(lines)
+
+    lines.append("| Ticker | Form | Filed | Section | Snippet |")
+    lines.append("|--------|------|-------|---------|---------|")
+    for r in results:
+        section = f"{r['section']} ({r['section_name']})" if r["section_name"] else r["section"]
+        snippet = r["snippet"].replace("|", "\\|").replace("\n", " ")
+        lines.append(f"| {r['ticker']} | {r['form']} | {r['filing_date']} | {section} | {snippet} |")
+
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local full-text search over SEC filings")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Download and index filings")
+    ingest.add_argument("tickers", nargs="+", help="Stock ticker symbols")
+    ingest.add_argument("--type", dest="filing_type", default="10-K",
+                        help="Filing type (default: 10-K)")
+    ingest.add_argument("--limit", type=int, default=1,
+                        help="Latest filings per ticker (default: 1)")
+    ingest.add_argument("--reindex", action="store_true",
+                        help="Re-index filings that are already in the index")
+    ingest.add_argument("--max-workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f"Tickers fetched concurrently (default: {DEFAULT_MAX_WORKERS})")
+    add_cache_arguments(ingest)
+
+    search = sub.add_parser("search", help="Search indexed filings")
+    search.add_argument("query", help="FTS5 query or plain words")
+    search.add_argument("--tickers", nargs="+", help="Restrict to these tickers")
+    search.add_argument("--type", dest="filing_type", default=None,
+                        help="Filing type filter (10-K, 10-Q, ...)")
+    search.add_argument("--section", default=None,
+                        help="Section (business, risk, mda, financials, 'Item 7A', II-1A)")
+    search.add_argument("--limit", type=int, default=10,
+                        help="Maximum results (default: 10)")
+    search.add_argument("--output", choices=["json", "markdown"], default="markdown",
+                        help="Output format")
+
+    sub.add_parser("stats", help="Show indexed filings per ticker")
+
+    args = parser.parse_args()
+
+    if args.command == "ingest":
+        apply_cache_arguments(args)
+        results = ingest_tickers(args.tickers, args.filing_type, args.limit,
+                                 args.reindex, args.max_workers)
+        for ticker, count in results.items():
+            print(f"{ticker}: {count if isinstance(count, str) else f'{count} filing(s) indexed'}")
+    elif args.command == "search":
+        results = search_filings(args.query, args.tickers, args.filing_type, args.section, args.limit)
+        if args.output == "json":
+            print(json.dumps(results, indent=2))
+        else:
+            print(format_search_markdown(args.query, results))
+    else:
+        stats = get_search_index().stats()
+        print(f"Index: {get_search_index().path}")
+        print("| Ticker | Filings | Latest |")
+        print("|--------|---------|--------|")
+        for ticker, s in stats.items():
+            print(f"| {ticker} | {s['filings']} | {s['latest']} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Filing Section Index
+Single-pass "Item N" section index for 10-K and 10-Q filing text.
+
+One scan over the extracted text finds every PART/Item heading, drops
+cross-references ("see Item 1A") and table-of-contents entries, and records
+the start/end offset of each item. Any section can then be sliced directly
+at its true length, and the index is small enough to cache as JSON next to
+the filing text.
+
+Section keys are "<part>-<item>" (e.g. "I-1A", "II-7"), or just the item when
+the filing has no PART headings.
+
+Usage:
+    from filing_sections import build_section_index, find_section
+
+    index = build_section_index(text)
+    span = find_section(index, "risk", form="10-K")   # or "mda", "Item 7", "II-1A"
+    if span:
+        start, end = span
+        risk_factors = text[start:end]
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+# Headings are title or upper case; lower-case "item 7" is running text
+HEADING_RE = re.compile(r"\b(?:(?:PART|Part)\s+(IV|III|II|I)\b|(?:ITEM|Item)\s*(\d{1,2}[A-Ca-c]?)\b)")
+
+# Text right before a heading that marks it as a cross-reference
+CROSS_REF_RE = re.compile(
+    r"(?:\b(?:see|in|under|and|or|of|to|within|also|this|our)|[,\"'“‘(])\s*$",
+    re.IGNORECASE
+)
+CROSS_REF_LOOKBEHIND = 12
+
+# Named sections: (part, item) per filing layout
+NAMED_SECTIONS = {
+    "business": {"10-K": ("I", "1")},
+    "risk": {"10-K": ("I", "1A"), "10-Q": ("II", "1A")},
+    "mda": {"10-K": ("II", "7"), "10-Q": ("I", "2")},
+    "financials": {"10-K": ("II", "8"), "10-Q": ("I", "1")},
+}
+
+SECTION_NAME_RE = re.compile(
+    r"^(?:part\s*(iv|iii|ii|i)\W*)?(?:item\s*)?(\d{1,2}[a-c]?)$|^(iv|iii|ii|i)-(\d{1,2}[a-c]?)$",
+    re.IGNORECASE
+)
+
+
+def _item_of(key: str) -> str:
+    return key.rsplit("-", 1)[-1]
+
+
+def build_section_index(text: str) -> Dict[str, List[int]]:
+    """
+    Index the item sections of a filing's text in one pass.
+
+    Every heading occurrence is a candidate; for each item the occurrence
+    followed by the most text before the next heading wins. Table-of-contents
+    entries sit a few characters apart, so they lose to the real heading.
+
+    Returns:
+        {key: [start, end]} character offsets, in document order
+    """
+    candidates = []  # (start, key) for items
+    parts = []       # start offsets of PART headings
+    part = None
+    for match in HEADING_RE.finditer(text):
+        if CROSS_REF_RE.search(text, max(0, match.start() - CROSS_REF_LOOKBEHIND), match.start()):
+            continue
+        if match.group(1):
+            part = match.group(1).upper()
+            parts.append(match.start())
+            continue
+        item = match.group(2).upper()
+        candidates.append((match.start(), f"{part}-{item}" if part else item))
+
+    # Boundaries are all surviving headings, parts included
+    boundaries = sorted(parts + [start for start, _ in candidates])
+    next_boundary = {b: e for b, e in zip(boundaries, boundaries[1:] + [len(text)])}
+
+    best = {}
+    for start, key in candidates:
+        span = next_boundary[start] - start
+        if key not in best or span > best[key][1]:
+            best[key] = (start, span)
+
+    # Each chosen section runs to the next chosen section or PART heading
+    starts = sorted((start, key) for key, (start, _) in best.items())
+    ends = sorted(parts + [start for start, _ in starts]) + [len(text)]
+    index = {}
+    pos = 0
+    for start, key in starts:
+        while ends[pos] <= start:
+            pos += 1
+        index[key] = [start, ends[pos]]
+    return index
+
+
+def filing_layout(index: Dict[str, List[int]], form: str = None) -> str:
+    """
+    Layout of a filing for NAMED_SECTIONS: "10-K", "10-Q", or the form itself
+    for other forms (which have no named sections).
+
+    Amendments and transition reports (10-K/A, 10-KT) use their base form's
+    layout. Without a form, a filing with an Item 7 (MD&A) is taken to be a
+    10-K and anything else a 10-Q.
+    """
+    if form:
+        form = form.strip().upper()
+        for layout in ("10-K", "10-Q"):
+            if form.startswith(layout):
+                return layout
+        return form
+    return "10-K" if any(_item_of(key) == "7" for key in index) else "10-Q"
+
+
+def section_names(index: Dict[str, List[int]], form: str = None) -> Dict[str, str]:
+    """Map section keys to their common names ("risk", "mda", ...) for this filing."""
+    by_span = {tuple(span): key for key, span in index.items()}
+    names = {}
+    for name in NAMED_SECTIONS:
+        span = find_section(index, name, form)
+        if span:
+            names[by_span[span]] = name
+    return names
+
+
+def find_section(index: Dict[str, List[int]], section: str,
+                 form: str = None) -> Optional[Tuple[int, int]]:
+    """
+    Offsets of a section by name ("risk", "mda", "business", "financials"),
+    item ("Item 1A", "7") or key ("II-1A").
+
+    Names are resolved with the layout of form (e.g. "10-K", "10-Q/A"); pass
+    it whenever it is known, since the layout is otherwise guessed from the
+    headings found.
+
+    Returns:
+        (start, end) or None if the filing has no such section
+    """
+    name = section.strip().lower()
+    if name in NAMED_SECTIONS:
+        target = NAMED_SECTIONS[name].get(filing_layout(index, form))
+        if not target:
+            return None
+        part, item = target
+    else:
+        match = SECTION_NAME_RE.match(name)
+        if not match:
+            return None
+        part = (match.group(1) or match.group(3) or "").upper() or None
+        item = (match.group(2) or match.group(4)).upper()
+
+    if part and f"{part}-{item}" in index:
+        return tuple(index[f"{part}-{item}"])
+    if item in index:
+        return tuple(index[item])
+    # PART headings missing or mislabelled: first section with that item
+    spans = [span for key, span in index.items() if _item_of(key) == item]
+    return tuple(min(spans)) if spans else None
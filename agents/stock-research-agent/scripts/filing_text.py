@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Filing Text Extraction
+Streaming HTML-to-text extraction for SEC filing documents.
+
+A 10-K with inline XBRL can be 30-80 MB of HTML while the agent only wants
+a few thousand characters of text. The helpers here turn an iterator of
+downloaded byte chunks into an iterator of cleaned text pieces, so callers
+stop reading from the socket as soon as they have what they need and memory
+stays bounded by the chunk size.
+
+Usage:
+    from filing_text import iter_filing_text, take_text
+
+    with client.get(url, stream=True) as response:
+        pieces = iter_filing_text(response.iter_content(CHUNK_SIZE), response.encoding)
+        text, truncated = take_text(pieces, 50000)
+"""
+
+import codecs
+from html.parser import HTMLParser
+from typing import Iterable, Iterator, Optional, Tuple
+
+
+CHUNK_SIZE = 64 * 1024  # bytes read from the socket per step
+
+
+class FilingTextExtractor(HTMLParser):
+    """
+    Incremental HTML-to-text converter.
+
+    Drops script/style blocks and the hidden inline XBRL header, turns tags
+    into word breaks and collapses whitespace as data arrives. Text is
+    collected in small parts that the caller drains with pop_text().
+    """
+
+    SKIP_TAGS = {"script", "style", "ix:header"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._parts = []
+        self._skip_depth = 0
+        self._space = False    # a word break is pending before the next text
+        self._started = False  # any text emitted yet (no leading space)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        self._space = True
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        self._space = True
+
+    def handle_startendtag(self, tag, attrs):
+        self._space = True
+
+    def handle_data(self, data):
+        if self._skip_depth or not data:
+            return
+        words = data.split()
+        if not words:
+            self._space = True
+            return
+        text = " ".join(words)
+        if self._started and (self._space or data[0].isspace()):
+            text = " " + text
+        self._parts.append(text)
+        self._started = True
+        self._space = data[-1].isspace()
+
+    def pop_text(self) -> str:
+        """Return and clear the text collected since the last call."""
+        text = "".join(self._parts)
+        self._parts = []
+        return text
+
+
+def _looks_like_html(text: str) -> bool:
+    lowered = text.lower()
+    return "<html" in lowered or "<body" in lowered
+
+
+def iter_filing_text(chunks: Iterable[bytes], encoding: Optional[str] = None) -> Iterator[str]:
+    """
+    Decode and clean a filing incrementally.
+
+    HTML documents are run through FilingTextExtractor; plain-text documents
+    (older .txt filings) are passed through unchanged. Stop iterating to stop
+    downloading.
+    """
+    decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    extractor = None
+    first = True
+
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if not text:
+            continue
+        if first:
+            first = False
+            if _looks_like_html(text):
+                extractor = FilingTextExtractor()
+        if extractor is None:
+            yield text
+            continue
+        extractor.feed(text)
+        piece = extractor.pop_text()
+        if piece:
+            yield piece
+
+    tail = decoder.decode(b"", final=True)
+    if extractor is None:
+        if tail:
+            yield tail
+        return
+    extractor.feed(tail)
+    extractor.close()
+    piece = extractor.pop_text()
+    if piece:
+        yield piece
+
+
+def take_text(pieces: Iterable[str], max_chars: int) -> Tuple[str, bool]:
+    """
+    Collect up to max_chars of text from a piece iterator.
+
+    Returns:
+        (text, truncated) where truncated means more text was available
+    """
+    parts = []
+    length = 0
+    for piece in pieces:
+        parts.append(piece)
+        length += len(piece)
+        if length > max_chars:
+            return "".join(parts)[:max_chars], True
+    return "".join(parts), False
+
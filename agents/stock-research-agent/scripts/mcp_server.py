@@ -4,15 +4,19 @@ Stock Research MCP Server
 Exposes stock research tools via Model Context Protocol (MCP).
 
 Usage:
-    python mcp_server.py
+    python mcp_server.py [--max-concurrency N] [--config PATH]
 
 This server provides the following tools:
 - fetch_stock_data: Get comprehensive financial data
 - run_dcf: Calculate intrinsic value via DCF
+- reverse_dcf: Solve for the growth/WACC implied by the current price
 - compare_stocks: Compare multiple stocks
 - get_sec_filings: Fetch SEC EDGAR filings
+- search_filings: Full-text search over locally indexed filings
 - get_news: Fetch recent news
 - get_analyst_ratings: Get analyst recommendations
+- refresh_watchlist: Refresh every active watchlist entry in one pass
+- screen_stocks: Filter and rank the local snapshot table of the universe
 
 To use with Claude Code, add to ~/.claude/mcp_servers.json:
 {
@@ -21,18 +25,75 @@ To use with Claude Code, add to ~/.claude/mcp_servers.json:
     "args": ["/path/to/stock-research-agent/scripts/mcp_server.py"]
   }
 }
+
+Each tools/call runs as its own task and its blocking yfinance/requests work
+runs in a bounded thread pool, so parallel calls from the client overlap.
+Responses are written as soon as each call finishes (matched by id), not in
+request order.
+
+Every tool call has a deadline (per tool, from mcp_server_config.json) and can
+be abandoned by the client with notifications/cancelled. A call that times out
+returns a structured JSON-RPC error; a cancelled call gets no response.
 """
 
+import argparse
 import asyncio
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
 from typing import Any
 
+# Maximum tool calls executing at once. Precedence: --max-concurrency, then
+# STOCK_RESEARCH_MCP_CONCURRENCY, then max_concurrency in the config file
+DEFAULT_MAX_CONCURRENCY = 4
+MAX_CONCURRENCY_ENV = "STOCK_RESEARCH_MCP_CONCURRENCY"
+
+# Server config: concurrency and per-tool deadlines (seconds)
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent.parent / "mcp_server_config.json"
+DEFAULT_TOOL_TIMEOUT = 60
+
+# JSON-RPC implementation-defined server error for an expired tool deadline
+TOOL_TIMEOUT_ERROR = -32001
+
+
+class ToolTimeoutError(Exception):
+    """A tool call exceeded its deadline."""
+
+    def __init__(self, tool: str, timeout: float):
+        super().__init__(f"Tool {tool} timed out after {timeout:g}s")
+        self.tool = tool
+        self.timeout = timeout
+
+
+def load_server_config(path: Path = DEFAULT_CONFIG_PATH) -> dict:
+    """Load the server config file; a missing file means defaults."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
 # MCP protocol implementation
 class MCPServer:
     """Simple MCP server implementation."""
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 default_timeout: float = DEFAULT_TOOL_TIMEOUT,
+                 tool_timeouts: dict = None):
+        self.max_concurrency = max(1, max_concurrency)
+        self.default_timeout = default_timeout
+        self.tool_timeouts = dict(tool_timeouts or {})
+        # Threads can't be killed, so a timed-out call keeps its thread until the
+        # blocking call returns. The semaphore slot is released immediately; the
+        # extra workers keep abandoned threads from starving new calls.
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency * 2,
+                                            thread_name_prefix="mcp-tool")
+        self._slots = None  # asyncio.Semaphore, created on the server's loop
+        self._in_flight = {}  # request id -> asyncio.Task
         self.tools = {
             "fetch_stock_data": {
                 "description": "Fetch comprehensive financial data for a stock ticker including price, valuation, financials, and dividends.",
@@ -42,6 +103,10 @@ class MCPServer:
                         "ticker": {
                             "type": "string",
                             "description": "Stock ticker symbol (e.g., AAPL, GOLF, MSFT)"
+                        },
+                        "local_prices": {
+                            "type": "boolean",
+                            "description": "Take the 52-week range and moving averages from local price history (price_history.py sync) and add risk metrics"
                         }
                     },
                     "required": ["ticker"]
@@ -63,13 +128,64 @@ class MCPServer:
                         "terminal_growth": {
                             "type": "number",
                             "description": "Terminal growth rate (default: 0.025 = 2.5%)"
+                        },
+                        "grid_size": {
+                            "type": "integer",
+                            "description": "Points per sensitivity axis (default: 3)"
+                        },
+                        "simulations": {
+                            "type": "integer",
+                            "description": "Add a Monte Carlo run with this many draws (e.g. 100000)"
+                        },
+                        "seed": {
+                            "type": "integer",
+                            "description": "Random seed for reproducible Monte Carlo draws"
+                        },
+                        "growth_dist": {
+                            "type": "string",
+                            "description": "Growth distribution, e.g. normal:0.05,0.02 (default: around base case)"
+                        },
+                        "wacc_dist": {
+                            "type": "string",
+                            "description": "WACC distribution, e.g. uniform:0.08,0.11"
+                        },
+                        "terminal_dist": {
+                            "type": "string",
+                            "description": "Terminal growth distribution, e.g. triangular:0.015,0.025,0.03"
                         }
                     },
                     "required": ["ticker"]
                 }
             },
+            "reverse_dcf": {
+                "description": "Reverse DCF: solve for the constant growth rate (or WACC) implied by the current price, for one ticker or a whole watchlist at once.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "tickers": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Stock ticker symbols"
+                        },
+                        "solve_for": {
+                            "type": "string",
+                            "enum": ["growth", "wacc"],
+                            "description": "Parameter to solve for (default: growth)"
+                        },
+                        "wacc": {
+                            "type": "number",
+                            "description": "WACC used when solving for growth (default: 0.09)"
+                        },
+                        "terminal_growth": {
+                            "type": "number",
+                            "description": "Terminal growth rate (default: 0.025)"
+                        }
+                    },
+                    "required": ["tickers"]
+                }
+            },
             "compare_stocks": {
-                "description": "Compare two or more stocks side by side on valuation, financials, and returns.",
+                "description": "Compare two or more stocks on valuation, financials, and returns. Up to 6 are shown side by side; larger sets (a whole sector) are ranked by composite percentile score in pages.",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
@@ -77,6 +193,19 @@ class MCPServer:
                             "type": "array",
                             "items": {"type": "string"},
                             "description": "List of stock ticker symbols to compare"
+                        },
+                        "local_prices": {
+                            "type": "boolean",
+                            "description": "Take the 52-week range and beta from local price history (price_history.py sync) and add return, volatility and drawdown rows"
+                        },
+                        "page": {
+                            "type": "integer",
+                            "description": "Ranking page when comparing more than 6 tickers (default: 1)"
+                        },
+                        "page_size": {
+                            "type": "integer",
+                            "minimum": 1,
+                            "description": "Tickers per ranking page (default: 25)"
                         }
                     },
                     "required": ["tickers"]
@@ -98,11 +227,49 @@ class MCPServer:
                         "limit": {
                             "type": "integer",
                             "description": "Maximum number of filings (default: 10)"
+                        },
+                        "since": {
+                            "type": "string",
+                            "description": "Earliest filing date (YYYY-MM-DD)"
+                        },
+                        "until": {
+                            "type": "string",
+                            "description": "Latest filing date (YYYY-MM-DD)"
                         }
                     },
                     "required": ["ticker"]
                 }
             },
+            "search_filings": {
+                "description": "Full-text search over locally indexed SEC filings (ingest with filing_search.py). Returns ranked snippets by ticker, form, date and section.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "FTS5 query (phrases in quotes, AND/OR/NOT, prefix*) or plain words"
+                        },
+                        "tickers": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Restrict to these tickers"
+                        },
+                        "filing_type": {
+                            "type": "string",
+                            "description": "Filing type filter (10-K, 10-Q, etc.)"
+                        },
+                        "section": {
+                            "type": "string",
+                            "description": "Section: business, risk, mda, financials, 'Item 7A' or II-1A"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum results (default: 10)"
+                        }
+                    },
+                    "required": ["query"]
+                }
+            },
             "get_news": {
                 "description": "Fetch recent news for a stock from Yahoo Finance.",
                 "inputSchema": {
@@ -119,6 +286,10 @@ class MCPServer:
                         "include_calendar": {
                             "type": "boolean",
                             "description": "Include upcoming events (earnings, dividends)"
+                        },
+                        "new_only": {
+                            "type": "boolean",
+                            "description": "Only news not returned by an earlier new_only call (deduplicated across tickers)"
                         }
                     },
                     "required": ["ticker"]
@@ -140,6 +311,48 @@ class MCPServer:
                     },
                     "required": ["ticker"]
                 }
+            },
+            "refresh_watchlist": {
+                "description": "Refresh all active entries of memory/watchlist.md concurrently (price, DCF, analyst targets vs fair value range) and write one summary table.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "write": {
+                            "type": "boolean",
+                            "description": "Write memory/watchlist_summary.md (default: true)"
+                        }
+                    }
+                }
+            },
+            "screen_stocks": {
+                "description": "Screen every ticker in the local snapshot table (built with screen.py build) with a filter expression over compare_stocks metrics, e.g. 'pe_forward < 15 and revenue_growth > 0.1 and debt_equity < 50', optionally ranked.",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "filter": {
+                            "type": "string",
+                            "description": "Filter expression: metric names, numbers, + - * /, comparisons, and/or/not, abs/log/min/max"
+                        },
+                        "rank": {
+                            "type": "string",
+                            "description": "Expression to rank matches by, highest first (e.g. 'fcf / market_cap')"
+                        },
+                        "ascending": {
+                            "type": "boolean",
+                            "description": "Rank lowest first"
+                        },
+                        "top": {
+                            "type": "integer",
+                            "minimum": 0,
+                            "description": "Rows to return (default: 25)"
+                        },
+                        "columns": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Extra metrics to show"
+                        }
+                    }
+                }
             }
         }
 
@@ -174,11 +387,25 @@ class MCPServer:
         elif method == "tools/call":
             tool_name = params.get("name")
             arguments = params.get("arguments", {})
-            result = await self._call_tool(tool_name, arguments)
+            try:
+                result = await self._call_tool(tool_name, arguments)
+            except ToolTimeoutError as e:
+                return self._error(request_id, TOOL_TIMEOUT_ERROR, str(e), {
+                    "reason": "timeout",
+                    "tool": e.tool,
+                    "timeout_seconds": e.timeout
+                })
             return self._response(request_id, {
                 "content": [{"type": "text", "text": result}]
             })
 
+        elif method == "notifications/cancelled":
+            # Abandon the in-flight call; cancelled requests get no response
+            task = self._in_flight.get(params.get("requestId"))
+            if task is not None:
+                task.cancel()
+            return None
+
         elif method == "notifications/initialized":
             # No response needed for notifications
             return None
@@ -186,21 +413,54 @@ class MCPServer:
         else:
             return self._error(request_id, -32601, f"Method not found: {method}")
 
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run blocking (network/CPU) work in the tool thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def track(self, request_id: Any, task: asyncio.Task):
+        """Register an in-flight tools/call so it can be cancelled by id."""
+        self._in_flight[request_id] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(request_id, None))
+
+    def timeout_for(self, name: str) -> float:
+        """Deadline in seconds for a tool."""
+        return self.tool_timeouts.get(name, self.default_timeout)
+
     async def _call_tool(self, name: str, args: dict) -> str:
         """Execute a tool and return the result."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        timeout = self.timeout_for(name)
+        async with self._slots:
+            try:
+                return await asyncio.wait_for(self._dispatch_tool(name, args), timeout)
+            except asyncio.TimeoutError:
+                raise ToolTimeoutError(name, timeout)
+
+    async def _dispatch_tool(self, name: str, args: dict) -> str:
+        """Route a tool call to its handler."""
         try:
             if name == "fetch_stock_data":
                 return await self._fetch_stock_data(args)
             elif name == "run_dcf":
                 return await self._run_dcf(args)
+            elif name == "reverse_dcf":
+                return await self._reverse_dcf(args)
             elif name == "compare_stocks":
                 return await self._compare_stocks(args)
             elif name == "get_sec_filings":
                 return await self._get_sec_filings(args)
+            elif name == "search_filings":
+                return await self._search_filings(args)
             elif name == "get_news":
                 return await self._get_news(args)
             elif name == "get_analyst_ratings":
                 return await self._get_analyst_ratings(args)
+            elif name == "refresh_watchlist":
+                return await self._refresh_watchlist(args)
+            elif name == "screen_stocks":
+                return await self._screen_stocks(args)
             else:
                 return f"Unknown tool: {name}"
         except Exception as e:
@@ -210,48 +470,98 @@ class MCPServer:
         """Fetch stock data."""
         from fetch_stock_data import fetch_stock_data, to_markdown
         ticker = args.get("ticker", "").upper()
-        data = fetch_stock_data(ticker)
+        data = await self._run_blocking(fetch_stock_data, ticker, args.get("local_prices", False))
         return to_markdown(data)
 
     async def _run_dcf(self, args: dict) -> str:
         """Run DCF model."""
-        from dcf_model import fetch_inputs_from_ticker, calculate_dcf, format_result
-        import yfinance as yf
+        from dcf_model import (fetch_inputs_from_ticker, calculate_dcf, format_result,
+                               build_grids, simulate_dcf, format_simulation)
+        from ticker_snapshot import get_snapshot
 
         ticker = args.get("ticker", "").upper()
         wacc = args.get("wacc", 0.09)
         terminal = args.get("terminal_growth", 0.025)
+        simulations = args.get("simulations")
+        grid_size = args.get("grid_size")
+
+        def run():
+            inputs = fetch_inputs_from_ticker(ticker, wacc=wacc, terminal_growth=terminal)
+            result = calculate_dcf(inputs)
+            current_price = get_snapshot(ticker).current_price
+            grids = build_grids(inputs, int(grid_size)) if grid_size else None
+            report = format_result(result, current_price, grids)
+            if simulations:
+                sim = simulate_dcf(inputs, int(simulations),
+                                   growth_dist=args.get("growth_dist"),
+                                   wacc_dist=args.get("wacc_dist"),
+                                   terminal_dist=args.get("terminal_dist"),
+                                   seed=args.get("seed"),
+                                   current_price=current_price)
+                report += "\n\n" + format_simulation(sim)
+            return report
+
+        return await self._run_blocking(run)
+
+    async def _reverse_dcf(self, args: dict) -> str:
+        """Solve for implied growth/WACC."""
+        from dcf_model import reverse_tickers, format_reverse_markdown
 
-        inputs = fetch_inputs_from_ticker(ticker, wacc=wacc, terminal_growth=terminal)
-        result = calculate_dcf(inputs)
-
-        stock = yf.Ticker(ticker)
-        current_price = stock.info.get('currentPrice') or stock.info.get('regularMarketPrice')
+        tickers = args.get("tickers", [])
+        if not tickers:
+            return "Error: Need at least 1 ticker"
+        solve_for = args.get("solve_for", "growth")
+        if solve_for not in ("growth", "wacc"):
+            return f"Error: solve_for must be 'growth' or 'wacc', got '{solve_for}'"
 
-        return format_result(result, current_price)
+        rows = await self._run_blocking(reverse_tickers, tickers, solve_for,
+                                        wacc=args.get("wacc", 0.09),
+                                        terminal_growth=args.get("terminal_growth", 0.025))
+        return format_reverse_markdown(rows, solve_for)
 
     async def _compare_stocks(self, args: dict) -> str:
         """Compare stocks."""
-        from compare_stocks import generate_comparison
+        from compare_stocks import DEFAULT_PAGE_SIZE, generate_comparison
         tickers = args.get("tickers", [])
         if len(tickers) < 2:
             return "Error: Need at least 2 tickers to compare"
-        return generate_comparison(tickers)
+        page_size = args.get("page_size", DEFAULT_PAGE_SIZE)
+        if page_size < 1:
+            return f"Error: page_size must be at least 1, got {page_size}"
+        return await self._run_blocking(generate_comparison, tickers,
+                                        local_prices=args.get("local_prices", False),
+                                        page=args.get("page", 1),
+                                        page_size=page_size)
 
     async def _get_sec_filings(self, args: dict) -> str:
         """Get SEC filings."""
-        from sec_edgar import get_cik_from_ticker, get_company_filings, format_filings_markdown
+        from sec_edgar import (get_cik_from_ticker, get_company_filings, get_company_name,
+                               format_filings_markdown)
 
         ticker = args.get("ticker", "").upper()
         filing_type = args.get("filing_type")
         limit = args.get("limit", 10)
 
-        cik = get_cik_from_ticker(ticker)
+        cik = await self._run_blocking(get_cik_from_ticker, ticker)
         if not cik:
             return f"Error: Could not find CIK for {ticker}"
 
-        filings = get_company_filings(cik, filing_type, limit)
-        return format_filings_markdown(ticker, filings)
+        filings = await self._run_blocking(get_company_filings, cik, filing_type, limit,
+                                           args.get("since"), args.get("until"))
+        return format_filings_markdown(ticker, filings, get_company_name(cik))
+
+    async def _search_filings(self, args: dict) -> str:
+        """Search locally indexed filings."""
+        from filing_search import search_filings, format_search_markdown
+
+        query = args.get("query", "")
+        if not query:
+            return "Error: Need a query"
+
+        results = await self._run_blocking(search_filings, query, args.get("tickers"),
+                                           args.get("filing_type"), args.get("section"),
+                                           args.get("limit", 10))
+        return format_search_markdown(query, results)
 
     async def _get_news(self, args: dict) -> str:
         """Get news."""
@@ -260,11 +570,12 @@ class MCPServer:
         ticker = args.get("ticker", "").upper()
         limit = args.get("limit", 10)
         include_calendar = args.get("include_calendar", False)
+        new_only = args.get("new_only", False)
 
-        news = get_stock_news(ticker, limit)
-        calendar = get_stock_calendar(ticker) if include_calendar else None
+        news = await self._run_blocking(get_stock_news, ticker, limit, new_only)
+        calendar = await self._run_blocking(get_stock_calendar, ticker) if include_calendar else None
 
-        return format_news_markdown(ticker, news, calendar)
+        return format_news_markdown(ticker, news, calendar, new_only)
 
     async def _get_analyst_ratings(self, args: dict) -> str:
         """Get analyst ratings."""
@@ -273,11 +584,33 @@ class MCPServer:
         ticker = args.get("ticker", "").upper()
         include_earnings = args.get("include_earnings", False)
 
-        data = get_analyst_recommendations(ticker)
-        earnings = get_earnings_estimates(ticker) if include_earnings else None
+        data = await self._run_blocking(get_analyst_recommendations, ticker)
+        earnings = await self._run_blocking(get_earnings_estimates, ticker) if include_earnings else None
 
         return format_ratings_markdown(data, earnings)
 
+    async def _refresh_watchlist(self, args: dict) -> str:
+        """Refresh the watchlist."""
+        from watchlist import format_watchlist_markdown, refresh_watchlist, write_summary
+
+        rows = await self._run_blocking(refresh_watchlist)
+        markdown = format_watchlist_markdown(rows)
+        if args.get("write", True):
+            await self._run_blocking(write_summary, markdown)
+        return markdown
+
+    async def _screen_stocks(self, args: dict) -> str:
+        """Screen the snapshot table."""
+        from screen import DEFAULT_TOP, format_screen_markdown, screen
+
+        try:
+            result = await self._run_blocking(screen, args.get("filter"), args.get("rank"),
+                                              args.get("top", DEFAULT_TOP), args.get("ascending", False),
+                                              args.get("columns"))
+        except ValueError as e:
+            return f"Error: {e}"
+        return format_screen_markdown(result)
+
     def _response(self, request_id: Any, result: dict) -> dict:
         """Create a success response."""
         return {
@@ -286,18 +619,37 @@ class MCPServer:
             "result": result
         }
 
-    def _error(self, request_id: Any, code: int, message: str) -> dict:
+    def _error(self, request_id: Any, code: int, message: str, data: dict = None) -> dict:
         """Create an error response."""
+        error = {"code": code, "message": message}
+        if data is not None:
+            error["data"] = data
         return {
             "jsonrpc": "2.0",
             "id": request_id,
-            "error": {"code": code, "message": message}
+            "error": error
         }
 
 
 async def main():
     """Main entry point - runs the MCP server over stdio."""
-    server = MCPServer()
+    parser = argparse.ArgumentParser(description="Stock research MCP server")
+    parser.add_argument("--max-concurrency", type=int, default=None,
+                        help=f"Maximum tool calls executing at once (default: ${MAX_CONCURRENCY_ENV}, "
+                             f"then the config file, then {DEFAULT_MAX_CONCURRENCY})")
+    parser.add_argument("--config", default=str(DEFAULT_CONFIG_PATH),
+                        help="Server config JSON (concurrency, per-tool timeouts)")
+    args = parser.parse_args()
+
+    config = load_server_config(args.config)
+    env_concurrency = os.environ.get(MAX_CONCURRENCY_ENV)
+    server = MCPServer(
+        max_concurrency=(args.max_concurrency
+                         or (int(env_concurrency) if env_concurrency else None)
+                         or config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)),
+        default_timeout=config.get("default_timeout", DEFAULT_TOOL_TIMEOUT),
+        tool_timeouts=config.get("tool_timeouts")
+    )
 
     # Read from stdin, write to stdout
     reader = asyncio.StreamReader()
@@ -308,6 +660,26 @@ async def main():
         asyncio.streams.FlowControlMixin, sys.stdout
     )
     writer = asyncio.StreamWriter(writer_transport, writer_protocol, reader, asyncio.get_event_loop())
+    write_lock = asyncio.Lock()
+    pending = set()
+
+    async def send(message: dict):
+        # Concurrent tasks finish in any order; keep each line intact
+        async with write_lock:
+            writer.write((json.dumps(message) + "\n").encode('utf-8'))
+            await writer.drain()
+
+    async def handle(request: dict):
+        try:
+            response = await server.handle_request(request)
+        except asyncio.CancelledError:
+            # Cancelled by the client: per MCP, send nothing back
+            return
+        except Exception as e:
+            response = server._error(request.get("id"), -32603, f"Internal error: {e}")
+        # Send response (if not a notification)
+        if response is not None:
+            await send(response)
 
     while True:
         try:
@@ -323,27 +695,29 @@ async def main():
             # Parse request
             request = json.loads(line)
 
-            # Handle request
-            response = await server.handle_request(request)
-
-            # Send response (if not a notification)
-            if response is not None:
-                response_json = json.dumps(response) + "\n"
-                writer.write(response_json.encode('utf-8'))
-                await writer.drain()
+            if request.get("method") == "tools/call":
+                # Tool calls run concurrently; the response is written when done
+                task = asyncio.create_task(handle(request))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                server.track(request.get("id"), task)
+            else:
+                await handle(request)
 
         except json.JSONDecodeError as e:
-            error = {
+            await send({
                 "jsonrpc": "2.0",
                 "id": None,
                 "error": {"code": -32700, "message": f"Parse error: {e}"}
-            }
-            writer.write((json.dumps(error) + "\n").encode('utf-8'))
-            await writer.drain()
+            })
         except Exception as e:
             print(f"Error: {e}", file=sys.stderr)
             break
 
+    # Let in-flight tool calls finish before exiting
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
 
 if __name__ == "__main__":
     asyncio.run(main())
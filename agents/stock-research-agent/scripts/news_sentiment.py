@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+News Sentiment
+Lexicon-based sentiment scoring for financial news headlines.
+
+A small finance lexicon (beats/misses, upgrades/downgrades, raises/cuts
+guidance, ...) weights each word; a negator within the three words before
+("not", "no", "fails to", "didn't") flips and damps it. Whole batches are
+scored with NumPy in one pass, so a day of headlines across the universe
+takes well under a second. Scores are in [-1, 1] (VADER-style compound).
+
+Usage:
+    python news_sentiment.py HEADLINE [HEADLINE ...]
+    python news_sentiment.py --file headlines.txt
+
+Examples:
+    python news_sentiment.py "Acushnet beats estimates, raises guidance"
+    python news_sentiment.py "Titleist sales did not decline" --output json
+"""
+
+import argparse
+import json
+import string
+from itertools import chain, repeat
+from typing import List
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Word weights on a -3..3 scale; inflections ("beats", "surged") are derived
+SENTIMENT_LEXICON = {
+    # Results and guidance
+    "beat": 2.0, "exceed": 2.0, "record": 1.5, "strong": 1.5, "robust": 1.5,
+    "growth": 1.0, "grow": 1.0, "gain": 1.5, "profit": 1.0, "profitable": 1.5,
+    "raise": 1.5, "rose": 1.0, "grew": 1.0, "won": 1.5, "boost": 1.5, "improve": 1.5,
+    "outperform": 2.0, "accelerate": 1.5, "good": 1.0,
+    "expand": 1.0, "rebound": 1.5, "recover": 1.0, "recovery": 1.0, "upbeat": 2.0,
+    "optimistic": 1.5, "solid": 1.0, "win": 1.5, "success": 1.5, "successful": 1.5,
+    "miss": -2.0, "weak": -1.5, "decline": -1.5, "fall": -1.5, "drop": -1.5, "loss": -2.0,
+    "lose": -1.5, "lost": -1.5, "fell": -1.5, "sank": -2.0, "cut": -1.5, "lower": -1.0,
+    "slash": -2.0, "shortfall": -2.0, "bad": -1.5,
+    "disappoint": -2.0, "disappointing": -2.0, "slowdown": -1.5, "slow": -1.0,
+    "underperform": -2.0, "warn": -2.0, "warning": -2.0, "pessimistic": -1.5,
+    "headwind": -1.0, "pressure": -1.0, "challenging": -1.0, "soft": -1.0,
+    # Analysts and market moves
+    "upgrade": 2.0, "bullish": 2.0, "buy": 1.0, "overweight": 1.5, "surge": 2.0,
+    "soar": 2.5, "jump": 1.5, "rally": 1.5, "climb": 1.0,
+    "rise": 1.0, "high": 0.5, "downgrade": -2.0, "bearish": -2.0, "sell": -1.0,
+    "underweight": -1.5, "plunge": -2.5, "plummet": -2.5, "tumble": -2.0, "sink": -2.0,
+    "slump": -2.0, "crash": -3.0, "selloff": -2.0, "low": -0.5, "volatile": -0.5,
+    # Corporate events
+    "approval": 1.5, "approve": 1.5, "launch": 0.5, "partnership": 1.0, "buyback": 1.0,
+    "dividend": 0.5, "acquire": 0.5, "breakthrough": 2.0, "innovative": 1.0,
+    "lawsuit": -1.5, "sue": -1.5, "probe": -1.5, "investigation": -1.5, "fraud": -3.0,
+    "recall": -2.0, "layoff": -1.5, "bankruptcy": -3.0, "default": -2.5, "delay": -1.0,
+    "halt": -1.5, "scandal": -2.5, "penalty": -1.5, "downturn": -1.5,
+    "risk": -0.5, "concern": -1.0, "uncertainty": -1.0, "tariff": -1.0, "restructuring": -1.0,
+    "impairment": -1.5, "writedown": -1.5, "dilution": -1.0, "resign": -1.0, "debt": -0.5,
+}
+VOWELS = "aeiou"
+
+# Words that flip the sentiment of the next few words ("not", "didn't", "fails to")
+NEGATORS = frozenset([
+    "not", "no", "never", "without", "nor", "neither", "cannot", "lack", "lacks",
+    "fail", "fails", "failed", "unable", "isnt", "wasnt", "arent", "werent", "dont",
+    "doesnt", "didnt", "wont", "cant", "couldnt", "shouldnt", "hasnt", "havent", "hadnt",
+])
+NEGATION_WINDOW = 3
+NEGATION_SCALAR = -0.74
+# Punctuation that ends a negation's scope ("Not bad, earnings rose")
+CLAUSE_BREAKS = ",;:"
+CLAUSE_BREAK_TOKENS = frozenset(CLAUSE_BREAKS)
+
+# Normalization constant of the compound score: s / sqrt(s^2 + alpha)
+COMPOUND_ALPHA = 15.0
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+# Apostrophes are dropped ("didn't" -> "didnt"), clause breaks become their
+# own token, other punctuation splits words
+SENTIMENT_SEPARATORS = str.maketrans(
+    {**{c: " " for c in string.punctuation + "“”–—…"}, "'": "", "’": "",
+     **{c: f" {c} " for c in CLAUSE_BREAKS}}
+)
+
+
+def _inflections(word: str) -> List[str]:
+    """
+    Regular -s, -ed and -ing forms of a lexicon word.
+
+    A final e is dropped ("rise" -> "rising"), a final consonant + y becomes
+    ie ("rally" -> "rallies", "rallied"), and a word ending consonant-vowel-
+    consonant also gets the doubled forms ("drop" -> "dropped", "cut" ->
+    "cutting"). Doubling depends on stress ("recovered"), so the undoubled
+    forms are kept too; forms that aren't words never match anything.
+    """
+    if word.endswith("e"):
+        return [word + "s", word + "d", word[:-1] + "ing"]
+    if len(word) > 2 and word[-1] == "y" and word[-2] not in VOWELS:
+        return [word[:-1] + "ies", word[:-1] + "ied", word + "ing"]
+    forms = [word + "es" if word.endswith(("s", "x", "z", "ch", "sh")) else word + "s",
+             word + "ed", word + "ing"]
+    if len(word) >= 3 and word[-1] not in VOWELS + "wxy" and word[-2] in VOWELS and word[-3] not in VOWELS:
+        forms += [word + word[-1] + "ed", word + word[-1] + "ing"]
+    return forms
+
+
+def _expand_lexicon(lexicon: dict) -> dict:
+    weights = {}
+    for word, weight in lexicon.items():
+        for form in [word] + _inflections(word):
+            weights.setdefault(form, weight)
+    # Explicit entries win over derived forms
+    weights.update(lexicon)
+    return weights
+
+
+WORD_WEIGHTS = _expand_lexicon(SENTIMENT_LEXICON)
+
+
+def _tokenize(titles: List[str]) -> List[List[str]]:
+    lines = "\n".join(t or "" for t in titles).lower().translate(SENTIMENT_SEPARATORS).split("\n")
+    if len(lines) != len(titles):  # a title contained a newline
+        lines = [(t or "").replace("\n", " ").lower().translate(SENTIMENT_SEPARATORS) for t in titles]
+    return [line.split() for line in lines]
+
+
+def score_titles(titles: List[str]) -> "np.ndarray":
+    """
+    Compound sentiment of each title, scored as one batch.
+
+    Returns:
+        Array of scores in [-1, 1], one per title (0 when no lexicon word)
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+
+    words = _tokenize(titles)
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+    tokens = list(chain.from_iterable(words))
+    if not tokens:
+        return np.zeros(len(titles))
+
+    count = len(tokens)
+    weights = np.fromiter(map(WORD_WEIGHTS.get, tokens, repeat(0.0, count)), dtype=np.float64, count=count)
+    negator = np.fromiter(map(NEGATORS.__contains__, tokens), dtype=bool, count=count)
+    clause_break = np.fromiter(map(CLAUSE_BREAK_TOKENS.__contains__, tokens), dtype=bool, count=count)
+    title_of = np.repeat(np.arange(len(titles)), lengths)
+
+    # A token is negated by the latest negator before it, if that is within
+    # the window, in the same title and not behind a clause break
+    position = np.arange(len(tokens))
+    last_negator = np.maximum.accumulate(np.where(negator, position, -1))
+    previous = np.concatenate(([-1], last_negator[:-1]))
+    last_break = np.maximum.accumulate(np.where(clause_break, position, -1))
+    negated = ((previous > last_break)
+               & (position - previous <= NEGATION_WINDOW)
+               & (title_of[np.maximum(previous, 0)] == title_of))
+    weights = np.where(negated, weights * NEGATION_SCALAR, weights)
+
+    totals = np.bincount(title_of, weights=weights, minlength=len(titles))
+    return totals / np.sqrt(totals * totals + COMPOUND_ALPHA)
+
+
+def sentiment_label(score: float) -> str:
+    if score >= POSITIVE_THRESHOLD:
+        return "positive"
+    if score <= NEGATIVE_THRESHOLD:
+        return "negative"
+    return "neutral"
+
+
+def score_news(news: list) -> list:
+    """Set each item's "sentiment" score and "sentiment_label"."""
+    scores = score_titles([item.get("title", "") for item in news]) if news else []
+    for item, score in zip(news, scores):
+        item["sentiment"] = round(float(score), 3)
+        item["sentiment_label"] = sentiment_label(item["sentiment"])
+    return news
+
+
+def aggregate_sentiment(news: list) -> dict:
+    """
+    Aggregate sentiment of scored news items (see score_news).
+
+    Returns:
+        Mean score, its label and the count of items per label
+    """
+    scores = [item["sentiment"] for item in news if item.get("sentiment") is not None]
+    counts = {"positive": 0, "negative": 0, "neutral": 0}
+    for item in news:
+        if item.get("sentiment_label") in counts:
+            counts[item["sentiment_label"]] += 1
+    mean = round(sum(scores) / len(scores), 3) if scores else 0.0
+    return {"items": len(scores), "mean": mean, "label": sentiment_label(mean), **counts}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score headline sentiment")
+    parser.add_argument("headlines", nargs="*", help="Headlines to score")
+    parser.add_argument("--file", help="File with one headline per line")
+    parser.add_argument("--output", choices=["json", "markdown"], default="markdown",
+                        help="Output format")
+
+    args = parser.parse_args()
+
+    headlines = list(args.headlines)
+    if args.file:
+        with open(args.file) as f:
+            headlines.extend(line.strip() for line in f if line.strip())
+    if not headlines:
+        parser.error("No headlines given")
+
+    news = score_news([{"title": h} for h in headlines])
+    summary = aggregate_sentiment(news)
+
+    if args.output == "json":
+        print(json.dumps({"news": news, "sentiment": summary}, indent=2))
+        return
+
+    print("| Score | Label | Headline |")
+    print("|-------|-------|----------|")
+    for item in news:
+        title = item["title"].replace("|", "\\|")
+        print(f"| {item['sentiment']:+.3f} | {item['sentiment_label']} | {title} |")
+    print(f"\n**Aggregate:** {summary['mean']:+.3f} ({summary['label']}) - "
+          f"{summary['positive']} positive, {summary['negative']} negative, {summary['neutral']} neutral")
+
+
+if __name__ == "__main__":
+    main()
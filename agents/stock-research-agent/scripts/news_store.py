@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+News Store
+Remembers which news items have already been seen, per ticker and across tickers.
+
+Each ticker has a high-water mark (latest providerPublishTime returned,
+held back while a limit leaves older items unread); items
+older than the mark, items whose uuid was already returned, and headlines
+that normalize to one already seen under any ticker (syndicated stories) are
+filtered out. Repeated polling of the watchlist then only surfaces news the
+agent hasn't read.
+
+Usage:
+    python news_store.py [--reset [TICKER]]
+
+Examples:
+    python news_store.py             # show per-ticker cursors
+    python news_store.py --reset GOLF
+    python news_store.py --reset     # forget everything
+
+From code:
+    from news_store import get_news_store
+    fresh = get_news_store().filter_new("GOLF", news)
+"""
+
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from response_cache import SOURCES_DIR
+from yahoo_news import WORD_SEPARATORS
+
+NEWS_DIR = Path(os.environ.get("STOCK_RESEARCH_NEWS_DIR", SOURCES_DIR / "news"))
+NEWS_DB_PATH = NEWS_DIR / "news.sqlite"
+
+# Seen headlines are kept this long; older stories are past every cursor anyway
+HEADLINE_RETENTION = 90 * 86400
+
+# Words dropped before hashing, so "Acushnet to Report Q3 Results" and
+# "Acushnet reports Q3 results" variants of a wire story hash alike
+HEADLINE_STOPWORDS = frozenset(["a", "an", "the", "to", "of", "in", "on", "for", "and", "at",
+                                "as", "by", "with", "is", "its"])
+
+
+def headline_key(title: str) -> str:
+    """Hash of a headline with case, punctuation, stopwords and publisher suffix removed."""
+    title = (title or "").lower()
+    # "Headline - Reuters" / "Headline | Barron's"
+    for separator in (" - ", " | ", " — "):
+        head, sep, _ = title.rpartition(separator)
+        if sep and len(head) > 20:
+            title = head
+            break
+    words = [w.rstrip("s") for w in title.translate(WORD_SEPARATORS).split()
+             if w not in HEADLINE_STOPWORDS]
+    return hashlib.sha1(" ".join(words).encode()).hexdigest()[:20]
+
+
+class NewsStore:
+    """SQLite store of per-ticker news cursors and seen headlines."""
+
+    def __init__(self, path: Path = NEWS_DB_PATH):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite connections are not shareable."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cursors (
+                    ticker TEXT PRIMARY KEY,
+                    publish_time INTEGER NOT NULL,
+                    polled_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS headlines (
+                    key TEXT PRIMARY KEY,
+                    uuid TEXT,
+                    ticker TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    publish_time INTEGER,
+                    seen_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_headlines_uuid ON headlines (uuid)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_headlines_seen ON headlines (seen_at)")
+            self._local.conn = conn
+        return conn
+
+    def cursor(self, ticker: str) -> int:
+        """Publish time (epoch seconds) of the newest item returned for a ticker, or 0."""
+        row = self._conn().execute(
+            "SELECT publish_time FROM cursors WHERE ticker = ?", (ticker.upper(),)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def filter_new(self, ticker: str, news: List[dict], limit: int = None) -> List[dict]:
+        """
+        Items the agent hasn't seen, and record them as seen.
+
+        An item is new if it is not older than the ticker's cursor and
+        neither its uuid nor its normalized headline has been returned
+        before (for any ticker). Only the items returned (up to limit) are
+        recorded. The cursor moves to the newest of them, but never past an
+        item the limit left unexamined, so those come back on the next poll.
+
+        Args:
+            ticker: Stock ticker symbol
+            news: Items from get_stock_news (uuid, publish_time, title)
+            limit: Maximum number of items to return
+
+        Returns:
+            New items, in the order given
+        """
+        ticker = ticker.upper()
+        conn = self._conn()
+        with self._write_lock:
+            mark = self.cursor(ticker)
+            fresh = []
+            keys = set()
+            unexamined = []
+            for position, item in enumerate(news):
+                if limit is not None and len(fresh) >= limit:
+                    unexamined = news[position:]
+                    break
+                publish_time = item.get("publish_time") or 0
+                uuid = item.get("uuid") or None
+                key = headline_key(item.get("title", ""))
+                if publish_time and publish_time < mark:
+                    continue
+                if key in keys:
+                    continue
+                seen = conn.execute(
+                    "SELECT 1 FROM headlines WHERE key = ? OR (uuid IS NOT NULL AND uuid = ?)",
+                    (key, uuid)
+                ).fetchone()
+                if seen:
+                    continue
+                keys.add(key)
+                fresh.append((key, uuid, item))
+
+            now = time.time()
+            conn.executemany(
+                "INSERT OR IGNORE INTO headlines VALUES (?, ?, ?, ?, ?, ?)",
+                [(key, uuid, ticker, item.get("title", ""), item.get("publish_time"), now)
+                 for key, uuid, item in fresh]
+            )
+            # Items the limit left unexamined must stay at or after the cursor
+            newest = max([item.get("publish_time") or 0 for _, _, item in fresh] + [mark])
+            pending = [item.get("publish_time") for item in unexamined if item.get("publish_time")]
+            if pending:
+                newest = max(mark, min([newest] + pending))
+            conn.execute("INSERT OR REPLACE INTO cursors VALUES (?, ?, ?)", (ticker, newest, now))
+            conn.execute("DELETE FROM headlines WHERE seen_at < ?", (now - HEADLINE_RETENTION,))
+            conn.commit()
+
+        return [item for _, _, item in fresh]
+
+    def reset(self, ticker: str = None):
+        """Forget the cursor and seen headlines for one ticker, or everything."""
+        conn = self._conn()
+        with self._write_lock:
+            if ticker:
+                conn.execute("DELETE FROM cursors WHERE ticker = ?", (ticker.upper(),))
+                conn.execute("DELETE FROM headlines WHERE ticker = ?", (ticker.upper(),))
+            else:
+                conn.execute("DELETE FROM cursors")
+                conn.execute("DELETE FROM headlines")
+            conn.commit()
+
+    def stats(self) -> dict:
+        """Cursor and seen-headline count per ticker."""
+        conn = self._conn()
+        counts = dict(conn.execute("SELECT ticker, COUNT(*) FROM headlines GROUP BY ticker").fetchall())
+        return {ticker: {"cursor": publish_time, "polled_at": polled_at, "headlines": counts.get(ticker, 0)}
+                for ticker, publish_time, polled_at in
+                conn.execute("SELECT ticker, publish_time, polled_at FROM cursors ORDER BY ticker")}
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_news_store() -> NewsStore:
+    """Return the process-wide news store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = NewsStore()
+        return _store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or reset the seen-news store")
+    parser.add_argument("--reset", nargs="?", const="", default=None, metavar="TICKER",
+                        help="Forget seen news for TICKER (or all tickers)")
+
+    args = parser.parse_args()
+    store = get_news_store()
+
+    if args.reset is not None:
+        store.reset(args.reset or None)
+        print(f"Reset {args.reset.upper() or 'all tickers'}", file=sys.stderr)
+
+    print(f"Store: {store.path}")
+    print("| Ticker | Latest Seen | Last Poll | Headlines |")
+    print("|--------|-------------|-----------|-----------|")
+    for ticker, s in store.stats().items():
+        latest = datetime.fromtimestamp(s["cursor"]).strftime("%Y-%m-%d %H:%M") if s["cursor"] else "-"
+        polled = datetime.fromtimestamp(s["polled_at"]).strftime("%Y-%m-%d %H:%M")
+        print(f"| {ticker} | {latest} | {polled} | {s['headlines']} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Price History Store
+Local daily OHLCV bars per ticker, synced incrementally from Yahoo Finance.
+
+Each ticker is backfilled once (10 years by default) and saved as one NumPy
+.npz (memory/sources/prices/TICKER.npz): a datetime64 date column plus a
+float column per field. Later syncs fetch only the days after the last
+stored bar; if Yahoo has re-adjusted history since (a split or dividend
+changes past adjusted closes), the ticker is backfilled again. load_matrix
+reads many tickers into one date-aligned 2-D array, so analytics run on
+local data without waiting on the network.
+
+Usage:
+    python price_history.py sync TICKER [TICKER ...] [--period 10y] [--force]
+    python price_history.py show TICKER [--days 10]
+    python price_history.py stats
+
+Examples:
+    python price_history.py sync GOLF AAPL MSFT SPY
+    python price_history.py show GOLF --days 5
+
+From code:
+    from price_history import load_matrix
+    matrix = load_matrix(["GOLF", "AAPL"], field="adj_close")
+    matrix.values   # (days, tickers), NaN where a ticker has no bar
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from response_cache import SOURCES_DIR
+from ticker_snapshot import DEFAULT_MAX_WORKERS, get_snapshot, map_tickers
+
+PRICES_DIR = Path(os.environ.get("STOCK_RESEARCH_PRICES_DIR", SOURCES_DIR / "prices"))
+
+# Stored columns and the yfinance history() columns they come from
+PRICE_FIELDS = {
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "adj_close": "Adj Close",
+    "volume": "Volume",
+}
+BACKFILL_PERIOD = "10y"
+SYNC_INTERVAL = 3600  # a ticker synced within the last hour is left alone
+ADJUSTMENT_TOLERANCE = 1e-4  # relative change in a past adj close that forces a backfill
+
+
+@dataclass
+class PriceHistory:
+    """Daily bars for one ticker: a date column plus one float column per field."""
+    ticker: str
+    dates: "np.ndarray"  # datetime64[D], ascending
+    columns: Dict[str, "np.ndarray"]
+    synced_at: float = field(default_factory=time.time)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def last_date(self) -> Optional["np.datetime64"]:
+        return self.dates[-1] if len(self.dates) else None
+
+
+@dataclass
+class PriceMatrix:
+    """Many tickers' values for one field on a shared date axis."""
+    tickers: List[str]
+    dates: "np.ndarray"   # datetime64[D], ascending union of all tickers' dates
+    values: "np.ndarray"  # (dates, tickers); NaN where a ticker has no bar
+    price_field: str = "adj_close"
+    missing: List[str] = field(default_factory=list)  # tickers not in the store
+
+
+def _store_path(ticker: str) -> Path:
+    return PRICES_DIR / f"{ticker.upper().replace('/', '-')}.npz"
+
+
+def save_history(history: PriceHistory) -> Path:
+    """Write a ticker's bars to the store atomically."""
+    path = _store_path(history.ticker)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp.npz")
+    np.savez(tmp, ticker=np.array(history.ticker), synced_at=np.array(history.synced_at),
+             dates=history.dates, **{f"f_{name}": column for name, column in history.columns.items()})
+    os.replace(tmp, path)
+    return path
+
+
+def load_history(ticker: str) -> Optional[PriceHistory]:
+    """Stored bars for a ticker, or None if it hasn't been synced."""
+    if not NUMPY_AVAILABLE:
+        return None
+    path = _store_path(ticker)
+    if not path.exists():
+        return None
+    with np.load(path, allow_pickle=False) as stored:
+        return PriceHistory(
+            ticker=str(stored["ticker"]),
+            dates=stored["dates"],
+            columns={key[2:]: stored[key] for key in stored.files if key.startswith("f_")},
+            synced_at=float(stored["synced_at"]),
+        )
+
+
+def _download(ticker: str, start: "np.datetime64" = None, period: str = BACKFILL_PERIOD) -> PriceHistory:
+    """Daily bars from Yahoo, from start (inclusive) or over period."""
+    stock = get_snapshot(ticker).stock
+    if start is not None:
+        frame = stock.history(start=str(start), interval="1d", auto_adjust=False, actions=False)
+    else:
+        frame = stock.history(period=period, interval="1d", auto_adjust=False, actions=False)
+
+    if frame is None or frame.empty:
+        return PriceHistory(ticker.upper(), np.array([], dtype="datetime64[D]"),
+                            {name: np.array([], dtype=np.float64) for name in PRICE_FIELDS})
+
+    index = frame.index
+    if getattr(index, "tz", None) is not None:
+        index = index.tz_localize(None)
+    dates = index.values.astype("datetime64[D]")
+    columns = {}
+    for name, source in PRICE_FIELDS.items():
+        if source in frame.columns:
+            columns[name] = frame[source].to_numpy(dtype=np.float64)
+        elif name == "adj_close" and "Close" in frame.columns:
+            columns[name] = frame["Close"].to_numpy(dtype=np.float64)
+        else:
+            columns[name] = np.full(len(dates), np.nan)
+
+    # One bar per day, ascending
+    dates, first = np.unique(dates[::-1], return_index=True)
+    keep = len(index) - 1 - first
+    return PriceHistory(ticker.upper(), dates, {name: col[keep] for name, col in columns.items()})
+
+
+def _adjustments_changed(stored: PriceHistory, fresh: PriceHistory) -> bool:
+    """True if a bar both copies have (before the last stored one) was re-adjusted."""
+    common, in_stored, in_fresh = np.intersect1d(stored.dates[:-1], fresh.dates, return_indices=True)
+    if not len(common):
+        return False
+    old = stored.columns["adj_close"][in_stored]
+    new = fresh.columns["adj_close"][in_fresh]
+    valid = np.isfinite(old) & np.isfinite(new) & (old != 0)
+    return bool(np.any(np.abs(new[valid] / old[valid] - 1) > ADJUSTMENT_TOLERANCE))
+
+
+def sync_ticker(ticker: str, period: str = BACKFILL_PERIOD, force: bool = False) -> PriceHistory:
+    """
+    Bring a ticker's stored bars up to date.
+
+    The first sync backfills period. After that only bars from the second
+    to last stored day onward are fetched: that day checks for
+    re-adjustment, and the last day replaces a possibly intraday bar.
+
+    Args:
+        ticker: Stock ticker symbol
+        period: Backfill period for yfinance (e.g. "10y", "max")
+        force: Backfill again even if the store is current
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+
+    ticker = ticker.upper()
+    stored = None if force else load_history(ticker)
+    if stored is not None and time.time() - stored.synced_at < SYNC_INTERVAL:
+        return stored
+
+    if stored is None or len(stored) < 2:
+        history = _download(ticker, period=period)
+        if not len(history):
+            raise ValueError(f"No price history for {ticker}")
+    else:
+        fresh = _download(ticker, start=stored.dates[-2])
+        if _adjustments_changed(stored, fresh):
+            print(f"{ticker}: history re-adjusted since last sync, backfilling", file=sys.stderr)
+            history = _download(ticker, period=period)
+        else:
+            keep = stored.dates < fresh.dates[0] if len(fresh) else np.ones(len(stored), dtype=bool)
+            history = PriceHistory(
+                ticker,
+                np.concatenate([stored.dates[keep], fresh.dates]),
+                {name: np.concatenate([stored.columns[name][keep], fresh.columns[name]])
+                 for name in PRICE_FIELDS},
+            )
+
+    history.synced_at = time.time()
+    save_history(history)
+    return history
+
+
+def sync_tickers(tickers: List[str], period: str = BACKFILL_PERIOD, force: bool = False,
+                 max_workers: int = DEFAULT_MAX_WORKERS) -> dict:
+    """
+    Sync many tickers concurrently.
+
+    Returns:
+        {ticker: number of stored bars, or an error string}
+    """
+    results = {}
+    for ticker, history, error in map_tickers(lambda t: sync_ticker(t, period, force),
+                                              [t.upper() for t in tickers], max_workers):
+        if error is not None:
+            print(f"Warning: {ticker}: {error}", file=sys.stderr)
+            results[ticker] = str(error)
+        else:
+            results[ticker] = len(history)
+    return results
+
+
+def load_matrix(tickers: List[str], field: str = "adj_close",
+                start: str = None, end: str = None) -> PriceMatrix:
+    """
+    Read many tickers' stored bars into one date-aligned 2-D array.
+
+    Nothing is fetched: tickers missing from the store get an all-NaN
+    column and are listed in .missing.
+
+    Args:
+        tickers: Ticker symbols (column order)
+        field: open, high, low, close, adj_close or volume
+        start, end: Optional inclusive date bounds (YYYY-MM-DD)
+    """
+    return load_matrices(tickers, [field], start, end)[field]
+
+
+def load_matrices(tickers: List[str], fields: List[str],
+                  start: str = None, end: str = None) -> Dict[str, PriceMatrix]:
+    """
+    load_matrix for several fields, reading each ticker's store file once.
+
+    Returns:
+        {field: PriceMatrix}, all on the same date axis
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+    for field in fields:
+        if field not in PRICE_FIELDS:
+            raise ValueError(f"Unknown field {field}; use one of {', '.join(PRICE_FIELDS)}")
+
+    tickers = [t.upper() for t in tickers]
+    histories = [load_history(t) for t in tickers]
+    missing = [t for t, h in zip(tickers, histories) if h is None]
+    if missing:
+        print(f"Warning: no stored prices for {', '.join(missing)} (run price_history.py sync)",
+              file=sys.stderr)
+
+    present = [h for h in histories if h is not None]
+    dates = (np.unique(np.concatenate([h.dates for h in present]))
+             if present else np.array([], dtype="datetime64[D]"))
+    if start:
+        dates = dates[dates >= np.datetime64(start, "D")]
+    if end:
+        dates = dates[dates <= np.datetime64(end, "D")]
+
+    matrices = {field: PriceMatrix(tickers, dates, np.full((len(dates), len(tickers)), np.nan),
+                                   field, missing)
+                for field in fields}
+    for col, history in enumerate(histories):
+        if history is None or not len(dates):
+            continue
+        rows = np.searchsorted(dates, history.dates)
+        inside = (rows < len(dates))
+        inside[inside] = dates[rows[inside]] == history.dates[inside]
+        for field, matrix in matrices.items():
+            matrix.values[rows[inside], col] = history.columns[field][inside]
+
+    return matrices
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local daily price history store")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sync = sub.add_parser("sync", help="Backfill or update tickers")
+    sync.add_argument("tickers", nargs="+", help="Stock ticker symbols")
+    sync.add_argument("--period", default=BACKFILL_PERIOD,
+                      help=f"Backfill period for new tickers (default: {BACKFILL_PERIOD})")
+    sync.add_argument("--force", action="store_true", help="Backfill again from scratch")
+    sync.add_argument("--max-workers", type=int, default=DEFAULT_MAX_WORKERS,
+                      help=f"Tickers fetched concurrently (default: {DEFAULT_MAX_WORKERS})")
+
+    show = sub.add_parser("show", help="Show the latest stored bars")
+    show.add_argument("ticker", help="Stock ticker symbol")
+    show.add_argument("--days", type=int, default=10, help="Bars to show (default: 10)")
+    show.add_argument("--output", choices=["json", "markdown"], default="markdown",
+                      help="Output format")
+
+    sub.add_parser("stats", help="Show stored tickers and date ranges")
+
+    args = parser.parse_args()
+
+    if args.command == "sync":
+        for ticker, result in sync_tickers(args.tickers, args.period, args.force, args.max_workers).items():
+            print(f"{ticker}: {result if isinstance(result, str) else f'{result} bars'}")
+    elif args.command == "show":
+        history = load_history(args.ticker)
+        if history is None:
+            print(f"No stored prices for {args.ticker.upper()}. Run: python price_history.py sync {args.ticker.upper()}")
+            sys.exit(1)
+        rows = [{"date": str(d), **{name: float(history.columns[name][i]) for name in PRICE_FIELDS}}
+                for i, d in enumerate(history.dates[-args.days:], start=max(0, len(history) - args.days))]
+        if args.output == "json":
+            print(json.dumps(rows, indent=2))
+            return
+        print(f"# {history.ticker} Daily Bars ({len(history)} stored)")
+        print("")
+        print("| Date | Open | High | Low | Close | Adj Close | Volume |")
+        print("|------|------|------|-----|-------|-----------|--------|")
+        for r in rows:
+            print(f"| {r['date']} | {r['open']:.2f} | {r['high']:.2f} | {r['low']:.2f} | "
+                  f"{r['close']:.2f} | {r['adj_close']:.2f} | {r['volume']:,.0f} |")
+    else:
+        print(f"Store: {PRICES_DIR}")
+        print("| Ticker | Bars | First | Last | Synced |")
+        print("|--------|------|-------|------|--------|")
+        for path in sorted(PRICES_DIR.glob("*.npz")) if PRICES_DIR.exists() else []:
+            history = load_history(path.stem)
+            if history is None or not len(history):
+                continue
+            synced = date.fromtimestamp(history.synced_at).isoformat()
+            print(f"| {history.ticker} | {len(history)} | {history.dates[0]} | {history.last_date} | {synced} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Response Cache
+Persistent SQLite-backed TTL cache for yfinance and SEC responses.
+
+Entries live under the agent workspace (memory/sources/cache/) so repeat
+research sessions run from local disk. Each dataset has its own TTL and the
+whole cache is size-bounded with least-recently-used eviction.
+
+Usage:
+    python response_cache.py [--clear [DATASET]]
+
+Examples:
+    python response_cache.py              # show entries and size per dataset
+    python response_cache.py --clear info
+
+From code:
+    from response_cache import get_cache
+    info = get_cache().get_or_fetch("info", "GOLF", lambda: stock.info)
+"""
+
+import argparse
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+WORKSPACE_DIR = Path(__file__).resolve().parent.parent
+# Root for all locally stored source data (caches, SEC indexes, stores)
+SOURCES_DIR = Path(os.environ.get("STOCK_RESEARCH_SOURCES_DIR",
+                                  WORKSPACE_DIR / "memory" / "sources"))
+CACHE_DIR = Path(os.environ.get("STOCK_RESEARCH_CACHE_DIR", SOURCES_DIR / "cache"))
+CACHE_PATH = CACHE_DIR / "responses.sqlite"
+
+# Time-to-live per dataset, in seconds
+DATASET_TTLS = {
+    "quote": 30,
+    "news": 15 * 60,
+    "info": 6 * 3600,
+    "recommendations": 12 * 3600,
+    "statements": 3 * 86400,
+    "sec_submissions": 3600,
+}
+DEFAULT_TTL = 3600
+
+MAX_CACHE_BYTES = int(os.environ.get("STOCK_RESEARCH_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+# Cache modes
+MODE_NORMAL = "normal"    # read and write
+MODE_REFRESH = "refresh"  # skip reads, write fresh values
+MODE_OFF = "off"          # neither read nor write
+
+MISS = object()
+
+
+class ResponseCache:
+    """SQLite key/value store with per-dataset TTLs and LRU size bounding."""
+
+    def __init__(self, path: Path = CACHE_PATH, max_bytes: int = MAX_CACHE_BYTES,
+                 mode: str = MODE_NORMAL):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite connections are not shareable."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    dataset TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (dataset, key)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)")
+            self._local.conn = conn
+        return conn
+
+    def get(self, dataset: str, key: str, ttl: float = None) -> Any:
+        """Return the cached value, or MISS if absent, expired or bypassed."""
+        if self.mode != MODE_NORMAL:
+            return MISS
+        if ttl is None:
+            ttl = DATASET_TTLS.get(dataset, DEFAULT_TTL)
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT value, created_at FROM entries WHERE dataset = ? AND key = ?",
+                (dataset, key)
+            ).fetchone()
+            if row is None:
+                return MISS
+            value, created_at = row
+            now = time.time()
+            if now - created_at > ttl:
+                return MISS
+            with self._write_lock:
+                conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE dataset = ? AND key = ?",
+                    (now, dataset, key)
+                )
+                conn.commit()
+            return pickle.loads(value)
+        except Exception as e:
+            print(f"Warning: cache read failed for {dataset}/{key}: {e}", file=sys.stderr)
+            return MISS
+
+    def set(self, dataset: str, key: str, value: Any):
+        """Store a value, evicting least-recently-used entries if over budget."""
+        if self.mode == MODE_OFF:
+            return
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            now = time.time()
+            conn = self._conn()
+            with self._write_lock:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                    (dataset, key, sqlite3.Binary(blob), len(blob), now, now)
+                )
+                self._evict(conn)
+                conn.commit()
+        except Exception as e:
+            print(f"Warning: cache write failed for {dataset}/{key}: {e}", file=sys.stderr)
+
+    def get_or_fetch(self, dataset: str, key: str, fetch: Callable[[], Any],
+                     ttl: float = None) -> Any:
+        """Return a cached value, calling fetch() and storing its result on a miss."""
+        value = self.get(dataset, key, ttl)
+        if value is MISS:
+            value = fetch()
+            if value is not None:
+                self.set(dataset, key, value)
+        return value
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least-recently-used entries until the cache fits in max_bytes."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Evict down to 90% so we don't evict on every subsequent write
+        target = self.max_bytes * 0.9
+        rows = conn.execute("SELECT dataset, key, size FROM entries ORDER BY accessed_at").fetchall()
+        for dataset, key, size in rows:
+            if total <= target:
+                break
+            conn.execute("DELETE FROM entries WHERE dataset = ? AND key = ?", (dataset, key))
+            total -= size
+
+    def stats(self) -> dict:
+        """Entry counts and bytes per dataset."""
+        rows = self._conn().execute(
+            "SELECT dataset, COUNT(*), COALESCE(SUM(size), 0) FROM entries GROUP BY dataset"
+        ).fetchall()
+        return {dataset: {"entries": count, "bytes": size} for dataset, count, size in rows}
+
+    def clear(self, dataset: str = None):
+        """Remove all entries (or all entries of one dataset)."""
+        conn = self._conn()
+        with self._write_lock:
+            if dataset:
+                conn.execute("DELETE FROM entries WHERE dataset = ?", (dataset,))
+            else:
+                conn.execute("DELETE FROM entries")
+            conn.commit()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache:
+    """Return the process-wide response cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
+
+
+def set_cache_mode(mode: str):
+    """Switch the process-wide cache between normal, refresh and off."""
+    get_cache().mode = mode
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser):
+    """Add the shared --no-cache/--refresh switches to a CLI parser."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--no-cache", action="store_true",
+                       help="Bypass the local response cache entirely")
+    group.add_argument("--refresh", action="store_true",
+                       help="Ignore cached responses and overwrite them with fresh data")
+
+
+def apply_cache_arguments(args: argparse.Namespace):
+    """Apply --no-cache/--refresh from parsed CLI arguments."""
+    if getattr(args, "no_cache", False):
+        set_cache_mode(MODE_OFF)
+    elif getattr(args, "refresh", False):
+        set_cache_mode(MODE_REFRESH)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the response cache")
+    parser.add_argument("--clear", nargs="?", const="", metavar="DATASET",
+                        help="Clear the cache (or just one dataset)")
+
+    args = parser.parse_args()
+    cache = get_cache()
+
+    if args.clear is not None:
+        cache.clear(args.clear or None)
+        print(f"Cleared {args.clear or 'all datasets'}")
+
+    stats = cache.stats()
+    print(f"Cache: {cache.path}")
+    print("| Dataset | Entries | Size |")
+    print("|---------|---------|------|")
+    for dataset, s in sorted(stats.items()):
+        print(f"| {dataset} | {s['entries']} | {s['bytes'] / 1024:.1f} KB |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Risk Metrics
+Risk and technical metrics computed locally from stored price history.
+
+Returns, rolling volatility, maximum drawdown, beta against a benchmark,
+moving averages and 52-week ranges are computed for many tickers at once:
+prices are loaded as one (days, tickers) matrix from price_history.py and
+every metric is a NumPy array operation over its columns, so hundreds of
+tickers take milliseconds and nothing waits on Yahoo. compare_stocks.py and
+fetch_stock_data.py use these in place of Yahoo's info fields with
+--local-prices.
+
+Usage:
+    python risk_metrics.py TICKER [TICKER ...] [--benchmark SPY]
+
+Examples:
+    python risk_metrics.py GOLF AAPL MSFT
+    python risk_metrics.py GOLF --benchmark IWM --output json
+
+Sync the tickers and the benchmark first:
+    python price_history.py sync GOLF AAPL MSFT SPY
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from price_history import load_matrices
+
+DEFAULT_BENCHMARK = os.environ.get("STOCK_RESEARCH_BENCHMARK", "SPY")
+
+TRADING_DAYS = 252
+VOLATILITY_WINDOW = 63  # ~3 months
+BETA_WINDOW = TRADING_DAYS
+RETURN_HORIZONS = {"return_1m": 21, "return_3m": 63, "return_6m": 126, "return_1y": TRADING_DAYS}
+MIN_COVERAGE = 0.8  # share of a window that must have data for a windowed metric
+
+# Keys compare_stocks.py takes from here with --local-prices
+LOCAL_RISK_KEYS = ("52_week_high", "52_week_low", "beta", "return_1y", "volatility_1y", "max_drawdown_1y")
+
+
+def daily_returns(prices: "np.ndarray") -> "np.ndarray":
+    """Simple daily returns of a (days, tickers) price matrix; NaN where a bar is missing."""
+    returns = np.full(prices.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns[1:] = prices[1:] / prices[:-1] - 1
+    return returns
+
+
+def _window_sums(values: "np.ndarray", window: int):
+    """Rolling sum, sum of squares and count of finite values over the last window rows."""
+    finite = np.isfinite(values)
+    filled = np.where(finite, values, 0.0)
+    zeros = np.zeros((1,) + values.shape[1:])
+    s1 = np.concatenate([zeros, np.cumsum(filled, axis=0)])
+    s2 = np.concatenate([zeros, np.cumsum(filled * filled, axis=0)])
+    n = np.concatenate([zeros, np.cumsum(finite, axis=0)])
+    start = np.maximum(np.arange(1, len(values) + 1) - window, 0)
+    end = np.arange(1, len(values) + 1)
+    return s1[end] - s1[start], s2[end] - s2[start], n[end] - n[start]
+
+
+def moving_average(prices: "np.ndarray", window: int) -> "np.ndarray":
+    """Simple moving average per column (NaN until the window is mostly filled)."""
+    total, _, count = _window_sums(prices, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(count >= window * MIN_COVERAGE, total / count, np.nan)
+
+
+def rolling_volatility(returns: "np.ndarray", window: int = VOLATILITY_WINDOW) -> "np.ndarray":
+    """Annualized rolling standard deviation of daily returns per column."""
+    total, squares, count = _window_sums(returns, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = (squares - total * total / count) / (count - 1)
+    variance = np.where(count >= window * MIN_COVERAGE, np.maximum(variance, 0.0), np.nan)
+    return np.sqrt(variance * TRADING_DAYS)
+
+
+def max_drawdown(prices: "np.ndarray") -> "np.ndarray":
+    """Largest peak-to-trough decline per column (negative fraction)."""
+    peaks = np.fmax.accumulate(np.where(np.isfinite(prices), prices, -np.inf), axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdowns = prices / peaks - 1
+    drawdowns = np.where(np.isfinite(drawdowns), drawdowns, np.nan)
+    return _nan_reduce(np.nanmin, drawdowns)
+
+
+def beta(returns: "np.ndarray", benchmark: "np.ndarray") -> "np.ndarray":
+    """Beta of each column's returns against a benchmark return series (pairwise complete days)."""
+    both = np.isfinite(returns) & np.isfinite(benchmark)[:, None]
+    count = both.sum(axis=0)
+    r = np.where(both, returns, 0.0)
+    b = np.where(both, benchmark[:, None], 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_r = r.sum(axis=0) / count
+        mean_b = b.sum(axis=0) / count
+        covariance = (r * b).sum(axis=0) / count - mean_r * mean_b
+        variance = (b * b).sum(axis=0) / count - mean_b * mean_b
+        result = covariance / variance
+    return np.where((count >= len(returns) * MIN_COVERAGE) & (variance > 0), result, np.nan)
+
+
+def _nan_reduce(func, values: "np.ndarray") -> "np.ndarray":
+    """func(values, axis=0) with all-NaN columns giving NaN instead of a warning."""
+    result = np.full(values.shape[1:], np.nan)
+    has_data = np.isfinite(values).any(axis=0)
+    if has_data.any():
+        result[has_data] = func(values[:, has_data], axis=0)
+    return result
+
+
+def _last_valid(values: "np.ndarray") -> "np.ndarray":
+    """Last finite value per column."""
+    finite = np.isfinite(values)
+    rows = len(values) - 1 - np.argmax(finite[::-1], axis=0)
+    result = values[rows, np.arange(values.shape[1])]
+    return np.where(finite.any(axis=0), result, np.nan)
+
+
+def compute_risk_metrics(tickers: List[str], benchmark: str = DEFAULT_BENCHMARK,
+                         as_of: str = None) -> Dict[str, dict]:
+    """
+    Risk and technical metrics for many tickers from the local price store.
+
+    Args:
+        tickers: Ticker symbols (must have been synced with price_history.py)
+        benchmark: Benchmark ticker for beta (also read from the store)
+        as_of: Optional last date (YYYY-MM-DD) to compute as of
+
+    Returns:
+        {ticker: metrics} for tickers with stored prices; values are None
+        where there is not enough history
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+
+    tickers = [t.upper() for t in tickers]
+    benchmark = benchmark.upper() if benchmark else None
+    columns = tickers + ([benchmark] if benchmark and benchmark not in tickers else [])
+
+    matrices = load_matrices(columns, ["adj_close", "close", "high", "low"], end=as_of)
+    adj = matrices["adj_close"]
+    if not len(adj.dates):
+        return {}
+    prices = adj.values
+    close = matrices["close"].values
+    high = matrices["high"].values
+    low = matrices["low"].values
+    returns = daily_returns(prices)
+    year = slice(-TRADING_DAYS, None)
+
+    metrics = {
+        "price": _last_valid(close),
+        "52_week_high": _nan_reduce(np.nanmax, high[year]),
+        "52_week_low": _nan_reduce(np.nanmin, low[year]),
+        "sma_50": _last_valid(moving_average(close, 50)),
+        "sma_200": _last_valid(moving_average(close, 200)),
+        "volatility_3m": _last_valid(rolling_volatility(returns, VOLATILITY_WINDOW)),
+        "volatility_1y": _last_valid(rolling_volatility(returns, TRADING_DAYS)),
+        "max_drawdown_1y": max_drawdown(prices[year]),
+        "max_drawdown": max_drawdown(prices),
+    }
+    last = _last_valid(prices)
+    for key, days in RETURN_HORIZONS.items():
+        if len(prices) > days:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                metrics[key] = last / prices[-days - 1] - 1
+        else:
+            metrics[key] = np.full(len(columns), np.nan)
+
+    metrics["beta"] = np.full(len(columns), np.nan)
+    if benchmark and benchmark not in adj.missing:
+        bench_returns = returns[:, columns.index(benchmark)]
+        metrics["beta"] = beta(returns[-BETA_WINDOW:], bench_returns[-BETA_WINDOW:])
+
+    as_of_date = str(adj.dates[-1])
+    results = {}
+    for col, ticker in enumerate(tickers):
+        if ticker in adj.missing:
+            continue
+        row = {"ticker": ticker, "as_of": as_of_date, "benchmark": benchmark}
+        for key, values in metrics.items():
+            value = float(values[col])
+            row[key] = value if np.isfinite(value) else None
+        results[ticker] = row
+    return results
+
+
+def format_risk_markdown(results: Dict[str, dict]) -> str:
+    """Format risk metrics as a markdown table."""
+    def pct(v):
+        return f"{v:.1%}" if v is not None else "N/A"
+
+    def price(v):
+        return f"${v:.2f}" if v is not None else "N/A"
+
+    lines = []
+    lines.append("# Risk Metrics")
+    lines.append(f"\n**Generated:** {datetime.now().isoformat()}")
+    first = next(iter(results.values()), None)
+    if first:
+        lines.append(f"\n**Source:** Local price history as of {first['as_of']} (beta vs {first['benchmark']}, 1y daily)")
+    lines.append("")
+
+    if not results:
+        lines.append("No stored prices. Sync first: `python scripts/price_history.py sync TICKER`")
+        return "\n".join(lines)
+
+    lines.append("| Ticker | Price | 52W Low | 52W High | 1M | 1Y | Vol (3M) | Vol (1Y) | Max DD (1Y) | Beta | SMA 50 | SMA 200 |")
+    lines.append("|--------|-------|---------|----------|----|----|----------|----------|-------------|------|--------|---------|")
+    for r in results.values():
+        b = f"{r['beta']:.2f}" if r["beta"] is not None else "N/A"
+        lines.append(f"| {r['ticker']} | {price(r['price'])} | {price(r['52_week_low'])} | {price(r['52_week_high'])} | "
+                     f"{pct(r['return_1m'])} | {pct(r['return_1y'])} | {pct(r['volatility_3m'])} | "
+                     f"{pct(r['volatility_1y'])} | {pct(r['max_drawdown_1y'])} | {b} | "
+                     f"{price(r['sma_50'])} | {price(r['sma_200'])} |")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Risk metrics from local price history")
+    parser.add_argument("tickers", nargs="+", help="Stock ticker symbols")
+    parser.add_argument("--benchmark", default=DEFAULT_BENCHMARK,
+                        help=f"Benchmark for beta (default: {DEFAULT_BENCHMARK})")
+    parser.add_argument("--as-of", help="Compute as of this date (YYYY-MM-DD)")
+    parser.add_argument("--output", choices=["json", "markdown"], default="markdown",
+                        help="Output format")
+
+    args = parser.parse_args()
+
+    results = compute_risk_metrics(args.tickers, args.benchmark, args.as_of)
+    if not results:
+        print("Error: none of the tickers have stored prices", file=sys.stderr)
+
+    if args.output == "json":
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_risk_markdown(results))
+
+
+if __name__ == "__main__":
+    main()
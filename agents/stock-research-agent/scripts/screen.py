@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+"""
+Stock Screener
+Filter and rank expressions over a local, column-oriented snapshot table.
+
+`build` fetches compare_stocks.fetch_comparison_data for many tickers (a
+list, a file, or SEC's whole US-listed universe) and stores it as one
+float column per metric (memory/sources/screen/snapshot.npz). Screens run
+against that table only: an expression is parsed once with `ast`, checked
+against a small whitelist and evaluated as NumPy operations over whole
+columns, so screening thousands of tickers takes milliseconds.
+
+Metric names are the keys of fetch_comparison_data (pe_forward,
+revenue_growth, debt_equity, 52_week_high, ...) with Yahoo's units: margins
+and growth are fractions, debt_equity is a percentage. A missing value fails
+every comparison.
+
+Usage:
+    python screen.py build [TICKER ...] [--file PATH] [--universe] [--max-age 86400] [--local-prices]
+    python screen.py run FILTER [--rank EXPR] [--ascending] [--top 25] [--columns KEY ...]
+    python screen.py columns
+
+Examples:
+    python screen.py build --universe
+    python screen.py run "pe_forward < 15 and revenue_growth > 0.1 and debt_equity < 50"
+    python screen.py run "market_cap > 2e9" --rank "fcf / market_cap" --top 10
+    python screen.py run "10 < pe_trailing < 20 or roe > 0.25" --rank pe_trailing --ascending
+"""
+
+import argparse
+import ast
+import json
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# compare_stocks (and yfinance behind it) is imported by build only, so a
+# screen starts in a fraction of a second
+from response_cache import SOURCES_DIR, add_cache_arguments, apply_cache_arguments
+
+SCREEN_DIR = Path(os.environ.get("STOCK_RESEARCH_SCREEN_DIR", SOURCES_DIR / "screen"))
+SNAPSHOT_PATH = SCREEN_DIR / "snapshot.npz"
+
+SNAPSHOT_MAX_AGE = 86400  # build skips tickers refreshed within a day
+BUILD_CHUNK = 200  # tickers fetched between saves, so a long build can resume
+DEFAULT_TOP = 25
+
+# Elementwise functions allowed in expressions
+FUNCTIONS = {
+    "abs": np.abs if NUMPY_AVAILABLE else None,
+    "log": np.log if NUMPY_AVAILABLE else None,
+    "min": np.fmin if NUMPY_AVAILABLE else None,
+    "max": np.fmax if NUMPY_AVAILABLE else None,
+}
+
+COMPARISONS = {
+    ast.Lt: "__lt__", ast.LtE: "__le__", ast.Gt: "__gt__",
+    ast.GtE: "__ge__", ast.Eq: "__eq__", ast.NotEq: "__ne__",
+}
+ARITHMETIC = {
+    ast.Add: "__add__", ast.Sub: "__sub__", ast.Mult: "__mul__",
+    ast.Div: "__truediv__", ast.Pow: "__pow__",
+}
+
+
+@dataclass
+class SnapshotTable:
+    """Comparison metrics for many tickers, one float column per metric."""
+    tickers: "np.ndarray"     # str, sorted
+    names: "np.ndarray"       # str
+    fetched_at: "np.ndarray"  # epoch seconds per ticker
+    columns: Dict[str, "np.ndarray"]  # metric -> float64, NaN when missing
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value) if value is not None else np.nan
+    except (TypeError, ValueError):
+        return np.nan  # "N/A"
+
+
+def rows_to_table(rows: List[dict], fetched_at: float = None) -> SnapshotTable:
+    """Column-orient fetch_comparison_data rows (every numeric key becomes a column)."""
+    keys = sorted({k for row in rows for k, v in row.items()
+                   if k not in ("ticker", "name") and _to_float(v) == _to_float(v)})
+    order = sorted(range(len(rows)), key=lambda i: rows[i]["ticker"])
+    rows = [rows[i] for i in order]
+    return SnapshotTable(
+        tickers=np.array([r["ticker"] for r in rows], dtype=str),
+        names=np.array([str(r.get("name") or r["ticker"]) for r in rows], dtype=str),
+        fetched_at=np.full(len(rows), fetched_at or time.time()),
+        columns={k: np.array([_to_float(r.get(k)) for r in rows], dtype=np.float64) for k in keys},
+    )
+
+
+def merge_tables(base: Optional[SnapshotTable], update: SnapshotTable) -> SnapshotTable:
+    """Rows of update replace base's rows for the same tickers; columns are unioned."""
+    if base is None or not len(base):
+        return update
+    keep = ~np.isin(base.tickers, update.tickers)
+    tickers = np.concatenate([base.tickers[keep], update.tickers])
+    order = np.argsort(tickers, kind="stable")
+    columns = {}
+    for key in sorted(set(base.columns) | set(update.columns)):
+        old = base.columns.get(key, np.full(len(base), np.nan))[keep]
+        new = update.columns.get(key, np.full(len(update), np.nan))
+        columns[key] = np.concatenate([old, new])[order]
+    return SnapshotTable(
+        tickers=tickers[order],
+        names=np.concatenate([base.names[keep], update.names])[order],
+        fetched_at=np.concatenate([base.fetched_at[keep], update.fetched_at])[order],
+        columns=columns,
+    )
+
+
+def save_table(table: SnapshotTable, path: Path = SNAPSHOT_PATH) -> Path:
+    """Write the snapshot table atomically."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp.npz")
+    np.savez(tmp, tickers=table.tickers, names=table.names, fetched_at=table.fetched_at,
+             **{f"c_{key}": column for key, column in table.columns.items()})
+    os.replace(tmp, path)
+    return path
+
+
+_table = None  # (path, mtime, SnapshotTable)
+_table_lock = threading.Lock()
+
+
+def load_table(path: Path = SNAPSHOT_PATH) -> Optional[SnapshotTable]:
+    """The stored snapshot table (re-read only when the file changes), or None."""
+    global _table
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+    path = Path(path)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    with _table_lock:
+        if _table is None or _table[0] != path or _table[1] != mtime:
+            with np.load(path, allow_pickle=False) as stored:
+                table = SnapshotTable(
+                    tickers=stored["tickers"],
+                    names=stored["names"],
+                    fetched_at=stored["fetched_at"],
+                    columns={key[2:]: stored[key] for key in stored.files if key.startswith("c_")},
+                )
+            _table = (path, mtime, table)
+        return _table[2]
+
+
+def build_snapshot(tickers: List[str], max_age: float = SNAPSHOT_MAX_AGE,
+                   max_workers: int = None, local_prices: bool = False,
+                   path: Path = SNAPSHOT_PATH) -> dict:
+    """
+    Fetch comparison metrics for tickers into the snapshot table.
+
+    Tickers refreshed within max_age seconds are skipped. Fetches run
+    concurrently and the table is saved after every BUILD_CHUNK tickers,
+    so an interrupted universe build picks up where it stopped.
+
+    Returns:
+        Counts of updated, skipped and failed tickers, and the table size
+    """
+    from compare_stocks import apply_local_prices, fetch_comparison_data_batch
+    from ticker_snapshot import DEFAULT_MAX_WORKERS
+
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+    max_workers = max_workers or DEFAULT_MAX_WORKERS
+
+    table = load_table(path)
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+    if table is not None and max_age:
+        fresh = set(table.tickers[table.fetched_at > time.time() - max_age])
+        todo = [t for t in tickers if t not in fresh]
+    else:
+        todo = tickers
+
+    updated, failed = 0, 0
+    for start in range(0, len(todo), BUILD_CHUNK):
+        chunk = todo[start:start + BUILD_CHUNK]
+        data, errors = fetch_comparison_data_batch(chunk, max_workers)
+        for ticker, e in errors:
+            print(f"Warning: Could not fetch data for {ticker}: {e}", file=sys.stderr)
+        if local_prices and data:
+            apply_local_prices(data)
+        if data:
+            table = merge_tables(table, rows_to_table(data))
+            save_table(table, path)
+        updated += len(data)
+        failed += len(errors)
+        print(f"Snapshot: {start + len(chunk)}/{len(todo)} fetched", file=sys.stderr)
+
+    return {"updated": updated, "skipped": len(tickers) - len(todo), "failed": failed,
+            "total": len(table) if table is not None else 0}
+
+
+class Expression:
+    """
+    A screen expression compiled once and evaluated over table columns.
+
+    Allowed: metric names, numbers, + - * / **, comparisons (chainable),
+    and/or/not, and the functions abs, log, min, max. Anything else (
+    attribute access, subscripts, other calls) is rejected at parse time.
+    Metric names that start with a digit (52_week_high) work as written.
+    """
+
+    def __init__(self, text: str, columns):
+        self.text = text
+        self.columns = set(columns)
+        # "52_week_high" is not a Python name; give such metrics an alias
+        self._aliases = {}
+        source = text
+        for key in sorted(self.columns, key=len, reverse=True):
+            if not key.isidentifier():
+                alias = "_m_" + re.sub(r"\W", "_", key)
+                self._aliases[alias] = key
+                source = re.sub(rf"(?<![\w.]){re.escape(key)}(?!\w)", alias, source)
+        try:
+            self.tree = ast.parse(source.strip(), mode="eval").body
+        except SyntaxError as e:
+            raise ValueError(f"Invalid expression {text!r}: {e.msg}") from None
+        self.metrics = []
+        self._check(self.tree)
+
+    def _check(self, node):
+        if isinstance(node, ast.BoolOp):
+            for value in node.values:
+                self._check(value)
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.USub, ast.UAdd)):
+            self._check(node.operand)
+        elif isinstance(node, ast.Compare):
+            for op in node.ops:
+                if type(op) not in COMPARISONS:
+                    raise ValueError(f"Unsupported comparison in {self.text!r}")
+            for operand in [node.left] + node.comparators:
+                self._check(operand)
+        elif isinstance(node, ast.BinOp) and type(node.op) in ARITHMETIC:
+            self._check(node.left)
+            self._check(node.right)
+        elif isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords:
+                raise ValueError(f"Unsupported call in {self.text!r}; allowed: {', '.join(FUNCTIONS)}")
+            for arg in node.args:
+                self._check(arg)
+        elif isinstance(node, ast.Name):
+            name = self._aliases.get(node.id, node.id)
+            if name not in self.columns:
+                raise ValueError(f"Unknown metric {name!r} (see: python screen.py columns)")
+            if name not in self.metrics:
+                self.metrics.append(name)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            pass
+        else:
+            raise ValueError(f"Unsupported syntax {type(node).__name__} in {self.text!r}")
+
+    def evaluate(self, table: SnapshotTable) -> "np.ndarray":
+        """Value of the expression for every row (bool mask or float array)."""
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            return np.broadcast_to(self._eval(self.tree, table), (len(table),))
+
+    def _eval(self, node, table):
+        if isinstance(node, ast.BoolOp):
+            # Constant operands ("1 < 2") are scalars; give every operand a row each
+            values = [np.broadcast_to(self._mask(self._eval(v, table)), (len(table),))
+                      for v in node.values]
+            reduce = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            return reduce.reduce(values)
+        if isinstance(node, ast.UnaryOp):
+            value = self._eval(node.operand, table)
+            if isinstance(node.op, ast.Not):
+                return ~self._mask(value)
+            if np.asarray(value).dtype == bool:
+                raise ValueError(f"Unary {'-' if isinstance(node.op, ast.USub) else '+'} "
+                                 f"needs a number, not a comparison, in {self.text!r}")
+            return -value if isinstance(node.op, ast.USub) else value
+        if isinstance(node, ast.Compare):
+            left = np.asarray(self._eval(node.left, table))
+            result = True
+            for op, comparator in zip(node.ops, node.comparators):
+                right = np.asarray(self._eval(comparator, table))
+                # NaN != x is True; a missing value must fail every comparison
+                result = (result & getattr(left, COMPARISONS[type(op)])(right)
+                          & np.isfinite(left) & np.isfinite(right))
+                left = right
+            return result
+        if isinstance(node, ast.BinOp):
+            return getattr(np.asarray(self._eval(node.left, table), dtype=np.float64),
+                           ARITHMETIC[type(node.op)])(self._eval(node.right, table))
+        if isinstance(node, ast.Call):
+            return FUNCTIONS[node.func.id](*[self._eval(a, table) for a in node.args])
+        if isinstance(node, ast.Name):
+            return table.columns[self._aliases.get(node.id, node.id)]
+        return float(node.value)
+
+    @staticmethod
+    def _mask(value) -> "np.ndarray":
+        value = np.asarray(value)
+        if value.dtype != bool:
+            raise ValueError("and/or/not need comparisons (e.g. roe > 0.15)")
+        return value
+
+
+def screen(filter_expr: str = None, rank_expr: str = None, top: int = DEFAULT_TOP,
+           ascending: bool = False, columns: List[str] = None,
+           table: SnapshotTable = None) -> dict:
+    """
+    Filter and rank every ticker in the snapshot table.
+
+    Args:
+        filter_expr: Boolean expression, e.g. "pe_forward < 15 and roe > 0.15"
+            (None keeps every ticker)
+        rank_expr: Numeric expression to sort by, highest first unless
+            ascending (rows where it is missing sort last)
+        top: Rows returned (0 for all matches)
+        ascending: Sort lowest first
+        columns: Extra metrics to include in each row
+
+    Returns:
+        matched/total counts, elapsed seconds and the top rows (ticker, name,
+        rank value and every metric the expressions or columns mention)
+    """
+    if top < 0:
+        raise ValueError(f"top must be 0 (all matches) or more, got {top}")
+    started = time.perf_counter()
+    table = table if table is not None else load_table()
+    if table is None:
+        raise ValueError("No snapshot table. Build one first: python screen.py build --universe")
+
+    filter_ = Expression(filter_expr, table.columns) if filter_expr else None
+    rank = Expression(rank_expr, table.columns) if rank_expr else None
+    for key in columns or []:
+        if key not in table.columns:
+            raise ValueError(f"Unknown metric {key!r} (see: python screen.py columns)")
+
+    if filter_ is not None:
+        mask = filter_.evaluate(table)
+        if mask.dtype != bool:
+            raise ValueError(f"Filter {filter_expr!r} must be a comparison (e.g. pe_forward < 15)")
+        matched = np.flatnonzero(mask)
+    else:
+        matched = np.arange(len(table))
+
+    scores = None
+    if rank is not None:
+        scores = np.asarray(rank.evaluate(table), dtype=np.float64)[matched]
+        keys = np.where(np.isfinite(scores), scores if ascending else -scores, np.inf)
+        order = np.argsort(keys, kind="stable")
+        matched, scores = matched[order], scores[order]
+    if top:
+        matched = matched[:top]
+        scores = scores[:top] if scores is not None else None
+
+    shown = list(dict.fromkeys((filter_.metrics if filter_ else []) + (rank.metrics if rank else [])
+                               + list(columns or [])))
+    rows = []
+    for i, index in enumerate(matched):
+        row = {"ticker": str(table.tickers[index]), "name": str(table.names[index])}
+        if scores is not None:
+            row["rank"] = float(scores[i]) if np.isfinite(scores[i]) else None
+        for key in shown:
+            value = float(table.columns[key][index])
+            row[key] = value if np.isfinite(value) else None
+        rows.append(row)
+
+    return {
+        "filter": filter_expr,
+        "rank": rank_expr,
+        "matched": int(mask.sum()) if filter_ is not None else len(table),
+        "total": len(table),
+        "snapshot_age_days": round((time.time() - float(np.median(table.fetched_at))) / 86400, 1)
+        if len(table) else None,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        "columns": shown,
+        "rows": rows,
+    }
+
+
+def _format_metric(value) -> str:
+    if value is None:
+        return "N/A"
+    for scale, suffix in ((1e12, "T"), (1e9, "B"), (1e6, "M")):
+        if abs(value) >= scale:
+            return f"{value / scale:.1f}{suffix}"
+    return f"{value:.4g}"
+
+
+def format_screen_markdown(result: dict) -> str:
+    """Format a screen result as a markdown table."""
+    lines = []
+    lines.append("# Stock Screen")
+    lines.append("")
+    if result["filter"]:
+        lines.append(f"**Filter:** `{result['filter']}`")
+    if result["rank"]:
+        lines.append(f"**Rank:** `{result['rank']}`")
+    lines.append(f"**Matched:** {result['matched']} of {result['total']} tickers "
+                 f"(snapshot median age {result['snapshot_age_days']} days, {result['elapsed_ms']} ms)")
+    lines.append("")
+
+    if not result["rows"]:
+        lines.append("No tickers matched.")
+        return "\n".join(lines)
+
+    header = "| # | Ticker | Company |"
+    separator = "|---|--------|---------|"
+    if result["rank"]:
+        header += " Rank |"
+        separator += "------|"
+    for key in result["columns"]:
+        header += f" {key} |"
+        separator += "------|"
+    lines.append(header)
+    lines.append(separator)
+    for i, row in enumerate(result["rows"], 1):
+        name = row["name"][:25].replace("|", "\\|")
+        line = f"| {i} | {row['ticker']} | {name} |"
+        if result["rank"]:
+            line += f" {_format_metric(row['rank'])} |"
+        for key in result["columns"]:
+            line += f" {_format_metric(row[key])} |"
+        lines.append(line)
+    if len(result["rows"]) < result["matched"]:
+        lines.append("")
+        lines.append(f"Showing {len(result['rows'])} of {result['matched']} matches (--top).")
+    return "\n".join(lines)
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for --top."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be a whole number, got {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 (all matches) or more, got {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Screen stocks over a local snapshot table")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Fetch comparison metrics into the snapshot table")
+    build.add_argument("tickers", nargs="*", help="Stock ticker symbols")
+    build.add_argument("--file", help="File with one ticker per line")
+    build.add_argument("--universe", action="store_true",
+                       help="Every ticker in SEC's company list (US-listed universe)")
+    build.add_argument("--max-age", type=float, default=SNAPSHOT_MAX_AGE,
+                       help=f"Skip tickers refreshed within this many seconds (default: {SNAPSHOT_MAX_AGE})")
+    build.add_argument("--max-workers", type=int,
+                       help="Tickers fetched concurrently (default: 8)")
+    build.add_argument("--local-prices", action="store_true",
+                       help="Add risk metrics from local price history (risk_metrics.py)")
+    add_cache_arguments(build)
+
+    run = sub.add_parser("run", help="Filter and rank the snapshot table")
+    run.add_argument("filter", nargs="?", help='Filter expression, e.g. "pe_forward < 15 and roe > 0.15"')
+    run.add_argument("--rank", help='Expression to rank by, e.g. "fcf / market_cap"')
+    run.add_argument("--ascending", action="store_true", help="Rank lowest first")
+    run.add_argument("--top", type=_non_negative_int, default=DEFAULT_TOP,
+                     help=f"Rows to show, 0 for all (default: {DEFAULT_TOP})")
+    run.add_argument("--columns", nargs="+", default=[], help="Extra metrics to show")
+    run.add_argument("--output", choices=["json", "markdown"], default="markdown",
+                     help="Output format")
+
+    sub.add_parser("columns", help="List the metrics available in expressions")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        apply_cache_arguments(args)
+        tickers = list(args.tickers)
+        if args.file:
+            with open(args.file) as f:
+                tickers.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+        if args.universe:
+            from sec_edgar import get_universe_tickers
+            tickers.extend(get_universe_tickers())
+        if not tickers:
+            parser.error("build needs tickers, --file or --universe")
+        counts = build_snapshot(tickers, args.max_age, args.max_workers, args.local_prices)
+        print(f"Updated {counts['updated']}, skipped {counts['skipped']} fresh, "
+              f"failed {counts['failed']}; {counts['total']} tickers in {SNAPSHOT_PATH}")
+    elif args.command == "run":
+        try:
+            result = screen(args.filter, args.rank, args.top, args.ascending, args.columns)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if args.output == "json":
+            print(json.dumps(result, indent=2))
+        else:
+            print(format_screen_markdown(result))
+    else:
+        table = load_table()
+        if table is None:
+            print("No snapshot table. Build one first: python screen.py build --universe")
+            sys.exit(1)
+        print(f"Snapshot: {SNAPSHOT_PATH} ({len(table)} tickers)")
+        print("| Metric | Tickers with data |")
+        print("|--------|-------------------|")
+        for key, column in table.columns.items():
+            print(f"| {key} | {int(np.isfinite(column).sum())} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+SEC HTTP Client
+Shared, pooled and rate-limited HTTP client for SEC EDGAR.
+
+SEC's fair-access policy allows at most 10 requests per second per client
+and blocks IPs that exceed it. Every SEC request in this agent goes through
+one SECClient, which provides:
+
+- keep-alive connection pooling (one requests.Session)
+- a token-bucket limiter shared by all threads and, via a lock file, by all
+  processes on this machine
+- retries on 429/5xx and connection errors with jittered exponential
+  backoff (honoring Retry-After)
+
+Usage:
+    from sec_client import get_sec_client
+
+    data = get_sec_client().get_json("https://data.sec.gov/submissions/CIK0000320193.json")
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    print("Error: requests not installed. Run: pip install requests")
+    sys.exit(1)
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+from response_cache import SOURCES_DIR
+
+
+# SEC requires a user agent identifying the requester
+SEC_HEADERS = {
+    "User-Agent": os.environ.get("SEC_USER_AGENT", "StockResearchAgent/1.0 (research@example.com)"),
+    "Accept-Encoding": "gzip, deflate"
+}
+
+SEC_MAX_REQUESTS_PER_SECOND = 10
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5   # seconds
+BACKOFF_MAX = 30.0   # seconds
+POOL_SIZE = 16
+
+# Local SEC data (ticker index, filing indexes, archives, limiter state)
+SEC_DATA_DIR = Path(os.environ.get("STOCK_RESEARCH_SEC_DIR", SOURCES_DIR / "sec"))
+RATE_LIMIT_STATE = SEC_DATA_DIR / "rate_limit.state"
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate` requests per second with bursts up to `capacity`.
+
+    Thread-safe. With a state file (and fcntl), the bucket is also shared by
+    every process using the same file, so parallel CLIs and the MCP server
+    together stay under SEC's limit.
+    """
+
+    def __init__(self, rate: float = SEC_MAX_REQUESTS_PER_SECOND, capacity: float = None,
+                 state_file: Path = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.state_file = Path(state_file) if state_file and FCNTL_AVAILABLE else None
+        self._tokens = self.capacity
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def _take(self, tokens: float, updated: float) -> tuple:
+        """Refill, then try to take one token. Returns (tokens, updated, wait)."""
+        now = time.time()
+        tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+        if tokens >= 1:
+            return tokens - 1, now, 0.0
+        return tokens, now, (1 - tokens) / self.rate
+
+    def _take_shared(self) -> float:
+        """_take against the state file, under an exclusive file lock."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_file, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    tokens, updated = (float(v) for v in f.read().split())
+                except ValueError:
+                    tokens, updated = self.capacity, time.time()
+                tokens, updated, wait = self._take(tokens, updated)
+                f.seek(0)
+                f.truncate()
+                f.write(f"{tokens} {updated}")
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return wait
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                if self.state_file is not None:
+                    try:
+                        wait = self._take_shared()
+                    except OSError:
+                        # Unusable state file: fall back to this process's bucket
+                        self.state_file = None
+                        continue
+                else:
+                    self._tokens, self._updated, wait = self._take(self._tokens, self._updated)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+class SECClient:
+    """Pooled, rate-limited, retrying HTTP client for SEC endpoints."""
+
+    def __init__(self, rate: float = SEC_MAX_REQUESTS_PER_SECOND,
+                 max_retries: int = MAX_RETRIES,
+                 state_file: Path = RATE_LIMIT_STATE):
+        self.max_retries = max_retries
+        self.limiter = TokenBucket(rate, state_file=state_file)
+        self.session = requests.Session()
+        self.session.headers.update(SEC_HEADERS)
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _backoff(self, attempt: int, response=None) -> float:
+        """Full-jitter exponential backoff, or the server's Retry-After if given."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), BACKOFF_MAX)
+                except ValueError:
+                    pass
+        return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+    def get(self, url: str, headers: dict = None, timeout: float = 30,
+            stream: bool = False) -> "requests.Response":
+        """
+        GET with rate limiting and retries on 429/5xx and connection errors.
+
+        Returns the final response (the caller checks status, e.g. 304 or 404).
+        """
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                response = self.session.get(url, headers=headers, timeout=timeout, stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                print(f"Warning: SEC request failed ({e}); retrying in {delay:.1f}s", file=sys.stderr)
+                time.sleep(delay)
+                continue
+
+            if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                return response
+            delay = self._backoff(attempt, response)
+            print(f"Warning: SEC returned {response.status_code}; retrying in {delay:.1f}s", file=sys.stderr)
+            response.close()
+            time.sleep(delay)
+
+    def get_json(self, url: str, headers: dict = None, timeout: float = 30):
+        """GET and decode JSON, raising for HTTP errors."""
+        response = self.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_sec_client() -> SECClient:
+    """Return the process-wide SEC client."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = SECClient()
+        return _client
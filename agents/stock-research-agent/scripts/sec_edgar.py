@@ -3,109 +3,372 @@
 SEC EDGAR Filing Fetcher
 Fetches SEC filings (10-K, 10-Q, 8-K, etc.) for a given company.
 
+Ticker -> CIK lookups use a local index (memory/sources/sec/) that is
+revalidated against SEC with ETag/If-Modified-Since at most once a day.
+Each company's full filing history (including the older shards beyond
+SEC's "recent" window) is kept in memory/sources/sec/submissions/ and synced
+incrementally. Filing documents are downloaded once and kept in the local
+compressed archive (filing_archive.py). All SEC requests go through the
+shared rate-limited client (sec_client.py).
+
 Usage:
-    python sec_edgar.py TICKER [--type 10-K] [--limit 5]
+    python sec_edgar.py TICKER [--type 10-K] [--limit 5] [--since DATE] [--until DATE]
 
 Examples:
     python sec_edgar.py GOLF
     python sec_edgar.py AAPL --type 10-K --limit 3
     python sec_edgar.py MSFT --type 8-K --limit 10
+    python sec_edgar.py IBM --type 10-K --until 2005-12-31 --limit 5
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional, Tuple
 
-try:
-    import requests
-except ImportError:
-    print("Error: requests not installed. Run: pip install requests")
-    sys.exit(1)
+from response_cache import (DATASET_TTLS, MODE_NORMAL, MODE_OFF, add_cache_arguments,
+                            apply_cache_arguments, get_cache)
+from filing_archive import get_archive
+from filing_sections import build_section_index, find_section
+from filing_text import CHUNK_SIZE, iter_filing_text, take_text
+from sec_client import SEC_DATA_DIR, SEC_HEADERS, get_sec_client
 
 
-# SEC requires a user agent
-HEADERS = {
-    "User-Agent": "StockResearchAgent/1.0 (research@example.com)",
-    "Accept-Encoding": "gzip, deflate"
-}
+# SEC requires a user agent (sent by the shared client session)
+HEADERS = SEC_HEADERS
 
 SEC_BASE = "https://www.sec.gov"
 EDGAR_SEARCH = "https://efts.sec.gov/LATEST/search-index"
 COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
 
+TICKER_INDEX_PATH = SEC_DATA_DIR / "ticker_index.json"
+TICKER_INDEX_REFRESH = 86400  # revalidate against SEC at most daily
+TICKER_INDEX_RETRY = 900      # after a failed revalidation, keep the local copy this long
+FILINGS_DIR = SEC_DATA_DIR / "filings"  # per-filing section indexes
+
+SUBMISSIONS_URL = "https://data.sec.gov/submissions/{name}"
+SUBMISSIONS_DIR = SEC_DATA_DIR / "submissions"  # per-CIK filing history
+SUBMISSIONS_REFRESH = DATASET_TTLS["sec_submissions"]
+
+
+class TickerIndex:
+    """
+    Persisted ticker -> (CIK, name) map with a CIK -> name reverse index.
+
+    Loaded once per process; lookups are plain dict reads. The SEC file is
+    revalidated with ETag/If-Modified-Since at most every TICKER_INDEX_REFRESH
+    seconds, so SEC is hit about once a day and usually answers 304. If
+    revalidation fails, the local copy is used for TICKER_INDEX_RETRY seconds
+    before SEC is tried again.
+    """
+
+    def __init__(self, path: Path = TICKER_INDEX_PATH):
+        self.path = Path(path)
+        self.by_ticker = {}  # "GOLF" -> ("0001672013", "Acushnet Holdings Corp.")
+        self.by_cik = {}     # "0001672013" -> "Acushnet Holdings Corp."
+        self.meta = {}       # etag, last_modified, checked_at
+        self._failed_at = 0.0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        """Read the persisted index from disk."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                stored = json.load(f)
+            self.meta = stored.get("meta", {})
+            self._build(stored.get("tickers", {}))
+        except Exception as e:
+            print(f"Warning: could not read ticker index {self.path}: {e}", file=sys.stderr)
+
+    def _build(self, tickers: dict):
+        """Build both lookups from {ticker: [cik, name]}."""
+        self.by_ticker = {t: (cik, name) for t, (cik, name) in tickers.items()}
+        self.by_cik = {}
+        for cik, name in self.by_ticker.values():
+            self.by_cik.setdefault(cik, name)
+
+    def _save(self):
+        """Persist the index atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"meta": self.meta,
+                       "tickers": {t: list(v) for t, v in self.by_ticker.items()}}, f)
+        os.replace(tmp, self.path)
+
+    def refresh(self, force: bool = False):
+        """Revalidate against SEC if the last check is older than a day (or forced)."""
+        now = time.time()
+        if not force and self.by_ticker and \
+                (now - self.meta.get("checked_at", 0) < TICKER_INDEX_REFRESH
+                 or now - self._failed_at < TICKER_INDEX_RETRY):
+            return
+
+        headers = {}
+        if self.by_ticker:
+            if self.meta.get("etag"):
+                headers["If-None-Match"] = self.meta["etag"]
+            if self.meta.get("last_modified"):
+                headers["If-Modified-Since"] = self.meta["last_modified"]
+
+        try:
+            response = get_sec_client().get(COMPANY_TICKERS_URL, headers=headers, timeout=10)
+            if response.status_code != 304:
+                response.raise_for_status()
+                tickers = {}
+                for entry in response.json().values():
+                    ticker = str(entry.get("ticker", "")).upper()
+                    if ticker:
+                        # CIK needs to be zero-padded to 10 digits
+                        tickers[ticker] = (str(entry.get("cik_str", "")).zfill(10), entry.get("title", ""))
+                self._build(tickers)
+                self.meta["etag"] = response.headers.get("ETag")
+                self.meta["last_modified"] = response.headers.get("Last-Modified")
+            self.meta["checked_at"] = time.time()
+            self._save()
+        except Exception as e:
+            if not self.by_ticker:
+                raise
+            # Lookups hold _lock; don't retry SEC on every one while it is down
+            self._failed_at = time.time()
+            print(f"Warning: ticker index refresh failed, using local copy: {e}", file=sys.stderr)
+
+    def _ensure(self):
+        """Load from disk once, then revalidate if due."""
+        with self._lock:
+            force = False
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+                # --refresh / --no-cache: revalidate (still conditionally) once per run
+                force = get_cache().mode != MODE_NORMAL
+            self.refresh(force=force)
+
+    def lookup(self, ticker: str) -> Optional[str]:
+        """10-digit CIK for a ticker, or None."""
+        self._ensure()
+        entry = self.by_ticker.get(ticker.upper())
+        return entry[0] if entry else None
+
+    def company_name(self, cik: str) -> Optional[str]:
+        """Company name for a CIK, or None."""
+        self._ensure()
+        return self.by_cik.get(str(cik).zfill(10))
+
+    def tickers(self) -> List[str]:
+        """Every ticker in the index, sorted."""
+        self._ensure()
+        return sorted(self.by_ticker)
+
+
+_ticker_index = TickerIndex()
+
 
 def get_cik_from_ticker(ticker: str) -> Optional[str]:
     """Convert ticker to CIK (Central Index Key)."""
     try:
-        response = requests.get(COMPANY_TICKERS_URL, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        return _ticker_index.lookup(ticker)
+    except Exception as e:
+        print(f"Error fetching CIK: {e}", file=sys.stderr)
+        return None
 
-        ticker_upper = ticker.upper()
-        for entry in data.values():
-            if entry.get("ticker", "").upper() == ticker_upper:
-                # CIK needs to be zero-padded to 10 digits
-                cik = str(entry.get("cik_str", ""))
-                return cik.zfill(10)
 
-        return None
+def get_universe_tickers() -> List[str]:
+    """Every ticker SEC lists (the US-listed universe), from the local ticker index."""
+    return _ticker_index.tickers()
+
+
+def get_company_name(cik: str) -> Optional[str]:
+    """Company name for a CIK from the local ticker index."""
+    try:
+        return _ticker_index.company_name(cik)
     except Exception as e:
-        print(f"Error fetching CIK: {e}", file=sys.stderr)
+        print(f"Error fetching company name: {e}", file=sys.stderr)
         return None
 
 
-def get_company_filings(cik: str, filing_type: str = None, limit: int = 10) -> list:
+# Columns kept from SEC's columnar filing lists, in stored row order
+FILING_FIELDS = ("accessionNumber", "filingDate", "reportDate", "form",
+                 "primaryDocument", "primaryDocDescription")
+
+
+def _filing_rows(block: dict) -> list:
+    """Rows (lists in FILING_FIELDS order) from a columnar filings block."""
+    columns = [block.get(name, []) for name in FILING_FIELDS]
+    count = len(columns[0])
+    return [[col[i] if i < len(col) else "" for col in columns] for i in range(count)]
+
+
+class FilingIndex:
+    """
+    Persisted full filing history for one company.
+
+    The first sync reads the submissions document's "recent" block and every
+    older shard listed in filings.files. Later syncs revalidate the
+    submissions document with ETag/If-Modified-Since, merge only rows newer
+    than the last accession seen, and fetch only shards not stored yet.
+    Filters run against the local rows.
     """
-    Fetch recent filings for a company from SEC EDGAR.
+
+    def __init__(self, cik: str, path: Path = None):
+        self.cik = cik
+        self.path = Path(path) if path else SUBMISSIONS_DIR / f"CIK{cik}.json"
+        self.rows = []  # FILING_FIELDS rows, newest first
+        self.meta = {}  # name, etag, last_modified, synced_at, last_accession, shards
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        """Read the persisted index from disk."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                stored = json.load(f)
+            self.meta = stored.get("meta", {})
+            self.rows = stored.get("filings", [])
+        except Exception as e:
+            print(f"Warning: could not read filing index {self.path}: {e}", file=sys.stderr)
+
+    def _save(self):
+        """Persist the index atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"meta": self.meta, "filings": self.rows}, f)
+        os.replace(tmp, self.path)
+
+    def sync(self, force: bool = False):
+        """Bring the local history up to date (at most every SUBMISSIONS_REFRESH seconds)."""
+        if not force and self.rows and \
+                time.time() - self.meta.get("synced_at", 0) < SUBMISSIONS_REFRESH:
+            return
+
+        client = get_sec_client()
+        headers = {}
+        if self.rows:
+            if self.meta.get("etag"):
+                headers["If-None-Match"] = self.meta["etag"]
+            if self.meta.get("last_modified"):
+                headers["If-Modified-Since"] = self.meta["last_modified"]
+
+        response = client.get(SUBMISSIONS_URL.format(name=f"CIK{self.cik}.json"), headers=headers, timeout=15)
+        if response.status_code != 304:
+            response.raise_for_status()
+            data = response.json()
+            filings = data.get("filings", {})
+            known = {row[0] for row in self.rows}
+            last = self.meta.get("last_accession")
+
+            new_rows = []
+            for row in _filing_rows(filings.get("recent", {})):
+                if row[0] == last:
+                    break  # recent is newest first; everything older is stored
+                if row[0] not in known:
+                    new_rows.append(row)
+                    known.add(row[0])
+
+            shards = self.meta.setdefault("shards", [])
+            for shard in filings.get("files", []):
+                name = shard.get("name")
+                if not name or name in shards:
+                    continue
+                for row in _filing_rows(client.get_json(SUBMISSIONS_URL.format(name=name), timeout=30)):
+                    if row[0] not in known:
+                        new_rows.append(row)
+                        known.add(row[0])
+                shards.append(name)
+
+            if new_rows:
+                self.rows = sorted(self.rows + new_rows, key=lambda r: (r[1], r[0]), reverse=True)
+            self.meta["name"] = data.get("name", self.meta.get("name"))
+            self.meta["etag"] = response.headers.get("ETag")
+            self.meta["last_modified"] = response.headers.get("Last-Modified")
+            if self.rows:
+                self.meta["last_accession"] = self.rows[0][0]
+
+        self.meta["synced_at"] = time.time()
+        self._save()
+
+    def ensure(self):
+        """Load from disk once, then sync if due (falling back to the local copy)."""
+        with self._lock:
+            force = False
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+                # --refresh / --no-cache: revalidate (still conditionally) once per run
+                force = get_cache().mode != MODE_NORMAL
+            try:
+                self.sync(force=force)
+            except Exception as e:
+                if not self.rows:
+                    raise
+                print(f"Warning: filing index sync failed, using local copy: {e}", file=sys.stderr)
+
+    def filings(self, filing_type: str = None, since: str = None, until: str = None):
+        """Matching rows, newest first. Dates are YYYY-MM-DD and inclusive."""
+        prefix = filing_type.upper() if filing_type else None
+        for row in self.rows:
+            filing_date = row[1]
+            if until and filing_date > until:
+                continue
+            if since and filing_date < since:
+                break  # rows are sorted by filing date
+            # Prefix match, e.g. "10-K" also matches "10-K/A"
+            if prefix and not row[3].upper().startswith(prefix):
+                continue
+            yield row
+
+
+_filing_indexes = {}
+_filing_indexes_lock = threading.Lock()
+
+
+def get_filing_index(cik: str) -> FilingIndex:
+    """Return the synced filing index for a CIK."""
+    with _filing_indexes_lock:
+        index = _filing_indexes.get(cik)
+        if index is None:
+            index = _filing_indexes[cik] = FilingIndex(cik)
+    index.ensure()
+    return index
+
+
+def get_company_filings(cik: str, filing_type: str = None, limit: int = 10,
+                        since: str = None, until: str = None) -> list:
+    """
+    Fetch filings for a company from the local filing index (synced with SEC EDGAR).
 
     Args:
         cik: Company CIK (10-digit zero-padded)
         filing_type: Filter by filing type (10-K, 10-Q, 8-K, etc.)
         limit: Maximum number of filings to return
+        since: Earliest filing date (YYYY-MM-DD)
+        until: Latest filing date (YYYY-MM-DD)
 
     Returns:
         List of filing dictionaries
     """
-    # Use SEC's company submissions API
-    url = f"https://data.sec.gov/submissions/CIK{cik}.json"
-
     try:
-        response = requests.get(url, headers=HEADERS, timeout=15)
-        response.raise_for_status()
-        data = response.json()
+        index = get_filing_index(cik)
     except Exception as e:
         print(f"Error fetching filings: {e}", file=sys.stderr)
         return []
 
     filings = []
-    recent = data.get("filings", {}).get("recent", {})
-
-    if not recent:
-        return []
-
-    # Extract filing data
-    forms = recent.get("form", [])
-    filing_dates = recent.get("filingDate", [])
-    accession_numbers = recent.get("accessionNumber", [])
-    primary_docs = recent.get("primaryDocument", [])
-    descriptions = recent.get("primaryDocDescription", [])
-
-    for i in range(min(len(forms), 100)):  # Check up to 100 filings
-        form = forms[i] if i < len(forms) else ""
-        filing_date = filing_dates[i] if i < len(filing_dates) else ""
-        accession = accession_numbers[i] if i < len(accession_numbers) else ""
-        primary_doc = primary_docs[i] if i < len(primary_docs) else ""
-        description = descriptions[i] if i < len(descriptions) else ""
-
-        # Filter by type if specified
-        if filing_type and form.upper() != filing_type.upper():
-            # Also match partial (e.g., "10-K" matches "10-K/A")
-            if not form.upper().startswith(filing_type.upper()):
-                continue
-
+    for accession, filing_date, report_date, form, primary_doc, description in \
+            index.filings(filing_type, since, until):
         # Build filing URL
         accession_clean = accession.replace("-", "")
         filing_url = f"{SEC_BASE}/Archives/edgar/data/{cik.lstrip('0')}/{accession_clean}/{primary_doc}"
@@ -114,6 +377,7 @@ def get_company_filings(cik: str, filing_type: str = None, limit: int = 10) -> l
         filings.append({
             "form": form,
             "filing_date": filing_date,
+            "report_date": report_date,
             "accession_number": accession,
             "description": description,
             "document_url": filing_url,
@@ -126,34 +390,141 @@ def get_company_filings(cik: str, filing_type: str = None, limit: int = 10) -> l
     return filings
 
 
-def get_filing_content(url: str, max_chars: int = 50000) -> str:
+# Text-search fallback for filings without Item headings
+SECTION_PATTERNS = {
+    "business": r"(?:Item\s*1[.\s]*[-–—]?\s*)?Business\s*\n",
+    "risk": r"(?:Item\s*1A[.\s]*[-–—]?\s*)?Risk\s*Factors",
+    "mda": r"(?:Item\s*7[.\s]*[-–—]?\s*)?Management[''`]?s?\s*Discussion",
+    "financials": r"(?:Item\s*8[.\s]*[-–—]?\s*)?Financial\s*Statements",
+}
+SECTION_CHARS = 10000  # characters returned from a text-search match
+
+
+def _section_regex(section: str) -> "re.Pattern":
+    """Compiled pattern for a named section, or the literal section text."""
+    pattern = SECTION_PATTERNS.get(section.lower())
+    if not pattern:
+        # Try to find the literal section
+        pattern = re.escape(section)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+EDGAR_DOCUMENT_RE = re.compile(r"/Archives/edgar/data/(\d+)/(\d+)/([^/?#]+)")
+
+
+def _filing_path(url: str) -> Path:
+    """Local path for a filing document, mirroring EDGAR's cik/accession/doc layout."""
+    match = EDGAR_DOCUMENT_RE.search(url)
+    if match:
+        return FILINGS_DIR.joinpath(*match.groups())
+    return FILINGS_DIR / "other" / hashlib.sha1(url.encode()).hexdigest()
+
+
+def _archive_key(url: str) -> Tuple[str, str]:
+    """(accession, document) archive key for a filing URL."""
+    match = EDGAR_DOCUMENT_RE.search(url)
+    if match:
+        return match.group(2), match.group(3)
+    return "url", hashlib.sha1(url.encode()).hexdigest()
+
+
+def get_filing_text(url: str) -> str:
+    """
+    Full extracted text of a filing document, read through the local archive.
+
+    Filings are immutable, so a document is downloaded from SEC only the
+    first time; the raw bytes and text are archived as they stream in.
+    --no-cache skips the archive entirely.
+    """
+    archive = None if get_cache().mode == MODE_OFF else get_archive()
+    accession, document = _archive_key(url)
+    if archive is not None:
+        text = archive.get_text(accession, document)
+        if text is not None:
+            return text
+
+    with get_sec_client().get(url, timeout=60, stream=True) as response:
+        response.raise_for_status()
+        chunks = response.iter_content(CHUNK_SIZE)
+        encoding = getattr(response, "encoding", None)
+        if archive is None:
+            return "".join(iter_filing_text(chunks, encoding))
+        return archive.store(accession, document, url, chunks, encoding)
+
+
+def load_filing_sections(url: str) -> Tuple[str, dict]:
+    """
+    Full text of a filing plus its section index.
+
+    The text comes from the filing archive; the section index is built in one
+    pass on first use and cached as JSON under FILINGS_DIR, so later section
+    requests for the same filing are local slices.
+
+    Returns:
+        (text, {section_key: [start, end]})
+    """
+    text = get_filing_text(url)
+    if get_cache().mode == MODE_OFF:
+        return text, build_section_index(text)
+
+    base = _filing_path(url)
+    index_path = base.with_name(base.name + ".sections.json")
+    try:
+        with open(index_path) as f:
+            stored = json.load(f)
+        if stored.get("length") == len(text):
+            return text, stored["sections"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    index = build_section_index(text)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = index_path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump({"length": len(text), "sections": index}, f)
+    os.replace(tmp, index_path)
+    return text, index
+
+
+def get_filing_content(url: str, max_chars: int = 50000, section: str = None,
+                       form: str = None) -> str:
     """
     Fetch the content of a filing.
 
+    Documents are read through the local filing archive, so only the first
+    request for a filing touches SEC. With --no-cache the document is
+    streamed instead and reading stops as soon as max_chars is collected.
+
     Args:
         url: URL to the filing document
         max_chars: Maximum characters to return
+        section: Optional section to return instead of the document start
+            (see search_filing_for_section)
+        form: Form type of the filing (10-K, 10-Q, ...), used to resolve
+            section names
 
     Returns:
         Filing text content (truncated if too long)
     """
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
-        response.raise_for_status()
-
-        content = response.text
+        if section:
+            text, index = load_filing_sections(url)
+            content = search_filing_for_section(text, section, index, form)
+        elif get_cache().mode == MODE_OFF:
+            with get_sec_client().get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                pieces = iter_filing_text(response.iter_content(CHUNK_SIZE),
+                                          getattr(response, "encoding", None))
+                content, truncated = take_text(pieces, max_chars)
+        else:
+            content = get_filing_text(url)
 
-        # If HTML, try to extract text
-        if "<html" in content.lower() or "<body" in content.lower():
-            # Simple HTML text extraction
-            content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL | re.IGNORECASE)
-            content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL | re.IGNORECASE)
-            content = re.sub(r'<[^>]+>', ' ', content)
-            content = re.sub(r'\s+', ' ', content)
-            content = content.strip()
+        if section or get_cache().mode != MODE_OFF:
+            truncated = len(content) > max_chars
+            content = content[:max_chars]
 
-        if len(content) > max_chars:
-            content = content[:max_chars] + f"\n\n[... truncated at {max_chars} characters ...]"
+        if truncated:
+            content = content + f"\n\n[... truncated at {max_chars} characters ...]"
 
         return content
 
@@ -161,7 +532,8 @@ def get_filing_content(url: str, max_chars: int = 50000) -> str:
         return f"Error fetching filing content: {e}"
 
 
-def search_filing_for_section(content: str, section: str) -> str:
+def search_filing_for_section(content: str, section: str, index: dict = None,
+                              form: str = None) -> str:
     """
     Search filing content for a specific section.
 
@@ -171,33 +543,32 @@ def search_filing_for_section(content: str, section: str) -> str:
     - "Item 7" or "MD&A" - Management discussion
     - "Item 8" - Financial statements
 
+    Sections are found through the Item heading index (skipping the table of
+    contents) and returned at their full length. Filings without Item
+    headings fall back to a text search.
+
     Args:
         content: Filing text content
-        section: Section to search for
+        section: Section to search for (name, "Item 1A" or key like "II-1A")
+        index: Section index of content, if already built
+        form: Form type of the filing; without it the 10-K/10-Q layout is
+            guessed from the headings
 
     Returns:
         Extracted section text or message if not found
     """
-    # Common section patterns
-    patterns = {
-        "business": r"(?:Item\s*1[.\s]*[-–—]?\s*)?Business\s*\n",
-        "risk": r"(?:Item\s*1A[.\s]*[-–—]?\s*)?Risk\s*Factors",
-        "mda": r"(?:Item\s*7[.\s]*[-–—]?\s*)?Management[''`]?s?\s*Discussion",
-        "financials": r"(?:Item\s*8[.\s]*[-–—]?\s*)?Financial\s*Statements",
-    }
-
-    section_lower = section.lower()
-    pattern = patterns.get(section_lower)
-
-    if not pattern:
-        # Try to find the literal section
-        pattern = re.escape(section)
-
-    match = re.search(pattern, content, re.IGNORECASE)
+    if index is None:
+        index = build_section_index(content)
+    span = find_section(index, section, form)
+    if span:
+        start, end = span
+        return content[start:end]
+
+    match = _section_regex(section).search(content)
     if match:
         start = match.start()
-        # Extract up to 10000 chars from section start
-        return content[start:start + 10000]
+        # Extract up to SECTION_CHARS from section start
+        return content[start:start + SECTION_CHARS]
 
     return f"Section '{section}' not found in filing."
 
@@ -235,14 +606,20 @@ def main():
                         help="Filing type filter (10-K, 10-Q, 8-K, etc.)")
     parser.add_argument("--limit", type=int, default=10,
                         help="Maximum number of filings (default: 10)")
+    parser.add_argument("--since", default=None,
+                        help="Earliest filing date (YYYY-MM-DD)")
+    parser.add_argument("--until", default=None,
+                        help="Latest filing date (YYYY-MM-DD)")
     parser.add_argument("--fetch", metavar="INDEX",
                         help="Fetch content of filing at index (0-based)")
     parser.add_argument("--section", default=None,
                         help="Extract specific section (business, risk, mda, financials)")
     parser.add_argument("--output", choices=["json", "markdown"], default="markdown",
                         help="Output format")
+    add_cache_arguments(parser)
 
     args = parser.parse_args()
+    apply_cache_arguments(args)
 
     # Get CIK
     print(f"Looking up CIK for {args.ticker}...", file=sys.stderr)
@@ -256,7 +633,7 @@ def main():
 
     # Get filings
     print(f"Fetching filings...", file=sys.stderr)
-    filings = get_company_filings(cik, args.filing_type, args.limit)
+    filings = get_company_filings(cik, args.filing_type, args.limit, args.since, args.until)
 
     if args.fetch is not None:
         # Fetch specific filing content
@@ -267,10 +644,8 @@ def main():
 
         url = filings[idx].get("document_url")
         print(f"Fetching content from: {url}", file=sys.stderr)
-        content = get_filing_content(url)
-
-        if args.section:
-            content = search_filing_for_section(content, args.section)
+        # Sections come from the cached per-filing index; otherwise stream the budget
+        content = get_filing_content(url, section=args.section, form=filings[idx].get("form"))
 
         print(content)
     else:
@@ -278,7 +653,7 @@ def main():
         if args.output == "json":
             print(json.dumps(filings, indent=2))
         else:
-            print(format_filings_markdown(args.ticker, filings))
+            print(format_filings_markdown(args.ticker, filings, get_company_name(cik)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Ticker Snapshot
+Shared, lazily-populated view of a single ticker's Yahoo Finance data.
+
+Every script and MCP handler gets its yfinance data from here instead of
+building its own yf.Ticker, so one analysis run hits Yahoo once per dataset
+no matter how many modules need the same ticker. Datasets are also read
+through the persistent response cache, so repeat runs skip Yahoo entirely
+while the cached copy is within its TTL.
+
+Usage:
+    from ticker_snapshot import get_snapshot
+
+    snap = get_snapshot("GOLF")
+    snap.info            # fetched on first access, reused afterwards
+    snap.cashflow
+    snap.current_price
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple
+
+from response_cache import MISS, get_cache
+
+try:
+    import yfinance as yf
+    YFINANCE_AVAILABLE = True
+except ImportError:
+    YFINANCE_AVAILABLE = False
+
+
+# Response-cache dataset (and therefore TTL) for each yf.Ticker attribute
+CACHE_DATASETS = {
+    "info": "info",
+    "income_stmt": "statements",
+    "balance_sheet": "statements",
+    "cashflow": "statements",
+    "news": "news",
+    "recommendations": "recommendations",
+    "recommendations_summary": "recommendations",
+    "earnings_dates": "recommendations",
+}
+
+
+class TickerSnapshot:
+    """Lazily fetches and memoizes yfinance datasets for one ticker."""
+
+    def __init__(self, ticker: str):
+        self.ticker = ticker.upper()
+        self.created_at = time.monotonic()
+        self._stock = None
+        self._data = {}
+        self._fresh = set()
+        self._lock = threading.Lock()
+
+    @property
+    def stock(self):
+        """The underlying yf.Ticker (for datasets not memoized here)."""
+        if self._stock is None:
+            if not YFINANCE_AVAILABLE:
+                raise ImportError("yfinance not installed. Run: pip install yfinance")
+            self._stock = yf.Ticker(self.ticker)
+        return self._stock
+
+    def _get(self, name: str):
+        """Fetch a yf.Ticker attribute at most once (cache first, then Yahoo)."""
+        if name in self._data:
+            return self._data[name]
+        with self._lock:
+            if name not in self._data:
+                cache = get_cache()
+                dataset = CACHE_DATASETS.get(name, name)
+                key = f"{self.ticker}:{name}"
+                value = cache.get(dataset, key)
+                if value is MISS:
+                    value = getattr(self.stock, name)
+                    self._fresh.add(name)
+                    if value is not None:
+                        cache.set(dataset, key, value)
+                self._data[name] = value
+        return self._data[name]
+
+    @property
+    def info(self) -> dict:
+        return self._get("info") or {}
+
+    @property
+    def income_stmt(self):
+        return self._get("income_stmt")
+
+    @property
+    def balance_sheet(self):
+        return self._get("balance_sheet")
+
+    @property
+    def cashflow(self):
+        return self._get("cashflow")
+
+    @property
+    def news(self):
+        return self._get("news")
+
+    @property
+    def recommendations(self):
+        return self._get("recommendations")
+
+    @property
+    def recommendations_summary(self):
+        return self._get("recommendations_summary")
+
+    @property
+    def earnings_dates(self):
+        return self._get("earnings_dates")
+
+    @property
+    def current_price(self):
+        """Current price, cached for seconds rather than for the life of info."""
+        if "quote" in self._data:
+            return self._data["quote"]
+        cache = get_cache()
+        price = cache.get("quote", self.ticker)
+        if price is MISS:
+            price = self._fetch_quote()
+            if price is not None:
+                cache.set("quote", self.ticker, price)
+        self._data["quote"] = price
+        return price
+
+    def _fetch_quote(self):
+        """Latest price: reuse info if it was just fetched, else a light quote call."""
+        if "info" not in self._fresh:
+            try:
+                price = self.stock.fast_info["lastPrice"]
+                if price:
+                    return float(price)
+            except Exception:
+                pass
+        info = self.info
+        return info.get("currentPrice") or info.get("regularMarketPrice")
+
+
+# Default cap on concurrent Yahoo requests for multi-ticker fetches
+DEFAULT_MAX_WORKERS = 8
+
+
+# Long-lived processes (the MCP server) must not serve a snapshot forever
+SNAPSHOT_MAX_AGE = 300  # seconds
+
+_snapshots = {}
+_snapshots_lock = threading.Lock()
+
+
+def get_snapshot(ticker: str) -> TickerSnapshot:
+    """Return the shared snapshot for a ticker, creating it on first use."""
+    key = ticker.upper()
+    with _snapshots_lock:
+        snap = _snapshots.get(key)
+        if snap is None or time.monotonic() - snap.created_at > SNAPSHOT_MAX_AGE:
+            snap = TickerSnapshot(key)
+            _snapshots[key] = snap
+        return snap
+
+
+def clear_snapshots():
+    """Drop all memoized snapshots so the next access refetches."""
+    with _snapshots_lock:
+        _snapshots.clear()
+
+
+def map_tickers(func: Callable, tickers: List[str],
+                max_workers: int = DEFAULT_MAX_WORKERS) -> List[Tuple[str, object, Exception]]:
+    """
+    Run func(ticker) for many tickers concurrently on a bounded thread pool.
+
+    Returns:
+        (ticker, result, error) per ticker, in input order; exactly one of
+        result/error is set.
+    """
+    def run(ticker):
+        try:
+            return ticker, func(ticker), None
+        except Exception as e:
+            return ticker, None, e
+
+    if not tickers:
+        return []
+    workers = max(1, min(max_workers, len(tickers)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ticker-fetch") as pool:
+        return list(pool.map(run, tickers))
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Watchlist Refresh
+Refreshes every active entry of memory/watchlist.md in one concurrent pass.
+
+The `## TICKER - Name` blocks are parsed (status, thesis, fair value range),
+the active tickers' snapshots, DCF inputs and analyst ratings are fetched
+concurrently on a bounded pool, all DCFs are valued in one batch, and one
+compact summary table is written to memory/watchlist_summary.md. A 50-name
+watchlist refreshes in about the time of a few single-ticker fetches.
+
+Usage:
+    python watchlist.py [--file PATH] [--summary PATH] [--no-write] [--max-workers 8]
+
+Examples:
+    python watchlist.py
+    python watchlist.py --no-write --output json
+    python watchlist.py --max-workers 16
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from analyst_ratings import get_analyst_recommendations
+from dcf_model import calculate_dcf_many, fetch_inputs_from_ticker
+from response_cache import WORKSPACE_DIR, add_cache_arguments, apply_cache_arguments
+from ticker_snapshot import DEFAULT_MAX_WORKERS, get_snapshot, map_tickers
+
+WATCHLIST_PATH = WORKSPACE_DIR / "memory" / "watchlist.md"
+SUMMARY_PATH = WORKSPACE_DIR / "memory" / "watchlist_summary.md"
+
+ENTRY_RE = re.compile(r"^##\s+([A-Z][A-Z0-9.\-]{0,9})\s+[-–]\s+(.+?)\s*$")
+FIELD_RE = re.compile(r"^\s*[-*]\s+\*\*(.+?):\*\*\s*(.*?)\s*$")
+RANGE_RE = re.compile(r"\$?\s*(\d+(?:\.\d+)?)\s*(?:-|–|to)\s*\$?\s*(\d+(?:\.\d+)?)")
+
+
+def parse_fair_value(text: str) -> Tuple[Optional[float], Optional[float]]:
+    """("$55-65 (20-30% below current)") -> (55.0, 65.0)"""
+    match = RANGE_RE.search(text or "")
+    if not match:
+        return None, None
+    return float(match.group(1)), float(match.group(2))
+
+
+def parse_watchlist(path: Path = WATCHLIST_PATH) -> List[dict]:
+    """
+    Parse the `## TICKER - Name` entries of a watchlist file.
+
+    Returns:
+        One dict per entry: ticker, name, status, thesis, fair_value_low/high
+        and every other `- **Field:** value` line (snake_case keys)
+    """
+    entries = []
+    entry = None
+    in_code = False
+    with open(path) as f:
+        for line in f:
+            if line.lstrip().startswith("```"):
+                in_code = not in_code
+                continue
+            if in_code:
+                continue
+            if line.startswith("#"):
+                match = ENTRY_RE.match(line)
+                entry = None
+                if match:
+                    entry = {"ticker": match.group(1), "name": match.group(2)}
+                    entries.append(entry)
+                continue
+            match = FIELD_RE.match(line)
+            if entry is not None and match:
+                key = re.sub(r"\W+", "_", match.group(1).strip().lower()).strip("_")
+                entry[key] = match.group(2)
+
+    for entry in entries:
+        entry["fair_value_low"], entry["fair_value_high"] = parse_fair_value(entry.get("fair_value_range"))
+    return entries
+
+
+def active_entries(entries: List[dict]) -> List[dict]:
+    """Entries whose status is Active (entries without a status count as active)."""
+    return [e for e in entries if e.get("status", "Active").strip().lower().startswith("active")]
+
+
+def refresh_watchlist(path: Path = WATCHLIST_PATH,
+                      max_workers: int = DEFAULT_MAX_WORKERS) -> List[dict]:
+    """
+    Refresh all active watchlist entries.
+
+    Snapshots, DCF inputs and analyst ratings are fetched concurrently (one
+    task per ticker, bounded by max_workers), then every DCF is valued in a
+    single batch.
+
+    Returns:
+        One row per active entry with price, DCF value, analyst target and
+        position against the fair value range (or an error)
+    """
+    entries = active_entries(parse_watchlist(path))
+
+    def fetch(ticker):
+        price = get_snapshot(ticker).current_price
+        try:
+            inputs = fetch_inputs_from_ticker(ticker)
+        except Exception as e:
+            print(f"Warning: {ticker}: DCF inputs unavailable: {e}", file=sys.stderr)
+            inputs = None
+        return price, inputs, get_analyst_recommendations(ticker)
+
+    rows = []
+    valued = []
+    results = map_tickers(fetch, [e["ticker"] for e in entries], max_workers)
+    for entry, (ticker, fetched, error) in zip(entries, results):
+        row = {
+            "ticker": ticker,
+            "name": entry.get("name"),
+            "thesis": entry.get("thesis"),
+            "fair_value_low": entry.get("fair_value_low"),
+            "fair_value_high": entry.get("fair_value_high"),
+        }
+        rows.append(row)
+        if error is not None:
+            row["error"] = str(error)
+            continue
+
+        price, inputs, ratings = fetched
+        row.update({
+            "current_price": price,
+            "intrinsic_value_per_share": None,
+            "dcf_upside": None,
+            "target_mean": ratings.get("target_mean"),
+            "analyst_upside": ratings.get("upside_potential"),
+            "recommendation": ratings.get("recommendation"),
+            "num_analysts": ratings.get("num_analysts"),
+            "vs_fair_value": _vs_fair_value(price, row["fair_value_low"], row["fair_value_high"]),
+        })
+        if inputs is not None:
+            valued.append((row, inputs))
+
+    if valued:
+        batch = calculate_dcf_many([inputs for _, inputs in valued])
+        for (row, _), iv in zip(valued, batch.intrinsic_value_per_share):
+            row["intrinsic_value_per_share"] = float(iv)
+            price = row["current_price"]
+            row["dcf_upside"] = (float(iv) - price) / price if price else None
+
+    return rows
+
+
+def _vs_fair_value(price, low, high) -> Optional[str]:
+    if not price or low is None or high is None:
+        return None
+    if price < low:
+        return "below"
+    if price > high:
+        return "above"
+    return "within"
+
+
+def format_watchlist_markdown(rows: List[dict]) -> str:
+    """Format refreshed watchlist rows as one compact markdown table."""
+    lines = []
+    lines.append("# Watchlist Summary")
+    lines.append(f"\n**Generated:** {datetime.now().isoformat()}")
+    lines.append("")
+
+    if not rows:
+        lines.append("No active watchlist entries.")
+        return "\n".join(lines)
+
+    lines.append("| Ticker | Price | Fair Value | vs FV | DCF | DCF Upside | Target | Analysts | Thesis |")
+    lines.append("|--------|-------|------------|-------|-----|------------|--------|----------|--------|")
+    for row in rows:
+        fair = (f"${row['fair_value_low']:g}-{row['fair_value_high']:g}"
+                if row.get("fair_value_low") is not None else "N/A")
+        thesis = (row.get("thesis") or "").split("(")[0].strip() or "N/A"
+        if "error" in row:
+            lines.append(f"| {row['ticker']} | N/A | {fair} | N/A | Error: {row['error'][:40]} | N/A | N/A | N/A | {thesis} |")
+            continue
+        price = f"${row['current_price']:.2f}" if row.get("current_price") else "N/A"
+        iv = f"${row['intrinsic_value_per_share']:.2f}" if row.get("intrinsic_value_per_share") is not None else "N/A"
+        upside = f"{row['dcf_upside']:.1%}" if row.get("dcf_upside") is not None else "N/A"
+        target = "N/A"
+        if row.get("target_mean"):
+            target = f"${row['target_mean']:.2f}"
+            if row.get("analyst_upside") is not None:
+                target += f" ({row['analyst_upside']:+.0%})"
+        analysts = row.get("recommendation") or "N/A"
+        if row.get("num_analysts"):
+            analysts += f" ({row['num_analysts']})"
+        lines.append(f"| {row['ticker']} | {price} | {fair} | {row.get('vs_fair_value') or 'N/A'} | "
+                     f"{iv} | {upside} | {target} | {analysts} | {thesis} |")
+
+    return "\n".join(lines)
+
+
+def write_summary(markdown: str, path: Path = SUMMARY_PATH):
+    """Write the summary table (atomically)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        f.write(markdown + "\n")
+    os.replace(tmp, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh all active watchlist entries")
+    parser.add_argument("--file", default=str(WATCHLIST_PATH),
+                        help="Watchlist file (default: memory/watchlist.md)")
+    parser.add_argument("--summary", default=str(SUMMARY_PATH),
+                        help="Summary table to write (default: memory/watchlist_summary.md)")
+    parser.add_argument("--no-write", action="store_true",
+                        help="Print the summary without writing it")
+    parser.add_argument("--max-workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f"Tickers fetched concurrently (default: {DEFAULT_MAX_WORKERS})")
+    parser.add_argument("--output", choices=["json", "markdown"], default="markdown",
+                        help="Output format")
+
+    add_cache_arguments(parser)
+
+    args = parser.parse_args()
+    apply_cache_arguments(args)
+
+    rows = refresh_watchlist(Path(args.file), args.max_workers)
+    markdown = format_watchlist_markdown(rows)
+
+    if not args.no_write:
+        write_summary(markdown, Path(args.summary))
+        print(f"Summary written to: {args.summary}", file=sys.stderr)
+
+    if args.output == "json":
+        print(json.dumps(rows, indent=2))
+    else:
+        print(markdown)
+
+
+if __name__ == "__main__":
+    main()
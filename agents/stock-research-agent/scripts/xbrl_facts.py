@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+XBRL Fundamentals Store
+Ingests SEC XBRL companyfacts into a local columnar fundamentals store.
+
+Each company's data.sec.gov/api/xbrl/companyfacts/CIK*.json is normalized to
+a fixed set of metrics (revenue, operating income, cash flow, capex, shares,
+debt, cash, ...) with full multi-year annual and quarterly history, and saved
+as one NumPy .npz per company (memory/sources/xbrl/CIK##########.npz): a row
+per period, a float column per metric. Discrete quarters that filers only
+report year-to-date (cash flow, fourth quarters) are derived by differencing.
+
+dcf_model.py and compare_stocks.py read from this store when a company has
+been ingested and fall back to Yahoo otherwise.
+
+Usage:
+    python xbrl_facts.py ingest TICKER [TICKER ...]
+    python xbrl_facts.py bulk companyfacts.zip [--tickers T1 T2]
+    python xbrl_facts.py show TICKER [--quarterly]
+
+Examples:
+    python xbrl_facts.py ingest GOLF AAPL MSFT
+    python xbrl_facts.py bulk ~/Downloads/companyfacts.zip    # SEC nightly bulk file
+    python xbrl_facts.py show GOLF --quarterly
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import zipfile
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from response_cache import SOURCES_DIR
+from ticker_snapshot import DEFAULT_MAX_WORKERS, map_tickers
+
+XBRL_DIR = Path(os.environ.get("STOCK_RESEARCH_XBRL_DIR", SOURCES_DIR / "xbrl"))
+COMPANYFACTS_URL = "https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json"
+
+# metric -> (period type, XBRL concepts in priority order)
+CONCEPTS = {
+    "revenue": ("duration", ["us-gaap:Revenues",
+                             "us-gaap:RevenueFromContractWithCustomerExcludingAssessedTax",
+                             "us-gaap:RevenueFromContractWithCustomerIncludingAssessedTax",
+                             "us-gaap:SalesRevenueNet"]),
+    "gross_profit": ("duration", ["us-gaap:GrossProfit"]),
+    "operating_income": ("duration", ["us-gaap:OperatingIncomeLoss"]),
+    "net_income": ("duration", ["us-gaap:NetIncomeLoss", "us-gaap:ProfitLoss"]),
+    "operating_cash_flow": ("duration", ["us-gaap:NetCashProvidedByUsedInOperatingActivities"]),
+    "capex": ("duration", ["us-gaap:PaymentsToAcquirePropertyPlantAndEquipment"]),
+    "diluted_shares": ("duration", ["us-gaap:WeightedAverageNumberOfDilutedSharesOutstanding"]),
+    "shares_outstanding": ("instant", ["dei:EntityCommonStockSharesOutstanding",
+                                       "us-gaap:CommonStockSharesOutstanding"]),
+    "cash": ("instant", ["us-gaap:CashAndCashEquivalentsAtCarryingValue",
+                         "us-gaap:CashCashEquivalentsRestrictedCashAndRestrictedCashEquivalents"]),
+    "long_term_debt": ("instant", ["us-gaap:LongTermDebtNoncurrent", "us-gaap:LongTermDebt"]),
+    "current_debt": ("instant", ["us-gaap:LongTermDebtCurrent", "us-gaap:DebtCurrent",
+                                 "us-gaap:ShortTermBorrowings"]),
+    "total_assets": ("instant", ["us-gaap:Assets"]),
+    "current_assets": ("instant", ["us-gaap:AssetsCurrent"]),
+    "current_liabilities": ("instant", ["us-gaap:LiabilitiesCurrent"]),
+    "equity": ("instant", ["us-gaap:StockholdersEquity"]),
+}
+UNITS = ("USD", "shares")
+
+# Period lengths in days
+QUARTER_DAYS = (80, 100)
+ANNUAL_DAYS = (350, 380)
+PERIOD_TOLERANCE = 15  # days of slack when matching consecutive/prior-year periods
+
+
+def _parse_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+def _is_quarter(start: date, end: date) -> bool:
+    return QUARTER_DAYS[0] <= (end - start).days + 1 <= QUARTER_DAYS[1]
+
+
+def _is_annual(start: date, end: date) -> bool:
+    return ANNUAL_DAYS[0] <= (end - start).days + 1 <= ANNUAL_DAYS[1]
+
+
+def _concept_facts(facts: dict, concept: str) -> List[dict]:
+    taxonomy, name = concept.split(":")
+    units = facts.get(taxonomy, {}).get(name, {}).get("units", {})
+    for unit in UNITS:
+        if unit in units:
+            return units[unit]
+    return []
+
+
+def _metric_values(facts: dict, concepts: List[str], kind: str) -> Dict[tuple, float]:
+    """
+    {(start, end): value} for one metric, merged across fallback concepts.
+
+    The first concept reporting a period wins; within a concept the latest
+    filing wins (restated comparatives replace the original).
+    """
+    merged = {}
+    for concept in concepts:
+        latest = {}
+        for fact in _concept_facts(facts, concept):
+            try:
+                end = _parse_date(fact["end"])
+                start = _parse_date(fact["start"]) if kind == "duration" else None
+                value = float(fact["val"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            key = (start, end)
+            filed = fact.get("filed", "")
+            if key not in latest or filed >= latest[key][1]:
+                latest[key] = (value, filed)
+        for key, (value, _) in latest.items():
+            merged.setdefault(key, value)
+    return merged
+
+
+def _derive_quarters(values: Dict[tuple, float]) -> Dict[tuple, float]:
+    """
+    Fill discrete quarters reported only year-to-date.
+
+    Durations sharing a start date are cumulative (Q1, H1, 9M, FY), so
+    consecutive differences are the discrete periods between them.
+    """
+    by_start = defaultdict(list)
+    for (start, end), value in values.items():
+        by_start[start].append((end, value))
+
+    derived = {}
+    for start, items in by_start.items():
+        items.sort()
+        for (prev_end, prev_value), (end, value) in zip(items, items[1:]):
+            q_start = prev_end + timedelta(days=1)
+            key = (q_start, end)
+            if key not in values and _is_quarter(q_start, end):
+                derived[key] = value - prev_value
+
+    # Fourth quarters of filers that report discrete Q1-Q3 and the full year
+    quarters = [k for k in list(values) + list(derived) if _is_quarter(*k)]
+    for (start, end), value in values.items():
+        if not _is_annual(start, end):
+            continue
+        inside = [q for q in quarters if q[0] >= start and q[1] <= end]
+        if len(inside) != 3 or any((end - q[1]).days <= PERIOD_TOLERANCE for q in inside):
+            continue
+        q_start = max(q[1] for q in inside) + timedelta(days=1)
+        if _is_quarter(q_start, end):
+            quarter_values = [values.get(q, derived.get(q)) for q in inside]
+            derived[(q_start, end)] = value - sum(quarter_values)
+    return derived
+
+
+@dataclass
+class FundamentalsTable:
+    """Columnar fundamentals for one company: a row per period, a column per metric."""
+    cik: str
+    name: str
+    period_start: "np.ndarray"  # datetime64[D], NaT for balance-sheet instants
+    period_end: "np.ndarray"    # datetime64[D]
+    columns: Dict[str, "np.ndarray"] = field(default_factory=dict)
+    ingested_at: float = 0.0
+
+    def _mask(self, freq: str) -> "np.ndarray":
+        instant = np.isnat(self.period_start)
+        if freq == "instant":
+            return instant
+        days = np.where(instant, 0, (self.period_end - self.period_start).astype("timedelta64[D]").astype(np.int64) + 1)
+        low, high = ANNUAL_DAYS if freq == "annual" else QUARTER_DAYS
+        return ~instant & (days >= low) & (days <= high)
+
+    def series(self, metric: str, freq: str = None) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """(period_start, period_end, values) for a metric, oldest first, NaNs dropped."""
+        if freq is None:
+            freq = "instant" if CONCEPTS[metric][0] == "instant" else "annual"
+        values = self.columns.get(metric)
+        if values is None:
+            empty = np.array([], dtype="datetime64[D]")
+            return empty, empty, np.array([])
+        mask = self._mask(freq) & ~np.isnan(values)
+        return self.period_start[mask], self.period_end[mask], values[mask]
+
+    def latest(self, metric: str, freq: str = None) -> Optional[float]:
+        """Most recent value of a metric (latest fiscal year for flows)."""
+        _, _, values = self.series(metric, freq)
+        return float(values[-1]) if len(values) else None
+
+    def ttm(self, metric: str) -> Optional[float]:
+        """Trailing twelve months: last four contiguous quarters, else the latest fiscal year."""
+        starts, ends, values = self.series(metric, "quarterly")
+        _, annual_ends, annual_values = self.series(metric, "annual")
+        if len(values) >= 4:
+            gaps = (starts[-3:] - ends[-4:-1]).astype("timedelta64[D]").astype(np.int64)
+            recent = not len(annual_ends) or ends[-1] >= annual_ends[-1]
+            if recent and np.all(np.abs(gaps - 1) <= PERIOD_TOLERANCE):
+                return float(values[-4:].sum())
+        return float(annual_values[-1]) if len(annual_values) else None
+
+    def yoy_growth(self, metric: str) -> Optional[float]:
+        """Latest quarter vs the same quarter a year earlier, else fiscal-year growth."""
+        for freq in ("quarterly", "annual"):
+            _, ends, values = self.series(metric, freq)
+            if len(values) < 2:
+                continue
+            target = ends[-1] - np.timedelta64(365, "D")
+            diffs = np.abs((ends[:-1] - target).astype("timedelta64[D]").astype(np.int64))
+            i = int(np.argmin(diffs))
+            if diffs[i] <= PERIOD_TOLERANCE and values[i] > 0:
+                return float(values[-1] / values[i] - 1)
+        return None
+
+    def free_cash_flow(self) -> Optional[float]:
+        """TTM operating cash flow minus capital expenditure (None unless both are reported)."""
+        ocf = self.ttm("operating_cash_flow")
+        capex = self.ttm("capex")
+        if ocf is None or capex is None:
+            return None
+        return ocf - capex
+
+    def total_debt(self) -> Optional[float]:
+        long_term = self.latest("long_term_debt")
+        current = self.latest("current_debt")
+        if long_term is None and current is None:
+            return None
+        return (long_term or 0.0) + (current or 0.0)
+
+
+def comparison_metrics(table: FundamentalsTable) -> dict:
+    """
+    Store-derived values for compare_stocks metric keys (None where unknown).
+
+    Flows are trailing twelve months; ratios follow Yahoo's conventions
+    (debt_equity in percent).
+    """
+    def ratio(a, b, scale=1.0):
+        return a / b * scale if a is not None and b else None
+
+    revenue = table.ttm("revenue")
+    net_income = table.ttm("net_income")
+    equity = table.latest("equity")
+    return {
+        "revenue": revenue,
+        "revenue_growth": table.yoy_growth("revenue"),
+        "gross_margin": ratio(table.ttm("gross_profit"), revenue),
+        "operating_margin": ratio(table.ttm("operating_income"), revenue),
+        "profit_margin": ratio(net_income, revenue),
+        "net_income": net_income,
+        "fcf": table.free_cash_flow(),
+        "debt_equity": ratio(table.total_debt(), equity, 100.0),
+        "current_ratio": ratio(table.latest("current_assets"), table.latest("current_liabilities")),
+        "roe": ratio(net_income, equity),
+        "roa": ratio(net_income, table.latest("total_assets")),
+        "shares_outstanding": table.latest("shares_outstanding"),
+    }
+
+
+def normalize_companyfacts(data: dict) -> FundamentalsTable:
+    """Turn a companyfacts JSON document into a FundamentalsTable."""
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+
+    facts = data.get("facts", {})
+    per_metric = {}
+    for metric, (kind, concepts) in CONCEPTS.items():
+        values = _metric_values(facts, concepts, kind)
+        if kind == "duration":
+            values.update(_derive_quarters(values))
+            values = {k: v for k, v in values.items() if _is_quarter(*k) or _is_annual(*k)}
+        per_metric[metric] = values
+
+    keys = sorted({k for values in per_metric.values() for k in values},
+                  key=lambda k: (k[1], k[0] or date.min))
+    row = {k: i for i, k in enumerate(keys)}
+    columns = {}
+    for metric, values in per_metric.items():
+        column = np.full(len(keys), np.nan)
+        for key, value in values.items():
+            column[row[key]] = value
+        columns[metric] = column
+
+    return FundamentalsTable(
+        cik=str(data.get("cik", "")).zfill(10),
+        name=data.get("entityName", ""),
+        period_start=np.array([k[0] if k[0] else "NaT" for k in keys], dtype="datetime64[D]"),
+        period_end=np.array([k[1] for k in keys], dtype="datetime64[D]"),
+        columns=columns,
+        ingested_at=time.time(),
+    )
+
+
+def _store_path(cik: str) -> Path:
+    return XBRL_DIR / f"CIK{str(cik).zfill(10)}.npz"
+
+
+def save_fundamentals(table: FundamentalsTable) -> Path:
+    """Write a table to the store atomically."""
+    path = _store_path(table.cik)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp.npz")
+    np.savez_compressed(tmp, cik=np.array(table.cik), name=np.array(table.name),
+                        ingested_at=np.array(table.ingested_at),
+                        period_start=table.period_start, period_end=table.period_end,
+                        **{f"m_{metric}": column for metric, column in table.columns.items()})
+    os.replace(tmp, path)
+    return path
+
+
+def load_fundamentals_cik(cik: str) -> Optional[FundamentalsTable]:
+    """Stored table for a CIK, or None if it hasn't been ingested."""
+    if not NUMPY_AVAILABLE:
+        return None
+    path = _store_path(cik)
+    if not path.exists():
+        return None
+    with np.load(path, allow_pickle=False) as stored:
+        return FundamentalsTable(
+            cik=str(stored["cik"]),
+            name=str(stored["name"]),
+            period_start=stored["period_start"],
+            period_end=stored["period_end"],
+            columns={key[2:]: stored[key] for key in stored.files if key.startswith("m_")},
+            ingested_at=float(stored["ingested_at"]),
+        )
+
+
+def load_fundamentals(ticker: str) -> Optional[FundamentalsTable]:
+    """Stored table for a ticker, or None (no SEC lookups while the store is empty)."""
+    if not NUMPY_AVAILABLE or not XBRL_DIR.exists() or not any(XBRL_DIR.glob("CIK*.npz")):
+        return None
+    from sec_edgar import get_cik_from_ticker
+    cik = get_cik_from_ticker(ticker)
+    return load_fundamentals_cik(cik) if cik else None
+
+
+def ingest_ticker(ticker: str) -> FundamentalsTable:
+    """Download, normalize and store companyfacts for one ticker."""
+    from sec_client import get_sec_client
+    from sec_edgar import get_cik_from_ticker
+
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+    cik = get_cik_from_ticker(ticker)
+    if not cik:
+        raise ValueError(f"Could not find CIK for {ticker}")
+    table = normalize_companyfacts(get_sec_client().get_json(COMPANYFACTS_URL.format(cik=cik), timeout=60))
+    save_fundamentals(table)
+    return table
+
+
+def ingest_bulk_zip(path: Path, tickers: List[str] = None) -> int:
+    """
+    Ingest SEC's nightly companyfacts.zip (one CIK##########.json per company).
+
+    Members are read one at a time, so memory stays at one company's facts.
+    With tickers, only those companies are ingested.
+
+    Returns:
+        Number of companies stored
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+
+    wanted = None
+    if tickers:
+        from sec_edgar import get_cik_from_ticker
+        wanted = {f"CIK{cik}.json" for cik in map(get_cik_from_ticker, tickers) if cik}
+
+    stored = 0
+    with zipfile.ZipFile(path) as archive:
+        members = [m for m in archive.namelist() if m.endswith(".json")]
+        if wanted is not None:
+            members = [m for m in members if os.path.basename(m) in wanted]
+        for i, member in enumerate(members, 1):
+            try:
+                with archive.open(member) as f:
+                    table = normalize_companyfacts(json.load(f))
+                if len(table.period_end):
+                    save_fundamentals(table)
+                    stored += 1
+            except Exception as e:
+                print(f"Warning: {member}: {e}", file=sys.stderr)
+            if i % 1000 == 0:
+                print(f"  {i}/{len(members)} companies...", file=sys.stderr)
+    return stored
+
+
+def format_fundamentals_markdown(ticker: str, table: FundamentalsTable, freq: str = "annual",
+                                 periods: int = 8) -> str:
+    """Recent periods of the main metrics as markdown (values in millions)."""
+    lines = []
+    lines.append(f"# Fundamentals: {table.name} ({ticker})")
+    lines.append(f"\n**Source:** SEC XBRL companyfacts (CIK {table.cik})")
+    lines.append("")
+
+    metrics = [m for m, (kind, _) in CONCEPTS.items() if kind == "duration"]
+    mask = table._mask(freq)
+    rows = np.flatnonzero(mask & np.any([~np.isnan(table.columns[m]) for m in metrics], axis=0))[-periods:]
+    if not len(rows):
+        lines.append("No data.")
+        return "\n".join(lines)
+
+    lines.append("| Metric | " + " | ".join(str(table.period_end[i]) for i in rows) + " |")
+    lines.append("|--------|" + "|".join("------" for _ in rows) + "|")
+    for metric in metrics:
+        cells = ["N/A" if np.isnan(table.columns[metric][i]) else f"{table.columns[metric][i] / 1e6:,.1f}"
+                 for i in rows]
+        lines.append(f"| {metric} | " + " | ".join(cells) + " |")
+
+    lines.append("")
+    lines.append("| Latest | Value |")
+    lines.append("|--------|-------|")
+    for label, value in [("FCF (TTM)", table.free_cash_flow()),
+                         ("Shares outstanding", table.latest("shares_outstanding")),
+                         ("Total debt", table.total_debt()),
+                         ("Cash", table.latest("cash"))]:
+        lines.append(f"| {label} | {'N/A' if value is None else f'{value / 1e6:,.1f}M'} |")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SEC XBRL fundamentals store")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Fetch companyfacts for tickers")
+    ingest.add_argument("tickers", nargs="+", help="Stock ticker symbols")
+    ingest.add_argument("--max-workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f"Tickers fetched concurrently (default: {DEFAULT_MAX_WORKERS})")
+
+    bulk = sub.add_parser("bulk", help="Ingest SEC's nightly companyfacts.zip")
+    bulk.add_argument("path", type=Path, help="Path to companyfacts.zip")
+    bulk.add_argument("--tickers", nargs="+", help="Only ingest these tickers")
+
+    show = sub.add_parser("show", help="Show stored fundamentals")
+    show.add_argument("ticker", help="Stock ticker symbol")
+    show.add_argument("--quarterly", action="store_true", help="Show quarters instead of fiscal years")
+    show.add_argument("--periods", type=int, default=8, help="Number of periods (default: 8)")
+
+    args = parser.parse_args()
+
+    if args.command == "ingest":
+        for ticker, table, error in map_tickers(ingest_ticker, [t.upper() for t in args.tickers],
+                                                args.max_workers):
+            if error is not None:
+                print(f"{ticker}: error: {error}")
+            else:
+                print(f"{ticker}: {len(table.period_end)} periods stored")
+    elif args.command == "bulk":
+        count = ingest_bulk_zip(args.path, args.tickers)
+        print(f"Stored {count} companies in {XBRL_DIR}")
+    else:
+        table = load_fundamentals(args.ticker)
+        if table is None:
+            print(f"Error: {args.ticker} not in store. Run: python xbrl_facts.py ingest {args.ticker}",
+                  file=sys.stderr)
+            sys.exit(1)
+        print(format_fundamentals_markdown(args.ticker.upper(), table,
+                                           "quarterly" if args.quarterly else "annual", args.periods))
+
+
+if __name__ == "__main__":
+    main()
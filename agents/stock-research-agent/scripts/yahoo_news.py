@@ -3,41 +3,54 @@
 Yahoo Finance News Scraper
 Fetches recent news for a given stock ticker.
 
+News is categorized (earnings, analyst, product, market) by a keyword
+matcher compiled once from NEWS_KEYWORDS and their inflected forms (whole
+words only); a batch of headlines is labelled in one pass and an item can
+carry several labels. Each item also gets a lexicon sentiment score (news_sentiment.py),
+summarized per ticker.
+
+With --new-only, items already returned by an earlier --new-only poll (for
+this ticker, or the same headline under another ticker) are skipped.
+
 Usage:
-    python yahoo_news.py TICKER [--limit 10]
+    python yahoo_news.py TICKER [--limit 10] [--new-only]
 
 Examples:
     python yahoo_news.py GOLF
     python yahoo_news.py AAPL --limit 20
+    python yahoo_news.py GOLF --new-only
 """
 
 import argparse
 import json
+import string
 import sys
+import threading
 from datetime import datetime
+from typing import Iterator, List, Optional
 
-try:
-    import yfinance as yf
-except ImportError:
-    print("Error: yfinance not installed. Run: pip install yfinance")
-    sys.exit(1)
+from news_sentiment import aggregate_sentiment, score_news
+from response_cache import add_cache_arguments, apply_cache_arguments
+from ticker_snapshot import get_snapshot
 
 
-def get_stock_news(ticker: str, limit: int = 10) -> list:
+def get_stock_news(ticker: str, limit: int = 10, new_only: bool = False) -> list:
     """
     Fetch recent news for a stock ticker.
 
     Args:
         ticker: Stock ticker symbol
         limit: Maximum number of news items
+        new_only: Only items not returned by an earlier new_only poll, for
+            this ticker or (same headline) any other (see news_store.py)
 
     Returns:
         List of news dictionaries
     """
-    stock = yf.Ticker(ticker)
+    snap = get_snapshot(ticker)
 
     try:
-        news = stock.news
+        news = snap.news
     except Exception as e:
         print(f"Error fetching news: {e}", file=sys.stderr)
         return []
@@ -46,7 +59,7 @@ def get_stock_news(ticker: str, limit: int = 10) -> list:
         return []
 
     results = []
-    for item in news[:limit]:
+    for item in (news if new_only else news[:limit]):
         # Extract relevant fields
         news_item = {
             "title": item.get("title", "No title"),
@@ -54,7 +67,9 @@ def get_stock_news(ticker: str, limit: int = 10) -> list:
             "link": item.get("link", ""),
             "published": "",
             "type": item.get("type", "article"),
-            "thumbnail": ""
+            "thumbnail": "",
+            "uuid": item.get("uuid", ""),
+            "publish_time": item.get("providerPublishTime")
         }
 
         # Parse timestamp
@@ -75,7 +90,11 @@ def get_stock_news(ticker: str, limit: int = 10) -> list:
 
         results.append(news_item)
 
-    return results
+    if new_only:
+        from news_store import get_news_store
+        results = get_news_store().filter_new(ticker, results, limit)
+
+    return score_news(label_news(results))
 
 
 def get_stock_calendar(ticker: str) -> dict:
@@ -88,7 +107,7 @@ def get_stock_calendar(ticker: str) -> dict:
     Returns:
         Dictionary with calendar events
     """
-    stock = yf.Ticker(ticker)
+    snap = get_snapshot(ticker)
 
     calendar = {
         "earnings_date": None,
@@ -97,7 +116,7 @@ def get_stock_calendar(ticker: str) -> dict:
     }
 
     try:
-        info = stock.info
+        info = snap.info
 
         # Earnings date
         earnings = info.get("earningsTimestamp")
@@ -129,6 +148,146 @@ def get_stock_calendar(ticker: str) -> dict:
     return calendar
 
 
+# Category keywords, in priority order: an item is filed under the first
+# category it matches and labelled with every category it matches
+NEWS_KEYWORDS = {
+    "earnings": ["earnings", "quarter", "revenue", "profit", "eps", "guidance", "beat", "miss"],
+    "analyst": ["analyst", "upgrade", "downgrade", "rating", "price target", "buy", "sell", "hold"],
+    "product": ["launch", "product", "release", "announce", "new", "innovation"],
+    "market": ["market", "stock", "shares", "trading", "investor", "rally", "drop", "surge"]
+}
+
+# Inflected forms that also count for a keyword, matched as whole words like
+# the keywords themselves ("new" does not fire on "news", nor "hold" on
+# "Holdings")
+KEYWORD_FORMS = {
+    "quarter": ["quarters", "quarterly"],
+    "revenue": ["revenues"],
+    "profit": ["profits", "profitable", "profitability"],
+    "beat": ["beats", "beating"],
+    "miss": ["misses", "missed"],
+    "analyst": ["analysts"],
+    "upgrade": ["upgrades", "upgraded"],
+    "downgrade": ["downgrades", "downgraded"],
+    "rating": ["ratings"],
+    "price target": ["price targets"],
+    "buy": ["buys", "buying"],
+    "sell": ["sells", "selling", "sold"],
+    "hold": ["holds"],
+    "launch": ["launches", "launched", "launching"],
+    "product": ["products"],
+    "release": ["releases", "released"],
+    "announce": ["announces", "announced", "announcing", "announcement", "announcements"],
+    "innovation": ["innovations"],
+    "market": ["markets"],
+    "stock": ["stocks"],
+    "investor": ["investors"],
+    "rally": ["rallies", "rallied", "rallying"],
+    "drop": ["drops", "dropped", "dropping"],
+    "surge": ["surges", "surged", "surging"],
+}
+
+# Punctuation splits words ("price-target", "earnings:", "Acushnet’s")
+WORD_SEPARATORS = str.maketrans({c: " " for c in string.punctuation + "“”‘’–—…"})
+
+
+class NewsCategorizer:
+    """
+    Multi-label headline categorizer compiled once from a keyword table.
+
+    Keywords and their KEYWORD_FORMS match whole words only, so "eps" does
+    not fire on "steps" or "miss" on "mission". Every form is a key of one
+    word table (word -> category bitmask); a headline's matches are the
+    intersection of its words with that table, computed in C, so the Python
+    work per headline is one set operation plus a step per matched word.
+    """
+
+    def __init__(self, keywords: dict = NEWS_KEYWORDS, forms: dict = KEYWORD_FORMS):
+        self.categories = list(keywords)
+        self._masks = {}    # word -> category bitmask
+        self._phrases = {}  # first word -> [(following words, bitmask)]
+        for bit, kws in enumerate(keywords.values()):
+            for kw in kws:
+                for form in [kw] + forms.get(kw, []):
+                    words = form.lower().split()
+                    if len(words) == 1:
+                        self._masks[words[0]] = self._masks.get(words[0], 0) | 1 << bit
+                    else:
+                        self._phrases.setdefault(words[0], []).append((words[1:], 1 << bit))
+        self._vocabulary = frozenset(self._masks) | frozenset(self._phrases)
+        masks = range(1 << len(self.categories))
+        self._label_lists = [[c for bit, c in enumerate(self.categories) if mask >> bit & 1]
+                             for mask in masks]
+        self._primary = [labels[0] if labels else None for labels in self._label_lists]
+
+    def _batch_masks(self, titles: List[str]) -> Iterator[int]:
+        """
+        Category bitmask of each title.
+
+        A generator, so each title's words are dropped as soon as it is
+        matched; holding a word list per title for the whole batch costs
+        more in garbage collection than the matching itself.
+        """
+        # Lowercase and split punctuation for the whole batch at once
+        lines = "\n".join(t or "" for t in titles).lower().translate(WORD_SEPARATORS).split("\n")
+        if len(lines) != len(titles):  # a title contained a newline
+            lines = [(t or "").replace("\n", " ").lower().translate(WORD_SEPARATORS) for t in titles]
+
+        matches = self._vocabulary.intersection
+        masks = self._masks
+        phrases = self._phrases
+        for line in lines:
+            words = line.split()
+            mask = 0
+            for word in matches(words):
+                mask |= masks.get(word, 0)
+                for rest, bits in phrases.get(word, ()):
+                    n = len(rest)
+                    if any(words[i + 1:i + 1 + n] == rest for i, w in enumerate(words) if w == word):
+                        mask |= bits
+            yield mask
+
+    def labels_batch(self, titles: List[str]) -> List[List[str]]:
+        """
+        Categories matched by each title, in one pass over the batch.
+
+        Returns:
+            One list of categories per title (priority order, empty if none)
+        """
+        label_lists = self._label_lists
+        return [list(label_lists[mask]) for mask in self._batch_masks(titles)]
+
+    def primary_batch(self, titles: List[str]) -> List[Optional[str]]:
+        """First (highest-priority) category matched by each title, or None."""
+        primary = self._primary
+        return [primary[mask] for mask in self._batch_masks(titles)]
+
+    def labels(self, title: str) -> List[str]:
+        """Categories matched by one title."""
+        return self.labels_batch([title])[0]
+
+
+_categorizer = None
+_categorizer_lock = threading.Lock()
+
+
+def get_categorizer() -> NewsCategorizer:
+    """Return the process-wide news categorizer."""
+    global _categorizer
+    with _categorizer_lock:
+        if _categorizer is None:
+            _categorizer = NewsCategorizer()
+        return _categorizer
+
+
+def label_news(news: list) -> list:
+    """Set each item's "categories" to every category its title matches."""
+    labels = get_categorizer().labels_batch([item.get("title", "") for item in news])
+    for item, item_labels in zip(news, labels):
+        item["categories"] = item_labels
+    return news
+
+
 def categorize_news(news: list) -> dict:
     """
     Categorize news by type/sentiment.
@@ -137,40 +296,20 @@ def categorize_news(news: list) -> dict:
         news: List of news items
 
     Returns:
-        Dictionary with categorized news
+        Dictionary with categorized news (each item under its first category)
     """
-    categories = {
-        "earnings": [],
-        "analyst": [],
-        "product": [],
-        "market": [],
-        "other": []
-    }
-
-    keywords = {
-        "earnings": ["earnings", "quarter", "revenue", "profit", "eps", "guidance", "beat", "miss"],
-        "analyst": ["analyst", "upgrade", "downgrade", "rating", "price target", "buy", "sell", "hold"],
-        "product": ["launch", "product", "release", "announce", "new", "innovation"],
-        "market": ["market", "stock", "shares", "trading", "investor", "rally", "drop", "surge"]
-    }
-
-    for item in news:
-        title_lower = item.get("title", "").lower()
-        categorized = False
+    categories = {category: [] for category in NEWS_KEYWORDS}
+    categories["other"] = []
 
-        for category, kws in keywords.items():
-            if any(kw in title_lower for kw in kws):
-                categories[category].append(item)
-                categorized = True
-                break
-
-        if not categorized:
-            categories["other"].append(item)
+    primary = get_categorizer().primary_batch([item.get("title", "") for item in news])
+    for item, category in zip(news, primary):
+        categories[category or "other"].append(item)
 
     return categories
 
 
-def format_news_markdown(ticker: str, news: list, calendar: dict = None) -> str:
+def format_news_markdown(ticker: str, news: list, calendar: dict = None,
+                         new_only: bool = False) -> str:
     """Format news as markdown."""
     lines = []
     lines.append(f"# News: {ticker}")
@@ -193,9 +332,18 @@ def format_news_markdown(ticker: str, news: list, calendar: dict = None) -> str:
     # News items
     if not news:
         lines.append("## Recent News")
-        lines.append("No recent news found.")
+        lines.append("No new news since the last poll." if new_only else "No recent news found.")
         return "\n".join(lines)
 
+    # Sentiment
+    sentiment = aggregate_sentiment(news)
+    if sentiment["items"]:
+        lines.append("## Sentiment")
+        lines.append(f"**{sentiment['mean']:+.2f} ({sentiment['label']})** - "
+                     f"{sentiment['positive']} positive, {sentiment['negative']} negative, "
+                     f"{sentiment['neutral']} neutral")
+        lines.append("")
+
     # Categorize
     categorized = categorize_news(news)
 
@@ -214,7 +362,10 @@ def format_news_markdown(ticker: str, news: list, calendar: dict = None) -> str:
             link = item.get("link", "")
 
             lines.append(f"### {title}")
-            lines.append(f"*{publisher} - {published}*")
+            if item.get("sentiment") is not None:
+                lines.append(f"*{publisher} - {published} - sentiment {item['sentiment']:+.2f}*")
+            else:
+                lines.append(f"*{publisher} - {published}*")
             if link:
                 lines.append(f"[Read more]({link})")
             lines.append("")
@@ -229,15 +380,20 @@ def main():
                         help="Maximum number of news items (default: 10)")
     parser.add_argument("--calendar", action="store_true",
                         help="Include calendar events")
+    parser.add_argument("--new-only", action="store_true",
+                        help="Only news not seen in an earlier --new-only poll (any ticker)")
     parser.add_argument("--output", choices=["json", "markdown"], default="markdown",
                         help="Output format")
 
+    add_cache_arguments(parser)
+
     args = parser.parse_args()
+    apply_cache_arguments(args)
 
     ticker = args.ticker.upper()
 
     print(f"Fetching news for {ticker}...", file=sys.stderr)
-    news = get_stock_news(ticker, args.limit)
+    news = get_stock_news(ticker, args.limit, args.new_only)
 
     calendar = None
     if args.calendar:
@@ -248,11 +404,12 @@ def main():
         output = {
             "ticker": ticker,
             "news": news,
+            "sentiment": aggregate_sentiment(news),
             "calendar": calendar
         }
         print(json.dumps(output, indent=2))
     else:
-        print(format_news_markdown(ticker, news, calendar))
+        print(format_news_markdown(ticker, news, calendar, args.new_only))
 
 
 if __name__ == "__main__":